@@ -0,0 +1,51 @@
+"""Time to load and diff two `run_results.json` files.
+
+    python benchmarks/bench_diff.py [nodes]
+"""
+import os
+import sys
+import json
+import time
+import random
+import tempfile
+
+from pydbt.commands.diff import load_nodes, diff_nodes, format_table
+
+STATUSES = ("success", "success", "success", "error", "skipped")
+
+
+def write_results(path: str, nodes: int, seed: int):
+    rng = random.Random(seed)
+    results = [
+        {
+            "unique_id": f"model.analytics.model_{idx}",
+            "status": rng.choice(STATUSES),
+            "execution_time": rng.uniform(0.1, 60),
+            "adapter_response": {"rows_affected": rng.randint(0, 100000)},
+        }
+        for idx in range(nodes)
+    ]
+    with open(path, "w") as f:
+        json.dump({"results": results}, f)
+
+
+def main(nodes: int = 50000):
+    with tempfile.TemporaryDirectory() as tmp:
+        before, after = os.path.join(tmp, "before.json"), os.path.join(tmp, "after.json")
+        write_results(before, nodes, seed=1)
+        write_results(after, nodes, seed=2)
+
+        start = time.perf_counter()
+        loaded = load_nodes(before), load_nodes(after)
+        loading = time.perf_counter() - start
+
+        start = time.perf_counter()
+        diff = diff_nodes(*loaded)
+        format_table(diff)
+        diffing = time.perf_counter() - start
+
+    print(f"{nodes:,} nodes: load {loading:.3f}s, diff {diffing:.3f}s, {len(diff.changes):,} changes")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,51 @@
+"""Throughput of the JSON lines sink against logbook's default stderr handler.
+
+Both write to /dev/null so only formatting, serialization and buffering are measured.
+
+    python benchmarks/bench_logging.py [records]
+"""
+import os
+import sys
+import time
+import logbook
+
+from pydbt.logger import JsonHandler, AppendTags
+
+CONTEXT = {
+    "database": "warehouse",
+    "schema": "core",
+    "name": "dbx_booking",
+    "resource_type": "model",
+    "package_name": "transformations",
+    "tags": "daily, sunrise, morning",
+    "materialized": "incremental",
+}
+
+
+def bench(name: str, handler: logbook.Handler, records: int):
+    log = logbook.Logger("bench")
+    with handler.applicationbound():
+        start = time.perf_counter()
+        for idx in range(records):
+            with AppendTags({**CONTEXT, "idx": idx}):
+                log.info("*[SUCCESS]* model `WAREHOUSE.CORE.DBX_BOOKING`", trace=None, context=CONTEXT)
+        if isinstance(handler, JsonHandler):
+            handler.close()
+        elapsed = time.perf_counter() - start
+
+    print(f"{name:>16}: {records / elapsed:>10,.0f} records/s")
+
+
+def main(records: int = 50000):
+    stderr = sys.stderr
+    with open(os.devnull, "w") as devnull:
+        sys.stderr = devnull
+        bench("logbook stderr", logbook.StderrHandler(), records)
+        sys.stderr = stderr
+
+    bench("json", JsonHandler(path=os.devnull), records)
+    bench("json background", JsonHandler(path=os.devnull, background=True), records)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,84 @@
+"""Peak and retained memory (tracemalloc) of the reporting loop for large runs.
+
+Compares iterating over `res.results` while the execution result keeps every node
+alive, against the streaming pipeline which releases each result once reported. The
+lazy variant feeds the pipeline from a generator, showing its own footprint is bounded
+by a single result no matter the size of the run.
+
+    python benchmarks/bench_memory.py [results ...]
+"""
+import os
+import sys
+import json
+import time
+import tracemalloc
+import typing as T
+from dbt.contracts.results import RunExecutionResult, RunResult
+
+from pydbt.parsers.formatter import Formatter
+from pydbt.parsers.stream import iter_results, iter_messages
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "..", "tests", "fixtures", "model_result.json")
+COMPILED_SQL_SIZE = 8 * 1024
+
+
+def make_results(count: int) -> T.Iterator[RunResult]:
+    with open(FIXTURE) as f:
+        template = json.load(f)
+
+    for idx in range(count):
+        obj = json.loads(json.dumps(template))
+        node = obj["node"]
+        node["unique_id"] = f"model.transformations.model_{idx}"
+        node["name"] = f"model_{idx}"
+        node["compiled_sql"] = f"select {idx} as id -- " + "x" * COMPILED_SQL_SIZE
+        yield RunResult.from_dict(obj)
+
+
+def report_materialized(count: int):
+    res = RunExecutionResult(results=list(make_results(count)), elapsed_time=0.0)
+    for result in res.results:
+        Formatter.format(result)
+    return res
+
+
+def report_streaming(count: int):
+    res = RunExecutionResult(results=list(make_results(count)), elapsed_time=0.0)
+    for _ in iter_messages(iter_results(res)):
+        pass
+    return res
+
+
+def report_streaming_lazy(count: int):
+    for _ in iter_messages(make_results(count)):
+        pass
+
+
+def measure(name: str, count: int, report):
+    tracemalloc.start()
+    start = time.perf_counter()
+    res = report(count)
+    elapsed = time.perf_counter() - start
+
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del res
+    print(
+        f"{name:>15} {count:>6} results: {elapsed:6.2f}s, "
+        f"peak {peak / 2 ** 20:7.1f} MiB, held after reporting {retained / 2 ** 20:7.1f} MiB"
+    )
+
+
+def main(counts):
+    variants = (
+        ("materialized", report_materialized),
+        ("streaming", report_streaming),
+        ("streaming lazy", report_streaming_lazy),
+    )
+    for count in counts:
+        for name, report in variants:
+            measure(name, count, report)
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [10000, 50000])
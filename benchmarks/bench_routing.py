@@ -0,0 +1,76 @@
+"""Alert routing throughput: compiled route index vs. a linear scan over all routes.
+
+    python benchmarks/bench_routing.py [routes] [messages]
+"""
+import sys
+import time
+import random
+import logbook
+
+from pydbt.types import Message
+from pydbt.handlers.alerting.router import Route, RouteIndex
+
+PACKAGES = [f"package_{i}" for i in range(50)]
+TAGS = [f"tag_{i}" for i in range(100)]
+OWNERS = [f"team_{i}" for i in range(30)]
+RESOURCE_TYPES = ["model", "test", "source", "snapshot", "seed"]
+LEVELS = [logbook.INFO, logbook.WARNING, logbook.ERROR, logbook.CRITICAL]
+
+
+def make_routes(count: int, rng: random.Random):
+    routes = []
+    for idx in range(count):
+        match = {rng.choice(["package_name", "owner"]): rng.choice(PACKAGES + OWNERS)}
+        if rng.random() < 0.5:
+            match["tags"] = rng.sample(TAGS, 3)
+        if rng.random() < 0.3:
+            match["resource_type"] = rng.choice(RESOURCE_TYPES)
+        routes.append(Route.from_dict({
+            "match": match,
+            "level": rng.choice(["info", "warning", "error"]),
+            "destination": f"destination_{idx % 20}",
+        }))
+    return routes
+
+
+def make_messages(count: int, rng: random.Random):
+    return [
+        Message(
+            level=rng.choice(LEVELS),
+            title="",
+            error=None,
+            message="",
+            reporting=None,
+            context={
+                "package_name": rng.choice(PACKAGES),
+                "owner": rng.choice(OWNERS),
+                "resource_type": rng.choice(RESOURCE_TYPES),
+                "tags": ", ".join(rng.sample(TAGS, 4)),
+            },
+        )
+        for _ in range(count)
+    ]
+
+
+def bench(name: str, fn, messages):
+    start = time.perf_counter()
+    matched = sum(len(fn(msg)) for msg in messages)
+    elapsed = time.perf_counter() - start
+    print(f"{name:>8}: {len(messages) / elapsed:>12,.0f} msg/s ({matched} route matches)")
+
+
+def main(route_count: int = 500, message_count: int = 10000):
+    rng = random.Random(42)
+    routes = make_routes(route_count, rng)
+    messages = make_messages(message_count, rng)
+
+    start = time.perf_counter()
+    index = RouteIndex(routes)
+    print(f"compiled {route_count} routes in {(time.perf_counter() - start) * 1000:.1f}ms")
+
+    bench("index", index.match, messages)
+    bench("linear", lambda msg: [route for route in routes if route.matches(msg)], messages)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,71 @@
+"""Events/second through `SentryHandler` for a run with many failing nodes.
+
+Failing nodes share a limited number of compiled files, as they do when many tests
+fail on the same models. The legacy variant reads context through `linecache` and
+mutates the global scope tags for every record.
+
+    python benchmarks/bench_sentry.py [failures] [files]
+"""
+import os
+import sys
+import time
+import logbook
+import tempfile
+import sentry_sdk
+from sentry_sdk.hub import Hub
+from sentry_sdk.utils import get_lines_from_file
+
+from pydbt import logger
+
+
+def legacy_file_context(path):
+    pre_context, _, post_context = get_lines_from_file(path, 1)
+    return pre_context, post_context
+
+
+class LegacyAppendTags(logger.AppendTags):
+    def __init__(self, tags):
+        logger.set_sentry_tags(tags)
+        super().__init__(tags)
+
+
+def make_files(count: int, directory: str):
+    paths = []
+    for idx in range(count):
+        path = os.path.join(directory, f"model_{idx}.sql")
+        with open(path, "w") as f:
+            f.write(f"select {idx} as id\n" + "union all select 1\n" * 5000)
+        paths.append(path)
+    return paths
+
+
+def bench(name: str, failures: int, paths, append_tags):
+    events = []
+    hub = Hub(sentry_sdk.Client(dsn="https://public@example.com/1", transport=events.append))
+    log = logbook.Logger("bench")
+
+    with hub, logger.SentryHandler(level=logbook.WARNING).applicationbound():
+        start = time.perf_counter()
+        for idx in range(failures):
+            path = paths[idx % len(paths)]
+            with append_tags({"name": f"test_{idx}", "path": path, "resource_type": "test"}):
+                log.error("test failed", trace=f"Got {idx} results, expected 0", context={"abs_path": path})
+        elapsed = time.perf_counter() - start
+
+    print(f"{name:>8}: {failures / elapsed:>10,.0f} events/s ({len(events)} events)")
+
+
+def main(failures: int = 1000, files: int = 200):
+    with tempfile.TemporaryDirectory() as directory:
+        paths = make_files(files, directory)
+
+        get_file_context = logger.get_file_context
+        logger.get_file_context = legacy_file_context
+        bench("legacy", failures, paths, LegacyAppendTags)
+
+        logger.get_file_context = get_file_context
+        bench("current", failures, paths, logger.AppendTags)
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -1,4 +1,8 @@
+import time
 from dbt.version import get_installed_version
 
+# pydbt.main imports dbt and every sink, the time until main() runs is reported as the imports phase
+IMPORT_STARTED = time.perf_counter()
+
 dbt_version = get_installed_version()
 dbt_version = str(dbt_version).replace("=", "")
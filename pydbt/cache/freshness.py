@@ -0,0 +1,122 @@
+import time
+import logbook
+import typing as T
+from datetime import timedelta
+from dbt.contracts.results import SourceFreshnessResult, FreshnessStatus
+from dbt.contracts.graph.unparsed import FreshnessThreshold
+from dbt.graph.selector import NodeSelector
+
+from ..types import Freshness, Message, Reporting
+from ..config import FRESHNESS_CACHE_TTL
+from ..logger import GLOBAL_LOGGER as log
+from ..handlers.hooks.base import BaseHook
+from ..utils.selection import add_selection_filter, remove_selection_filter
+from ..utils.state import load_state, save_state
+from ..utils.tools import freshness_age_to_unit, get_full_db_id
+
+FRESHNESS_COMMANDS = ("freshness", "snapshot-freshness")
+
+
+class FreshnessCache(BaseHook):
+    """Skips freshness queries for sources that cannot have gone stale since the last check.
+
+    A source's age only grows until new data is loaded, so as long as the age implied by the
+    last observed ``max_loaded_at`` is below the tightest threshold the source is guaranteed
+    to pass and the warehouse query can be skipped.
+
+    Cached sources are removed from dbt's own node selection, so only sources the command
+    actually selected are skipped and reported as a cached pass.
+    """
+
+    name = "freshness"
+
+    def __init__(self, ttl: int = FRESHNESS_CACHE_TTL):
+        self.ttl = ttl
+        self.entries: T.Dict[str, T.Dict] = load_state(self.name, {})
+        self.skipped: T.List[T.Dict] = []
+        self._filter = None
+
+    @staticmethod
+    def applies_to(command: T.List[str]) -> bool:
+        return len(command) > 1 and command[0] == "source" and command[1] in FRESHNESS_COMMANDS
+
+    @staticmethod
+    def _threshold_seconds(freshness: FreshnessThreshold) -> T.Optional[float]:
+        thresholds = [
+            timedelta(**{threshold.period.plural(): threshold.count}).total_seconds()
+            for threshold in (freshness.warn_after, freshness.error_after)
+            if threshold
+        ]
+        return min(thresholds) if thresholds else None
+
+    def prepare(self, command: T.List[str]) -> T.List[str]:
+        def skip_cached(selector: NodeSelector, selected: T.Set[str]) -> T.Set[str]:
+            cached = self.cached(selected=selected)
+            self.skipped = list(cached.values())
+            log.info(f"Skipping {len(cached)} source freshness check(s) using cached results.")
+            return selected - set(cached)
+
+        self._filter = skip_cached
+        add_selection_filter(skip_cached)
+        return command
+
+    def record(self, result: SourceFreshnessResult, msg: Message):
+        if not isinstance(result, SourceFreshnessResult):
+            return
+
+        unique_id = result.node.unique_id
+        threshold = self._threshold_seconds(result.node.freshness)
+        if result.status != FreshnessStatus.Pass or threshold is None:
+            self.entries.pop(unique_id, None)
+            return
+
+        self.entries[unique_id] = {
+            "max_loaded_at": result.max_loaded_at.timestamp(),
+            "checked_at": result.snapshotted_at.timestamp(),
+            "threshold_seconds": threshold,
+            "context": msg.context,
+        }
+
+    def cached(self, selected: T.Set[str], now: T.Optional[float] = None) -> T.Dict[str, T.Dict]:
+        now = now or time.time()
+        return {
+            unique_id: entry
+            for unique_id, entry in self.entries.items()
+            if unique_id in selected
+            and now - entry["checked_at"] < self.ttl
+            and now - entry["max_loaded_at"] < entry["threshold_seconds"]
+        }
+
+    @staticmethod
+    def format(entry: T.Dict, now: T.Optional[float] = None) -> Message:
+        now = now or time.time()
+        context = entry["context"]
+        freshness = Freshness(
+            unit=context["unit"],
+            loader=context["loader"],
+            threshold=context["threshold"],
+            age=freshness_age_to_unit(now - entry["max_loaded_at"], context["unit"]),
+        )
+        db_id = get_full_db_id(context["database"], context["schema"], context["name"])
+
+        return Message(
+            title="Source freshness up to date (cached).",
+            message=f"Source `{db_id}` is up to date, cached pass",
+            error=None,
+            reporting=Reporting(
+                rows=None,
+                execution_time=0.0,
+                timing=[],
+                freshness=freshness,
+                cached=True,
+            ),
+            context={**context, "age": freshness.age},
+            level=logbook.INFO,
+        )
+
+    def finalize(self, success: bool) -> T.List[Message]:
+        if self._filter:
+            remove_selection_filter(self._filter)
+
+        save_state(self.name, self.entries)
+        return [self.format(entry) for entry in self.skipped]
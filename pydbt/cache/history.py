@@ -0,0 +1,87 @@
+import os
+import time
+import uuid
+import typing as T
+from dbt.contracts.results import NodeResult
+
+from ..types import Message
+from ..config import RESULTS_HISTORY
+from ..handlers.hooks.base import BaseHook
+from ..utils.state import get_state_path, load_state, save_state
+
+HISTORY_COMMANDS = ("run", "build", "test", "seed", "snapshot")
+# Nodes are stored as [status, execution_time, rows]
+STATUS, EXECUTION_TIME, ROWS = range(3)
+
+
+def load_run(run_id: str) -> T.Optional[T.Dict]:
+    return load_state(f"{RunHistory.name}/{run_id}")
+
+
+def list_runs() -> T.List[str]:
+    """Returns the ids of the stored runs, oldest first."""
+    return load_state(RunHistory.name, [])
+
+
+def execution_times() -> T.Dict[str, float]:
+    """Returns the mean execution time of every node over the stored runs."""
+    totals: T.Dict[str, float] = {}
+    counts: T.Dict[str, int] = {}
+    for run_id in list_runs():
+        for unique_id, node in (load_run(run_id) or {}).get("nodes", {}).items():
+            # skipped nodes did not run, their time says nothing about the node
+            if node[STATUS] == "skipped":
+                continue
+            totals[unique_id] = totals.get(unique_id, 0.0) + node[EXECUTION_TIME]
+            counts[unique_id] = counts.get(unique_id, 0) + 1
+
+    return {unique_id: total / counts[unique_id] for unique_id, total in totals.items()}
+
+
+class RunHistory(BaseHook):
+    """Stores the status, execution time and rows of every node for the last runs.
+
+    Each run is saved as ``<state>/runs/<run_id>.json`` next to an index of the run ids,
+    only the ``RESULTS_HISTORY`` most recent runs are kept.
+    """
+
+    name = "runs"
+
+    def __init__(self, command: T.Optional[T.List[str]] = None, size: int = RESULTS_HISTORY):
+        self.command = command or []
+        self.size = size
+        self.run_id = uuid.uuid4().hex
+        self.started_at = time.time()
+        self.nodes: T.Dict[str, T.List] = {}
+
+    @staticmethod
+    def applies_to(command: T.List[str]) -> bool:
+        return bool(command) and command[0] in HISTORY_COMMANDS
+
+    def prepare(self, command: T.List[str]) -> T.List[str]:
+        self.command = command
+        return command
+
+    def record(self, result: NodeResult, msg: Message):
+        rows = msg.reporting.rows if msg.reporting else None
+        self.nodes[result.node.unique_id] = [str(result.status), result.execution_time or 0.0, rows]
+
+    def finalize(self, success: bool) -> T.List[Message]:
+        if not self.size or not self.nodes:
+            return []
+
+        save_state(f"{self.name}/{self.run_id}", {
+            "run_id": self.run_id,
+            "command": self.command,
+            "started_at": self.started_at,
+            "nodes": self.nodes,
+        })
+
+        runs = list_runs() + [self.run_id]
+        for stale in runs[:-self.size]:
+            try:
+                os.remove(get_state_path(f"{self.name}/{stale}"))
+            except OSError:
+                pass
+        save_state(self.name, runs[-self.size:])
+        return []
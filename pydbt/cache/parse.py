@@ -0,0 +1,194 @@
+import os
+import json
+import yaml
+import glob
+import shutil
+import hashlib
+import logbook
+import tempfile
+import typing as T
+from dbt.parser.manifest import ManifestLoader, PARTIAL_PARSE_FILE_NAME
+
+from .. import dbt_version
+from ..types import Message, ParseStats, Reporting
+from ..config import PARSE_CACHE_SIZE
+from ..logger import GLOBAL_LOGGER as log
+from ..handlers.hooks.base import BaseHook
+from ..utils.tools import get_cli_option
+
+PARSE_COMMANDS = (
+    "run", "build", "test", "seed", "snapshot", "compile", "docs", "source", "ls", "list", "parse", "run-operation"
+)
+PROJECT_FILES = ("dbt_project.yml", "packages.yml")
+# options that change the profile dbt parses with
+PROFILE_OPTIONS = (("--profile",), ("-t", "--target"), ("--vars",))
+
+
+class ParseCache(BaseHook):
+    """Keeps dbt's partial parse artifact in a cache directory that outlives the container.
+
+    dbt only reuses ``target/partial_parse.msgpack`` when the dbt version, profile and project
+    files are unchanged, so artifacts are stored under a hash of exactly those. The matching
+    artifact is restored before dbt runs and saved back after a successful run, dbt still
+    validates it and falls back to a full parse whenever it no longer applies.
+    """
+
+    name = "parse"
+
+    def __init__(self, cache_dir: str, size: int = PARSE_CACHE_SIZE):
+        self.cache_dir = cache_dir
+        self.size = size
+        self.key: T.Optional[str] = None
+        self.target_path: T.Optional[str] = None
+        self.restored = False
+        self.stats: T.Optional[ParseStats] = None
+        self._track_project_load = None
+
+    @staticmethod
+    def applies_to(command: T.List[str]) -> bool:
+        return bool(command) and command[0] in PARSE_COMMANDS and "--no-partial-parse" not in command
+
+    @staticmethod
+    def _read(path: str) -> bytes:
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except IOError:
+            return b""
+
+    @staticmethod
+    def get_profiles_dir(command: T.List[str]) -> str:
+        default = os.environ.get("DBT_PROFILES_DIR", os.path.join(os.path.expanduser("~"), ".dbt"))
+        return get_cli_option(command, ("--profiles-dir",), default)
+
+    @classmethod
+    def get_target_path(cls, project_dir: str) -> str:
+        try:
+            project = yaml.safe_load(cls._read(os.path.join(project_dir, "dbt_project.yml"))) or {}
+        except yaml.YAMLError:
+            project = {}
+        return os.path.join(project_dir, project.get("target-path", "target"))
+
+    @classmethod
+    def get_key(cls, command: T.List[str], project_dir: str) -> str:
+        digest = hashlib.sha256(dbt_version.encode("utf-8"))
+        paths = [os.path.join(cls.get_profiles_dir(command), "profiles.yml")]
+        paths += [os.path.join(project_dir, name) for name in PROJECT_FILES]
+        for path in paths:
+            digest.update(b"\0" + cls._read(path))
+
+        for flags in PROFILE_OPTIONS:
+            digest.update(b"\0" + str(get_cli_option(command, flags)).encode("utf-8"))
+
+        return digest.hexdigest()
+
+    def _cache_path(self, suffix: str) -> str:
+        return os.path.join(self.cache_dir, f"{self.key}.{suffix}")
+
+    @property
+    def artifact_path(self) -> str:
+        return os.path.join(self.target_path, PARTIAL_PARSE_FILE_NAME)
+
+    def restore(self) -> bool:
+        cached = self._cache_path("msgpack")
+        if not os.path.exists(cached):
+            return False
+
+        # an artifact left by a previous run in the same container is at least as recent
+        if os.path.exists(self.artifact_path) and os.path.getmtime(self.artifact_path) >= os.path.getmtime(cached):
+            return False
+
+        os.makedirs(self.target_path, exist_ok=True)
+        shutil.copyfile(cached, self.artifact_path)
+        return True
+
+    def save(self, full_parse_time: T.Optional[float]):
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        # copied to a temporary file and renamed, concurrent runs never restore a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f, open(self.artifact_path, "rb") as artifact:
+                shutil.copyfileobj(artifact, f)
+            os.replace(tmp_path, self._cache_path("msgpack"))
+        except Exception:
+            os.remove(tmp_path)
+            raise
+
+        if full_parse_time is not None:
+            with open(self._cache_path("json"), "w") as f:
+                json.dump({"full_parse_time": full_parse_time}, f)
+
+        self.prune()
+
+    def prune(self):
+        """Removes all but the most recently saved artifacts."""
+        artifacts = sorted(glob.glob(os.path.join(self.cache_dir, "*.msgpack")), key=os.path.getmtime, reverse=True)
+        for path in artifacts[self.size:]:
+            for stale in (path, os.path.splitext(path)[0] + ".json"):
+                if os.path.exists(stale):
+                    os.remove(stale)
+
+    def full_parse_time(self) -> T.Optional[float]:
+        try:
+            with open(self._cache_path("json"), "r") as f:
+                return json.load(f)["full_parse_time"]
+        except (IOError, ValueError, KeyError):
+            return None
+
+    def observe(self, hit: bool, parse_time: float):
+        full_parse_time = self.full_parse_time() if hit else None
+        saved_time = max(0.0, full_parse_time - parse_time) if full_parse_time is not None else None
+        self.stats = ParseStats(hit=hit, parse_time=parse_time, saved_time=saved_time)
+
+    def prepare(self, command: T.List[str]) -> T.List[str]:
+        project_dir = get_cli_option(command, ("--project-dir",), os.getcwd())
+        self.key = self.get_key(command, project_dir)
+        self.target_path = self.get_target_path(project_dir)
+        self.restored = self.restore()
+        log.info(f"Partial parse cache {'restored' if self.restored else 'not restored'} for key {self.key[:12]}.")
+
+        cache, track_project_load = self, ManifestLoader.track_project_load
+
+        def track_parse(loader: ManifestLoader):
+            cache.observe(loader.saved_manifest is not None, loader._perf_info.load_all_elapsed)
+            return track_project_load(loader)
+
+        # Hack to read dbt's own parse timing once the manifest is loaded
+        self._track_project_load = track_project_load
+        ManifestLoader.track_project_load = track_parse
+        return command
+
+    @staticmethod
+    def format(stats: ParseStats) -> Message:
+        result = "hit" if stats.hit else "miss"
+        saved = f", saved {stats.saved_time:.1f}s" if stats.saved_time else ""
+        return Message(
+            title=f"Partial parse cache {result}.",
+            message=f"Parsed the project in {stats.parse_time:.1f}s, parse cache {result}{saved}",
+            error=None,
+            reporting=Reporting(
+                rows=None,
+                execution_time=0.0,
+                timing=[],
+                freshness=None,
+                parse=stats,
+            ),
+            context={"resource_type": "parse", "name": "partial_parse", "cache": result},
+            level=logbook.INFO,
+        )
+
+    def close(self):
+        # dbt's manifest loader is patched process wide, also restore it when the run raised
+        if self._track_project_load:
+            ManifestLoader.track_project_load = self._track_project_load
+            self._track_project_load = None
+
+    def finalize(self, success: bool) -> T.List[Message]:
+        self.close()
+
+        if success and os.path.exists(self.artifact_path):
+            full_parse_time = None if self.stats is None or self.stats.hit else self.stats.parse_time
+            self.save(full_parse_time)
+
+        return [self.format(self.stats)] if self.stats else []
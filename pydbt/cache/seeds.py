@@ -0,0 +1,60 @@
+import os
+import typing as T
+from dbt.contracts.graph.parsed import ParsedSeedNode
+from dbt.contracts.results import NodeResult, NodeStatus
+
+from ..types import Message
+from ..config import SEED_RELOAD_THRESHOLD
+from ..handlers.hooks.base import BaseHook
+from ..parsers.formatter import Formatter
+from ..parsers.node import get_seed_path
+from ..utils.state import load_state, save_state
+
+SEED_COMMANDS = ("seed", "build")
+
+
+class SeedReloads(BaseHook):
+    """Flags slow seeds that dbt fully reloaded although their file did not change.
+
+    dbt truncates and reloads every selected seed, so the load time of an unchanged seed
+    is spent entirely on reloading data the warehouse already has.
+    """
+
+    name = "seeds"
+
+    def __init__(self, threshold: float = SEED_RELOAD_THRESHOLD):
+        self.threshold = threshold
+        self.signatures: T.Dict[str, str] = load_state(self.name, {})
+        self.reloaded: T.List[Message] = []
+
+    @staticmethod
+    def applies_to(command: T.List[str]) -> bool:
+        return bool(command) and command[0] in SEED_COMMANDS
+
+    @staticmethod
+    def get_signature(node: ParsedSeedNode) -> T.Optional[str]:
+        if node.checksum.name != "path":
+            return node.checksum.checksum
+
+        # dbt only hashes seeds below 1 MiB, larger seeds are compared by size and mtime
+        try:
+            stat = os.stat(get_seed_path(node))
+        except OSError:
+            return None
+        return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+    def record(self, result: NodeResult, msg: Message):
+        if result.node.resource_type != "seed" or result.status != NodeStatus.Success:
+            return
+
+        unique_id = result.node.unique_id
+        signature = self.get_signature(result.node)
+        unchanged = signature is not None and self.signatures.get(unique_id) == signature
+        if unchanged and result.execution_time >= self.threshold:
+            self.reloaded.append(Formatter.format_seed_reload(msg.context, result.execution_time))
+
+        self.signatures[unique_id] = signature
+
+    def finalize(self, success: bool) -> T.List[Message]:
+        save_state(self.name, self.signatures)
+        return self.reloaded
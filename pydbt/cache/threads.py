@@ -0,0 +1,213 @@
+import time
+import logbook
+import typing as T
+from bisect import bisect_right
+from dbt.contracts.results import NodeResult
+
+from ..types import Message, Reporting, ThreadStats
+from ..config import AUTO_THREADS, THREADS_MAX, THREADS_QUEUE_THRESHOLD, THREADS_INFLATION_LIMIT
+from ..logger import GLOBAL_LOGGER as log
+from ..handlers.hooks.base import BaseHook
+from ..utils.state import load_state, save_state
+from ..utils.tools import get_cli_option, omit_cli_options
+
+THREADS_COMMANDS = ("run", "build", "test", "seed", "snapshot")
+THREADS_OPTIONS = ("--threads",)
+# Execute times below this are dominated by overhead and say nothing about warehouse load
+MIN_EXECUTE_SECONDS = 1.0
+# Baselines drop to a faster execution at once and follow slower ones by this fraction
+BASELINE_DRIFT = 0.1
+# Nodes are analyzed as (start, end, execute start, execute end, parents)
+START, END, EXECUTE_START, EXECUTE_END, PARENTS = range(5)
+
+
+def get_job_key(command: T.List[str]) -> str:
+    """Identifies a job by its command and selection, without its thread count."""
+    return " ".join(omit_cli_options(command, THREADS_OPTIONS))
+
+
+def load_recommendation(key: str) -> T.Optional[int]:
+    return (load_state(f"{ThreadTuner.name}/jobs", {}).get(key) or {}).get("recommended")
+
+
+def running_at(starts: T.List[float], ends: T.List[float], moment: float) -> int:
+    """Counts the intervals that contain `moment` given their sorted starts and ends."""
+    return bisect_right(starts, moment) - bisect_right(ends, moment)
+
+
+def peak_overlap(intervals: T.List[T.Tuple[float, float]]) -> int:
+    starts = sorted(start for start, _ in intervals)
+    ends = sorted(end for _, end in intervals)
+    return max((running_at(starts, ends, start) for start in starts), default=0)
+
+
+def recommend(threads: int, waiting: int, inflation: T.Optional[float], maximum: int = THREADS_MAX) -> int:
+    """Trades idle warehouse capacity against queueing in the warehouse.
+
+    Execute times inflated by concurrency mean the warehouse is saturated, so the threads
+    are reduced in proportion. Otherwise nodes that waited for a free thread could have
+    run in parallel, so the threads grow by the peak number of waiting nodes.
+    """
+    if inflation is not None and inflation >= THREADS_INFLATION_LIMIT and threads > 1:
+        return max(1, min(threads - 1, int(threads / inflation)))
+    if waiting:
+        return max(threads, min(maximum, threads * 2, threads + waiting))
+    return threads
+
+
+class ThreadTuner(BaseHook):
+    """Recommends a thread count per job from the timing of its nodes.
+
+    dbt starts a node as soon as its parents are done and a thread is free, so a node that
+    started well after its last parent completed waited for a thread. Execute times are
+    compared to a per node baseline to tell whether running more nodes at once slowed the
+    warehouse down. The recommendation is stored per command and selection and, with
+    `AUTO_THREADS=1`, passed as `--threads` to the next run that does not set it.
+    """
+
+    name = "threads"
+
+    def __init__(
+        self,
+        auto: bool = AUTO_THREADS,
+        queue_threshold: float = THREADS_QUEUE_THRESHOLD,
+        maximum: int = THREADS_MAX,
+    ):
+        self.auto = auto
+        self.queue_threshold = queue_threshold
+        self.maximum = maximum
+        self.command: T.List[str] = []
+        self.key = ""
+        self.thread_ids: T.Set[str] = set()
+        self.nodes: T.Dict[str, T.Tuple] = {}
+        self.baselines: T.Dict[str, float] = load_state(f"{self.name}/baselines", {})
+
+    @staticmethod
+    def applies_to(command: T.List[str]) -> bool:
+        return bool(command) and command[0] in THREADS_COMMANDS
+
+    def prepare(self, command: T.List[str]) -> T.List[str]:
+        self.key = get_job_key(command)
+        recommended = load_recommendation(self.key)
+        if self.auto and recommended and get_cli_option(command, THREADS_OPTIONS) is None:
+            log.info(f"Running with {recommended} thread(s) recommended by previous runs.")
+            command = command + [THREADS_OPTIONS[0], str(recommended)]
+
+        self.command = command
+        return command
+
+    def record(self, result: NodeResult, msg: Message):
+        timing = {timer.name: timer for timer in result.timing if timer.started_at and timer.completed_at}
+        execute = timing.get("execute")
+        if execute is None:
+            return
+
+        started_at = min(timer.started_at for timer in timing.values()).timestamp()
+        completed_at = max(timer.completed_at for timer in timing.values()).timestamp()
+        self.nodes[result.node.unique_id] = (
+            started_at,
+            completed_at,
+            execute.started_at.timestamp(),
+            execute.completed_at.timestamp(),
+            result.node.depends_on.nodes,
+        )
+        if result.thread_id:
+            self.thread_ids.add(result.thread_id)
+
+    def get_threads(self) -> int:
+        # without --threads the threads dbt used are the best estimate of the profile setting
+        threads = get_cli_option(self.command, THREADS_OPTIONS)
+        return int(threads) if threads and threads.isdigit() else max(1, len(self.thread_ids))
+
+    def get_queue_times(self) -> T.Dict[str, T.Tuple[float, float]]:
+        """Returns when each node became runnable and when it started."""
+        run_start = min(node[START] for node in self.nodes.values())
+        queued = {}
+        for unique_id, node in self.nodes.items():
+            parents = [self.nodes[parent][END] for parent in node[PARENTS] if parent in self.nodes]
+            runnable_at = max(parents, default=run_start)
+            queued[unique_id] = (runnable_at, max(runnable_at, node[START]))
+        return queued
+
+    def get_inflation(self, concurrency: T.Dict[str, int]) -> T.Optional[float]:
+        """Ratio of the execute time of concurrently running nodes to their baselines."""
+        executed, baseline = 0.0, 0.0
+        for unique_id, node in self.nodes.items():
+            seconds = node[EXECUTE_END] - node[EXECUTE_START]
+            previous = self.baselines.get(unique_id)
+            if previous and seconds >= MIN_EXECUTE_SECONDS and concurrency[unique_id] > 1:
+                executed += seconds
+                baseline += previous
+
+        return executed / baseline if baseline else None
+
+    def update_baselines(self):
+        for unique_id, node in self.nodes.items():
+            seconds = node[EXECUTE_END] - node[EXECUTE_START]
+            previous = self.baselines.get(unique_id)
+            if previous is None or seconds < previous:
+                self.baselines[unique_id] = seconds
+            else:
+                self.baselines[unique_id] = previous + (seconds - previous) * BASELINE_DRIFT
+
+    def compute(self) -> ThreadStats:
+        starts = sorted(node[EXECUTE_START] for node in self.nodes.values())
+        ends = sorted(node[EXECUTE_END] for node in self.nodes.values())
+        concurrency = {
+            unique_id: running_at(starts, ends, node[EXECUTE_START]) for unique_id, node in self.nodes.items()
+        }
+
+        queued = self.get_queue_times()
+        waits = [(runnable_at, started_at) for runnable_at, started_at in queued.values()
+                 if started_at - runnable_at >= self.queue_threshold]
+        threads = self.get_threads()
+        inflation = self.get_inflation(concurrency)
+        waiting = peak_overlap(waits)
+
+        return ThreadStats(
+            threads=threads,
+            recommended=recommend(threads, waiting, inflation, self.maximum),
+            queue_time=sum(started_at - runnable_at for runnable_at, started_at in queued.values()) / len(queued),
+            waited=len(waits),
+            waiting=waiting,
+            concurrency=sum(concurrency.values()) / len(concurrency),
+            peak_concurrency=max(concurrency.values()),
+            inflation=inflation,
+        )
+
+    def format(self, stats: ThreadStats) -> Message:
+        inflation = f"{stats.inflation:.2f}x" if stats.inflation is not None else "unknown"
+        message = (
+            f"*[THREADS]* `{self.key}` recommended {stats.recommended} thread(s), ran with {stats.threads}: "
+            f"{stats.waited} node(s) waited for a thread ({stats.waiting} at once), "
+            f"mean queue time {stats.queue_time:.1f}s, concurrency {stats.concurrency:.1f} mean "
+            f"{stats.peak_concurrency} peak, execute time inflation {inflation}"
+        )
+
+        return Message(
+            title=f"Recommended {stats.recommended} thread(s) for dbt {self.key}.",
+            message=message,
+            error=None,
+            reporting=Reporting(
+                rows=None,
+                execution_time=0.0,
+                timing=[],
+                freshness=None,
+                threads=stats,
+            ),
+            context={"resource_type": "run", "name": self.command[0], "selection": self.key},
+            level=logbook.INFO,
+        )
+
+    def finalize(self, success: bool) -> T.List[Message]:
+        if not self.nodes:
+            return []
+
+        stats = self.compute()
+        self.update_baselines()
+        save_state(f"{self.name}/baselines", self.baselines)
+
+        jobs = load_state(f"{self.name}/jobs", {})
+        jobs[self.key] = {"threads": stats.threads, "recommended": stats.recommended, "updated_at": time.time()}
+        save_state(f"{self.name}/jobs", jobs)
+        return [self.format(stats)]
@@ -0,0 +1,142 @@
+import time
+import typing as T
+from dbt.graph.selector import NodeSelector
+from dbt.contracts.graph.manifest import Manifest
+from dbt.contracts.results import NodeResult, NodeStatus, RunResult, SourceFreshnessResult
+
+from ..types import Message
+from ..logger import GLOBAL_LOGGER as log
+from ..handlers.hooks.base import BaseHook
+from ..parsers.formatter import Formatter
+from ..parsers.node import parse_graph_node
+from ..utils.state import load_state, save_state
+from ..utils.selection import add_selection_filter, remove_selection_filter
+from .freshness import FreshnessCache
+
+BUILD_COMMANDS = ("run", "build")
+
+
+class ChangeDetector(BaseHook):
+    """Skips models whose code and upstream source data did not change since their last build.
+
+    Source watermarks (``max_loaded_at``) are recorded by ``pydbt source freshness``. A model
+    is unchanged when its checksum matches the last successful build, every upstream source
+    was observed *after* that build with the same watermark, and every upstream model is
+    unchanged and was not rebuilt since. Seeds, snapshots and models without parents are
+    always rebuilt.
+
+    Unchanged models are removed from dbt's own node selection, so only models the command
+    actually selected are skipped and reported.
+    """
+
+    name = "watermarks"
+
+    def __init__(self):
+        state = load_state(self.name, {})
+        self.sources: T.Dict[str, T.Dict] = state.get("sources", {})
+        self.models: T.Dict[str, T.Dict] = state.get("models", {})
+        self.skipped: T.Dict[str, T.Any] = {}
+        self._filter = None
+
+    @staticmethod
+    def applies_to(command: T.List[str]) -> bool:
+        return bool(command) and (command[0] in BUILD_COMMANDS or FreshnessCache.applies_to(command))
+
+    def _source_unchanged(self, unique_id: str, record: T.Dict) -> bool:
+        current = self.sources.get(unique_id)
+        return (
+            current is not None
+            and current["checked_at"] >= record["built_at"]
+            and current["max_loaded_at"] == record["sources"].get(unique_id)
+        )
+
+    def _model_unchanged(self, node, record: T.Optional[T.Dict], visit: T.Callable) -> bool:
+        if node is None or record is None or not node.depends_on.nodes:
+            return False
+
+        if node.checksum.checksum != record["checksum"]:
+            return False
+
+        return all(
+            self._source_unchanged(parent, record)
+            if parent.startswith("source.")
+            else self._parent_unchanged(parent, record, visit)
+            for parent in node.depends_on.nodes
+        )
+
+    def _parent_unchanged(self, unique_id: str, record: T.Dict, visit: T.Callable) -> bool:
+        # a parent rebuilt by a run that did not select this model has new data for it
+        built_at = self.models.get(unique_id, {}).get("built_at")
+        return built_at is not None and built_at == record.get("parents", {}).get(unique_id) and visit(unique_id)
+
+    def unchanged(self, manifest: Manifest, selected: T.Set[str]) -> T.Set[str]:
+        nodes = {
+            unique_id: node
+            for unique_id, node in manifest.nodes.items()
+            if node.resource_type == "model"
+        }
+        memo: T.Dict[str, bool] = {}
+
+        def visit(unique_id: str) -> bool:
+            if unique_id not in memo:
+                memo[unique_id] = False
+                memo[unique_id] = self._model_unchanged(nodes.get(unique_id), self.models.get(unique_id), visit)
+            return memo[unique_id]
+
+        return {unique_id for unique_id in selected if unique_id in nodes and visit(unique_id)}
+
+    def prepare(self, command: T.List[str]) -> T.List[str]:
+        if command[0] not in BUILD_COMMANDS or "--full-refresh" in command:
+            return command
+
+        def select_changed(selector: NodeSelector, selected: T.Set[str]) -> T.Set[str]:
+            unchanged = self.unchanged(selector.manifest, selected)
+            self.skipped.update({unique_id: selector.manifest.nodes[unique_id] for unique_id in unchanged})
+            log.info(f"Skipping {len(unchanged)} model(s) without upstream source changes.")
+            return selected - unchanged
+
+        self._filter = select_changed
+        add_selection_filter(select_changed)
+        return command
+
+    def _record_model(self, result: RunResult):
+        node = result.node
+        self.models[node.unique_id] = {
+            "checksum": node.checksum.checksum,
+            "built_at": time.time(),
+            "execution_time": result.execution_time,
+            "sources": {
+                parent: self.sources.get(parent, {}).get("max_loaded_at")
+                for parent in node.depends_on.nodes
+                if parent.startswith("source.")
+            },
+            "parents": {
+                parent: self.models.get(parent, {}).get("built_at")
+                for parent in node.depends_on.nodes
+                if not parent.startswith("source.")
+            },
+        }
+
+    def record(self, result: NodeResult, msg: Message):
+        if isinstance(result, SourceFreshnessResult):
+            self.sources[result.node.unique_id] = {
+                "max_loaded_at": result.max_loaded_at.timestamp(),
+                "checked_at": result.snapshotted_at.timestamp(),
+            }
+        elif result.node.resource_type == "model" and result.status == NodeStatus.Success:
+            self._record_model(result)
+        elif result.node.resource_type == "model":
+            self.models.pop(result.node.unique_id, None)
+
+    def finalize(self, success: bool) -> T.List[Message]:
+        if self._filter:
+            remove_selection_filter(self._filter)
+
+        save_state(self.name, {"sources": self.sources, "models": self.models})
+        return [
+            Formatter.format_unchanged(
+                parse_graph_node(node),
+                self.models.get(unique_id, {}).get("execution_time"),
+            )
+            for unique_id, node in self.skipped.items()
+        ]
@@ -0,0 +1,160 @@
+import os
+import json
+import logbook
+import typing as T
+from dataclasses import dataclass
+
+from ..types import Message, Reporting
+from ..config import DIFF_TIME_RATIO, DIFF_MIN_SECONDS, DIFF_ROWS_RATIO, MESSAGE_LIST_LIMIT
+from ..cache.history import STATUS, EXECUTION_TIME, ROWS, load_run, list_runs
+from ..cache.threads import get_job_key
+from ..parsers.templates import format_list
+
+DIFF_COMMAND = "diff"
+FAILED_STATUSES = ("error", "fail", "runtime error", "skipped")
+# Changes are ranked by kind first, then by magnitude
+KINDS = ("broke", "fixed", "status", "slower", "rows")
+
+Nodes = T.Dict[str, T.List]
+
+
+@dataclass
+class Change:
+    kind: str
+    unique_id: str
+    before: T.Any
+    after: T.Any
+    magnitude: float
+
+    def describe(self) -> str:
+        if self.kind == "slower":
+            return (
+                f"{self.unique_id} {self.before:.1f}s -> {self.after:.1f}s"
+                f" (+{self.after - self.before:.1f}s, {self.magnitude:.1f}x)"
+            )
+        if self.kind == "rows":
+            return f"{self.unique_id} {self.before:,} -> {self.after:,} rows ({self.magnitude:.1f}x)"
+        return f"{self.unique_id} {self.before} -> {self.after}"
+
+
+@dataclass
+class Diff:
+    changes: T.List[Change]
+    added: int
+    removed: int
+
+
+def _from_run_results(results: T.List[T.Dict]) -> Nodes:
+    return {
+        result["unique_id"]: [
+            result["status"],
+            result.get("execution_time") or 0.0,
+            (result.get("adapter_response") or {}).get("rows_affected"),
+        ]
+        for result in results
+    }
+
+
+def resolve_run(ref: str) -> T.Optional[str]:
+    """Resolves `last` to the most recent stored run and `previous` to the run of the same job before it."""
+    if ref not in ("last", "previous"):
+        return ref
+
+    runs = list_runs()
+    if not runs:
+        return None
+    if ref == "last":
+        return runs[-1]
+
+    # runs of other commands or selections have other nodes, comparing them lists noise
+    job = get_job_key((load_run(runs[-1]) or {}).get("command", []))
+    for run_id in reversed(runs[:-1]):
+        if get_job_key((load_run(run_id) or {}).get("command", [])) == job:
+            return run_id
+    return None
+
+
+def load_nodes(ref: str) -> Nodes:
+    """Loads the nodes of a run from a `run_results.json` file, a stored run file or a stored run id.
+
+    `last` refers to the most recent stored run and `previous` to the run before it with the
+    same command and selection.
+    """
+    if os.path.isfile(ref):
+        with open(ref, "r") as f:
+            data = json.load(f)
+    else:
+        run_id = resolve_run(ref)
+        data = load_run(run_id) if run_id else None
+        if data is None:
+            raise ValueError(f"No stored run or results file found for `{ref}`")
+
+    if "results" in data:
+        return _from_run_results(data["results"])
+    return data["nodes"]
+
+
+def _compare(unique_id: str, before: T.List, after: T.List) -> T.Optional[Change]:
+    if before[STATUS] != after[STATUS]:
+        if after[STATUS] in FAILED_STATUSES and before[STATUS] not in FAILED_STATUSES:
+            kind = "broke"
+        elif before[STATUS] in FAILED_STATUSES and after[STATUS] not in FAILED_STATUSES:
+            kind = "fixed"
+        else:
+            kind = "status"
+        return Change(kind, unique_id, before[STATUS], after[STATUS], after[EXECUTION_TIME])
+
+    time_before, time_after = before[EXECUTION_TIME], after[EXECUTION_TIME]
+    if time_after - time_before >= DIFF_MIN_SECONDS and time_after >= time_before * DIFF_TIME_RATIO:
+        return Change("slower", unique_id, time_before, time_after, time_after / time_before if time_before else 0.0)
+
+    rows_before, rows_after = before[ROWS], after[ROWS]
+    if rows_before and rows_after and rows_after >= rows_before * DIFF_ROWS_RATIO:
+        return Change("rows", unique_id, rows_before, rows_after, rows_after / rows_before)
+
+    return None
+
+
+def diff_nodes(before: Nodes, after: Nodes) -> Diff:
+    """Compares two runs in a single pass over the later run, using the earlier run as a hash index."""
+    changes, added = [], 0
+    for unique_id, node in after.items():
+        previous = before.get(unique_id)
+        if previous is None:
+            added += 1
+            continue
+
+        change = _compare(unique_id, previous, node)
+        if change is not None:
+            changes.append(change)
+
+    rank = {kind: idx for idx, kind in enumerate(KINDS)}
+    changes.sort(key=lambda change: (rank[change.kind], -change.magnitude))
+    return Diff(changes=changes, added=added, removed=len(before) - (len(after) - added))
+
+
+def format_table(diff: Diff) -> str:
+    lines = [f"{change.kind.upper():<7} {change.describe()}" for change in diff.changes]
+    lines.append(f"{len(diff.changes)} change(s), {diff.added} node(s) added, {diff.removed} node(s) removed")
+    return "\n".join(lines) + "\n"
+
+
+def format_diff(diff: Diff, before: str, after: str, limit: int = MESSAGE_LIST_LIMIT) -> Message:
+    broke = sum(1 for change in diff.changes if change.kind == "broke")
+    # only the changes that end up in the message are described
+    described = [f"{change.kind} {change.describe()}" for change in diff.changes[:limit]]
+    changes = format_list(described, limit, noun="changes", total=len(diff.changes)) if described else "no changes"
+
+    return Message(
+        title=f"{len(diff.changes)} change(s) between `{before}` and `{after}`.",
+        message=f"*[DIFF]* `{before}` -> `{after}`: {changes}",
+        error=None,
+        reporting=Reporting(
+            rows=None,
+            execution_time=0.0,
+            timing=[],
+            freshness=None,
+        ),
+        context={"resource_type": "run", "name": DIFF_COMMAND, "changes": len(diff.changes), "broke": broke},
+        level=logbook.WARNING if broke else logbook.INFO,
+    )
@@ -0,0 +1,91 @@
+import time
+import typing as T
+from dbt.contracts.results import NodeResult, NodeStatus
+
+from ..types import Message
+from ..parsers.node import get_node_selector
+from ..handlers.hooks.base import BaseHook
+from ..utils.state import load_state, save_state
+from ..utils.tools import omit_cli_options
+
+RETRY_COMMAND = "retry"
+RETRY_STATUSES = (NodeStatus.Error, NodeStatus.Fail, NodeStatus.Skipped, NodeStatus.RuntimeErr)
+RETRYABLE_COMMANDS = ("run", "build", "test", "seed", "snapshot", "source")
+SELECTION_FLAGS = ("-s", "--select", "-m", "--models", "--exclude", "--selector")
+
+
+def get_job_key(command: T.List[str]) -> str:
+    return " ".join(command)
+
+
+class RetryState(BaseHook):
+    """Tracks the nodes of a run that need to be executed again by `pydbt retry`.
+
+    dbt reports the descendants of a failed node as skipped, so recording the
+    failed, errored and skipped nodes covers the entire part of the graph that
+    did not complete.
+
+    The nodes are stored per command and selection, a run only replaces the nodes of
+    its own job. A retry is recorded as the job it retries, so retrying again narrows
+    the original command down to what is still incomplete. A run that stopped before
+    dbt reported any node leaves the stored nodes as they were.
+    """
+
+    name = "retry"
+
+    def __init__(self, command: T.Optional[T.List[str]] = None, nodes: T.Optional[T.Dict[str, str]] = None):
+        self.command = command or []
+        self.nodes = nodes or {}
+        self.recorded = 0
+
+    @classmethod
+    def load_jobs(cls) -> T.Dict[str, T.Dict]:
+        return load_state(f"{cls.name}/jobs", {})
+
+    @staticmethod
+    def applies_to(command: T.List[str]) -> bool:
+        return bool(command) and command[0] in RETRYABLE_COMMANDS
+
+    @classmethod
+    def load(cls) -> "RetryState":
+        """Returns the job that most recently left nodes to retry."""
+        jobs = cls.load_jobs()
+        if not jobs:
+            return cls()
+
+        job = max(jobs.values(), key=lambda job: job["updated_at"])
+        return cls(job["command"], job["nodes"])
+
+    def prepare(self, command: T.List[str]) -> T.List[str]:
+        self.command = command
+        for job in self.load_jobs().values():
+            retried = RetryState(job["command"], job["nodes"]).build_command()
+            if retried and command[:len(retried)] == retried:
+                self.command = job["command"]
+        return command
+
+    def record(self, result: NodeResult, msg: Message):
+        self.recorded += 1
+        if result.status in RETRY_STATUSES:
+            self.nodes[result.node.unique_id] = get_node_selector(result.node)
+
+    def build_command(self, args: T.List[str] = None) -> T.List[str]:
+        """Returns the previous command narrowed down to the nodes that did not complete."""
+        if not self.command or not self.nodes:
+            return []
+
+        command = omit_cli_options(self.command, SELECTION_FLAGS)
+        return command + ["--select", *sorted(set(self.nodes.values())), *(args or [])]
+
+    def finalize(self, success: bool) -> T.List[Message]:
+        if not self.recorded:
+            return []
+
+        jobs = self.load_jobs()
+        key = get_job_key(self.command)
+        if self.nodes:
+            jobs[key] = {"command": self.command, "nodes": self.nodes, "updated_at": time.time()}
+        else:
+            jobs.pop(key, None)
+        save_state(f"{self.name}/jobs", jobs)
+        return []
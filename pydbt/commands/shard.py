@@ -0,0 +1,211 @@
+import os
+import json
+import glob
+import heapq
+import hashlib
+import logbook
+import typing as T
+import networkx as nx
+from dbt.graph.selector import NodeSelector
+from dbt.contracts.results import NodeResult, NodeStatus
+
+from ..types import Message
+from ..logger import GLOBAL_LOGGER as log, dbt_to_log_status
+from ..cache.history import STATUS, EXECUTION_TIME, ROWS, RunHistory, execution_times
+from ..handlers.hooks.base import BaseHook
+from ..handlers.hooks.summary import RunSummary
+from ..parsers.templates import format_list
+from ..utils.state import get_state_path, save_state
+from ..utils.selection import add_selection_filter, remove_selection_filter
+
+SHARD_COMMAND = "shard"
+MERGE_COMMAND = "merge-results"
+SHARD_OPTIONS = ("--total", "--index")
+FAILED_STATUSES = ("error", "fail", "runtime error")
+
+
+def parse_shard_args(args: T.List[str]) -> T.Tuple[int, int, T.List[str]]:
+    """Splits `--total N --index i` off the dbt command that follows them."""
+    options, idx = {}, 0
+    while idx < len(args) and args[idx].split("=", 1)[0] in SHARD_OPTIONS:
+        name, sep, value = args[idx].partition("=")
+        if not sep:
+            idx += 1
+            value = args[idx] if idx < len(args) else ""
+        options[name] = value
+        idx += 1
+
+    try:
+        total, index = int(options["--total"]), int(options["--index"])
+    except (KeyError, ValueError):
+        raise ValueError("Usage: pydbt shard --total N --index i <dbt command>")
+    if not 0 <= index < total:
+        raise ValueError(f"Shard index {index} is out of range for {total} shards, indexes start at 0")
+
+    return total, index, args[idx:]
+
+
+def components(graph: nx.DiGraph) -> T.List[T.List[str]]:
+    """Groups the nodes of dbt's selected subgraph into its connected components.
+
+    The subgraph keeps the transitive edges across unselected nodes, so selected nodes that
+    depend on each other through unselected ones stay together.
+    """
+    groups = [sorted(group) for group in nx.weakly_connected_components(graph)]
+    return sorted(groups, key=lambda group: group[0])
+
+
+def partition(groups: T.List[T.List[str]], weights: T.Dict[str, float], total: int) -> T.List[T.Set[str]]:
+    """Assigns the heaviest remaining group to the least loaded shard.
+
+    Every worker computes the same partition, ties are broken by shard index and by the
+    first node of the group so the result only depends on the selection and the weights.
+    """
+    known = [weight for weight in weights.values() if weight > 0]
+    default = sum(known) / len(known) if known else 1.0
+
+    weighted = [(sum(weights.get(unique_id) or default for unique_id in group), group) for group in groups]
+
+    shards: T.List[T.Set[str]] = [set() for _ in range(total)]
+    loads = [(0.0, idx) for idx in range(total)]
+    for weight, group in sorted(weighted, key=lambda item: (-item[0], item[1][0])):
+        load, idx = heapq.heappop(loads)
+        shards[idx].update(group)
+        heapq.heappush(loads, (load + weight, idx))
+
+    return shards
+
+
+def get_fingerprint(selected: T.Set[str], weights: T.Dict[str, float]) -> str:
+    """Hashes the input of the partition, shards of one run have to agree on it to not overlap."""
+    data = [[unique_id, weights.get(unique_id)] for unique_id in sorted(selected)]
+    return hashlib.sha1(json.dumps(data).encode("utf-8")).hexdigest()[:12]
+
+
+class ShardSelector(BaseHook):
+    """Runs one shard of the selected nodes and stores its results for `pydbt merge-results`.
+
+    The selection is split into connected components, so a node always runs in the same
+    shard as everything it depends on, and the components are balanced by the mean
+    execution time of their nodes in the stored runs.
+
+    Workers read their stored runs locally. The selection and weights are stored with the
+    results as a fingerprint, so `pydbt merge-results` can reject workers that partitioned
+    differently.
+    """
+
+    name = "shards"
+
+    def __init__(self, total: int, index: int):
+        self.total = total
+        self.index = index
+        self.command: T.List[str] = []
+        self.weights = execution_times()
+        self.fingerprint: T.Optional[str] = None
+        self.nodes: T.Dict[str, T.List] = {}
+
+    def select_shard(self, selector: NodeSelector, selected: T.Set[str]) -> T.Set[str]:
+        graph = selector.full_graph.get_subset_graph(selected).graph
+        shards = partition(components(graph), self.weights, self.total)
+        self.fingerprint = get_fingerprint(selected, self.weights)
+        shard = shards[self.index]
+        log.info(f"Running shard {self.index + 1}/{self.total} with {len(shard)} of {len(selected)} node(s).")
+        return shard
+
+    def prepare(self, command: T.List[str]) -> T.List[str]:
+        self.command = command
+        add_selection_filter(self.select_shard)
+        return command
+
+    def record(self, result: NodeResult, msg: Message):
+        rows = msg.reporting.rows if msg.reporting else None
+        self.nodes[result.node.unique_id] = [str(result.status), result.execution_time or 0.0, rows]
+
+    def finalize(self, success: bool) -> T.List[Message]:
+        remove_selection_filter(self.select_shard)
+        save_state(f"{self.name}/{self.index}", {
+            "command": self.command,
+            "index": self.index,
+            "total": self.total,
+            "fingerprint": self.fingerprint,
+            "nodes": self.nodes,
+        })
+        return []
+
+
+def shard_paths() -> T.List[str]:
+    return sorted(glob.glob(get_state_path(f"{ShardSelector.name}/*")))
+
+
+def load_shards(paths: T.List[str]) -> T.Tuple[T.List[str], T.Dict[str, T.List]]:
+    """Merges stored shard results into the command and the nodes of a single run.
+
+    Every shard of exactly one sharded command has to be present, leftovers of another
+    command or of a run with another number of shards are rejected. So are shards that
+    were partitioned from different inputs or that ran the same node.
+    """
+    shards = []
+    for path in paths:
+        with open(path, "r") as f:
+            shards.append(json.load(f))
+
+    jobs = {(" ".join(shard["command"]), shard["total"]) for shard in shards}
+    if len(jobs) > 1:
+        found = ", ".join(f"`{command}` in {total} shards" for command, total in sorted(jobs))
+        raise ValueError(f"Shard results belong to different runs: {found}")
+
+    indexes = sorted(shard["index"] for shard in shards)
+    total = shards[0]["total"] if shards else 0
+    if indexes != list(range(total)):
+        missing = sorted(set(range(total)) - set(indexes))
+        duplicated = sorted({index for index in indexes if indexes.count(index) > 1})
+        raise ValueError(f"Expected shards 0 to {total - 1}, missing {missing}, duplicated {duplicated}")
+
+    fingerprints = {shard.get("fingerprint") for shard in shards}
+    if len(fingerprints) > 1:
+        raise ValueError(
+            "Shards were partitioned from different selections or execution times, "
+            "run every shard with the same stored runs"
+        )
+
+    command, nodes = [], {}
+    for shard in shards:
+        overlap = sorted(set(nodes) & set(shard["nodes"]))
+        if overlap:
+            raise ValueError(f"Shard {shard['index']} ran nodes of another shard: {format_list(overlap, 5)}")
+        command = shard["command"]
+        nodes.update(shard["nodes"])
+    return command, nodes
+
+
+def clear_shards(paths: T.List[str]):
+    """Removes merged shard results so the next sharded run starts from an empty directory."""
+    for path in paths:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def _get_level(status: str) -> int:
+    try:
+        return dbt_to_log_status(NodeStatus(status))
+    except ValueError:
+        return logbook.INFO
+
+
+def merge_results(paths: T.List[str]) -> T.Tuple[T.List[Message], bool]:
+    """Reports the shards as a single run and stores it so `pydbt diff` and shard balancing see it."""
+    command, nodes = load_shards(paths)
+    summary = RunSummary(command or [MERGE_COMMAND])
+    history = RunHistory(command)
+    history.nodes = nodes
+
+    for unique_id, node in nodes.items():
+        resource_type, package = unique_id.split(".")[:2]
+        level = _get_level(node[STATUS])
+        summary.add(unique_id, resource_type, package, node[STATUS], level, node[EXECUTION_TIME], node[ROWS] or 0)
+
+    history.finalize(True)
+    success = not any(node[STATUS] in FAILED_STATUSES for node in nodes.values())
+    return summary.finalize(success), success
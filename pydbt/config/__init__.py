@@ -8,12 +8,62 @@ load_dotenv(dotenv_path, verbose=True)
 # Environment
 ENV = os.environ.get("ENV", "dev")
 SENTRY_DSN = os.environ.get("SENTRY_DSN")
+SENTRY_TRACES_SAMPLE_RATE = float(os.environ.get("SENTRY_TRACES_SAMPLE_RATE", 0))
 SLACK_URL = os.environ.get("SLACK_URL", None)
 APP_VERSION = os.environ.get("IMAGE_VERSION")
 NAME = os.environ.get("SERVICE_NAME", "dbt-py")
 LOG_LEVEL = os.environ.get("LOG_LEVEL", "debug")
+LOG_FORMAT = os.environ.get("LOG_FORMAT", "text")
+JSON_LOG_FILE = os.environ.get("JSON_LOG_FILE", None)
+JSON_LOG_BUFFER_SIZE = int(os.environ.get("JSON_LOG_BUFFER_SIZE", 1024 * 1024))
+JSON_LOG_BACKGROUND = bool(int(os.environ.get("JSON_LOG_BACKGROUND", 0)))
 DATADOG_HOST = os.environ.get("DD_HOST", None)
 DATADOG_PORT = os.environ.get("DD_STATSD_PORT", None)
 SUCCESS_ALERTS = bool(int(os.environ.get("SUCCESS_ALERTS", 0)))
 PUSHGATEWAY_HOST = os.environ.get("PUSHGATEWAY_HOST", None)
 PUSHGATEWAY_PORT = os.environ.get("PUSHGATEWAY_PORT", None)
+PROMETHEUS_TEXTFILE_DIR = os.environ.get("PROMETHEUS_TEXTFILE_DIR", None)
+PROMETHEUS_JOB = os.environ.get("PROMETHEUS_JOB", None)
+EXPORT_PATH = os.environ.get("EXPORT_PATH", None)
+EXPORT_COMPRESSION = os.environ.get("EXPORT_COMPRESSION", "zstd")
+MESSAGE_TEMPLATES = os.environ.get("MESSAGE_TEMPLATES", None)
+MESSAGE_LIST_LIMIT = int(os.environ.get("MESSAGE_LIST_LIMIT", 5))
+SUMMARY_SLOWEST = int(os.environ.get("SUMMARY_SLOWEST", 5))
+ASYNC_SINKS = bool(int(os.environ.get("ASYNC_SINKS", 0)))
+SINK_QUEUE_SIZE = int(os.environ.get("SINK_QUEUE_SIZE", 1000))
+SINK_CONCURRENCY = os.environ.get("SINK_CONCURRENCY", None)
+SHUTDOWN_DEADLINE = float(os.environ.get("SHUTDOWN_DEADLINE", 10))
+PROGRESS_INTERVAL = float(os.environ.get("PROGRESS_INTERVAL", 0))
+
+# Local state
+STATE_DIR = os.environ.get("PYDBT_STATE_DIR", ".pydbt")
+FRESHNESS_CACHE = bool(int(os.environ.get("FRESHNESS_CACHE", 0)))
+FRESHNESS_CACHE_TTL = int(os.environ.get("FRESHNESS_CACHE_TTL", 86400))
+SKIP_UNCHANGED = bool(int(os.environ.get("SKIP_UNCHANGED", 0)))
+COLLAPSE_SKIPPED = bool(int(os.environ.get("COLLAPSE_SKIPPED", 0)))
+RESULTS_HISTORY = int(os.environ.get("RESULTS_HISTORY", 10))
+SEED_RELOAD_THRESHOLD = float(os.environ.get("SEED_RELOAD_THRESHOLD", 10))
+PARSE_CACHE_DIR = os.environ.get("PARSE_CACHE_DIR", None)
+PARSE_CACHE_SIZE = int(os.environ.get("PARSE_CACHE_SIZE", 5))
+
+# Thread count recommendations
+AUTO_THREADS = bool(int(os.environ.get("AUTO_THREADS", 0)))
+THREADS_MAX = int(os.environ.get("THREADS_MAX", 32))
+THREADS_QUEUE_THRESHOLD = float(os.environ.get("THREADS_QUEUE_THRESHOLD", 1))
+THREADS_INFLATION_LIMIT = float(os.environ.get("THREADS_INFLATION_LIMIT", 1.5))
+
+# Thresholds of `pydbt diff`
+DIFF_TIME_RATIO = float(os.environ.get("DIFF_TIME_RATIO", 1.5))
+DIFF_MIN_SECONDS = float(os.environ.get("DIFF_MIN_SECONDS", 1))
+DIFF_ROWS_RATIO = float(os.environ.get("DIFF_ROWS_RATIO", 2))
+
+# Alert routing and deduplication
+ALERT_ROUTES = os.environ.get("ALERT_ROUTES", None)
+ALERT_DEDUP = bool(int(os.environ.get("ALERT_DEDUP", 0)))
+ALERT_REMINDER_INTERVAL = int(os.environ.get("ALERT_REMINDER_INTERVAL", 14400))
+ALERT_STATE_TTL = int(os.environ.get("ALERT_STATE_TTL", 604800))
+
+# Sampling of success level logs and metrics
+SAMPLE_RATE = float(os.environ.get("SAMPLE_RATE", 1.0))
+SAMPLE_RATES = os.environ.get("SAMPLE_RATES", None)
+SAMPLE_SLOW_THRESHOLD = float(os.environ.get("SAMPLE_SLOW_THRESHOLD", 60))
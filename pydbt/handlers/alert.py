@@ -1,14 +1,57 @@
-from ..config import SLACK_URL
+import typing as T
+from dbt.clients.system import load_file_contents
+from dbt.clients.yaml_helper import load_yaml_text
+from ..config import SLACK_URL, ALERT_DEDUP, ALERT_ROUTES
 from ..logger import GLOBAL_LOGGER as log
+from .alerting.base import BaseAlert
 from .alerting.slack import SlackAlert
 from .alerting.dummy import DummyAlert
+from .alerting.dedup import DedupAlert
+from .alerting.router import RoutingAlert, Route
+
+
+DESTINATION_TYPES = ("slack", "dummy")
+
+
+def _init_destination(name: str, spec: T.Dict) -> BaseAlert:
+    kind = spec.get("type")
+    if kind == "slack":
+        return SlackAlert(spec["url"])
+    if kind == "dummy":
+        return DummyAlert()
+    raise ValueError(f"Unknown type `{kind}` of alert destination `{name}`, use one of {', '.join(DESTINATION_TYPES)}")
+
+
+def _init_routing(path: str) -> RoutingAlert:
+    rules = load_yaml_text(load_file_contents(path))
+    destinations = {
+        name: _init_destination(name, spec) for name, spec in rules.get("destinations", {}).items()
+    }
+    routes = [Route.from_dict(rule) for rule in rules.get("routes", [])]
+
+    # fail on a typo when the rules are loaded instead of on the first alert routed to it
+    default = rules.get("default")
+    for destination in [route.destination for route in routes] + ([default] if default else []):
+        if destination not in destinations:
+            raise ValueError(f"Unknown alert destination `{destination}` in `{path}`")
+
+    return RoutingAlert(destinations, routes, default=default)
 
 
 # Alerting factory
 def init():
-    if SLACK_URL:
+    if ALERT_ROUTES:
+        log.info("Using routed alerting.")
+        alerting = _init_routing(ALERT_ROUTES)
+    elif SLACK_URL:
         log.info("Using slack alerting.")
-        return SlackAlert(SLACK_URL)
+        alerting = SlackAlert(SLACK_URL)
     else:
         log.info("Alerting is not enabled.")
         return DummyAlert()
+
+    if ALERT_DEDUP:
+        log.info("Deduplicating alerts across runs.")
+        return DedupAlert(alerting)
+
+    return alerting
@@ -6,3 +6,9 @@ class BaseAlert(ABC):
     @abstractmethod
     def alert(self, msg: Message):
         raise NotImplementedError()
+
+    def pending(self) -> int:
+        return 0
+
+    def flush(self):
+        pass
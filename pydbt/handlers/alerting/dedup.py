@@ -0,0 +1,113 @@
+import re
+import time
+import logbook
+import hashlib
+import threading
+import typing as T
+from dataclasses import replace
+from .base import BaseAlert
+from ...types import Message
+from ...utils.state import load_state, save_state
+from ...config import ALERT_REMINDER_INTERVAL, ALERT_STATE_TTL
+
+# Entries are stored as [signature, first_seen, last_alert, runs, updated]
+SIGNATURE, FIRST_SEEN, LAST_ALERT, RUNS, UPDATED = range(5)
+
+
+class DedupAlert(BaseAlert):
+    """Suppresses repeated alerts for nodes that keep failing the same way across runs.
+
+    Only messages about a node are deduplicated, run level messages are always sent.
+
+    Entries are only touched under a lock, the wrapped alert is called outside of it so
+    concurrent alerting workers still send in parallel.
+    """
+
+    name = "alerts"
+
+    def __init__(
+        self,
+        alert: BaseAlert,
+        reminder_interval: int = ALERT_REMINDER_INTERVAL,
+        ttl: int = ALERT_STATE_TTL,
+    ):
+        super(DedupAlert, self).__init__()
+        self.inner = alert
+        self.reminder_interval = reminder_interval
+        self.ttl = ttl
+        self.lock = threading.Lock()
+
+        now = time.time()
+        self.entries: T.Dict[str, T.List] = {
+            key: entry
+            for key, entry in load_state(self.name, {}).items()
+            if now - entry[UPDATED] < ttl
+        }
+
+    @staticmethod
+    def _get_key(msg: Message) -> T.Optional[str]:
+        ctx = msg.context
+        # run summaries, diffs and other run level messages are not about a node
+        if "package_name" not in ctx:
+            return None
+        return ".".join(str(ctx.get(k)) for k in ("resource_type", "package_name", "database", "schema", "name"))
+
+    @staticmethod
+    def _get_signature(msg: Message) -> str:
+        # counts and durations change from run to run, the failure stays the same
+        error = re.sub(r"\d+", "N", msg.error or msg.title)
+        return hashlib.sha1(f"{msg.level}:{error}".encode("utf-8")).hexdigest()[:12]
+
+    def _alert_failure(self, key: str, msg: Message, now: float) -> T.Optional[Message]:
+        signature = self._get_signature(msg)
+        entry = self.entries.get(key)
+
+        if entry is None or entry[SIGNATURE] != signature:
+            self.entries[key] = [signature, now, now, 1, now]
+            return msg
+
+        entry[RUNS] += 1
+        entry[UPDATED] = now
+        if now - entry[LAST_ALERT] < self.reminder_interval:
+            return None
+
+        entry[LAST_ALERT] = now
+        return replace(msg, title=f"Still failing ({entry[RUNS]} runs): {msg.title}")
+
+    def _alert_recovery(self, key: str, msg: Message) -> Message:
+        entry = self.entries.pop(key)
+        return replace(
+            msg,
+            level=logbook.NOTICE,
+            title=f"Recovered: {msg.title}",
+            message=f"{msg.message} recovered after failing {entry[RUNS]} run(s)",
+            error=None,
+        )
+
+    def _get_alert(self, msg: Message) -> T.Optional[Message]:
+        key = self._get_key(msg)
+        if key is None:
+            return msg
+
+        if msg.level >= logbook.WARNING:
+            return self._alert_failure(key, msg, time.time())
+
+        if key in self.entries:
+            return self._alert_recovery(key, msg)
+
+        return msg
+
+    def alert(self, msg: Message):
+        with self.lock:
+            msg = self._get_alert(msg)
+        if msg is None:
+            return None
+        return self.inner.alert(msg)
+
+    def pending(self) -> int:
+        return self.inner.pending()
+
+    def flush(self):
+        with self.lock:
+            save_state(self.name, self.entries)
+        return self.inner.flush()
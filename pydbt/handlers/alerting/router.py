@@ -0,0 +1,138 @@
+import bisect
+import logbook
+import typing as T
+from dataclasses import dataclass, field
+from .base import BaseAlert
+from ...types import Message
+
+# Context keys that hold a comma separated list of values
+LIST_KEYS = ("tags",)
+
+
+def _get_values(context: T.Dict, key: str) -> T.Set[str]:
+    value = context.get(key)
+    if value is None:
+        return set()
+
+    if key in LIST_KEYS:
+        return {v.strip().lower() for v in str(value).split(",")}
+
+    return {str(value).lower()}
+
+
+@dataclass
+class Route:
+    destination: str
+    match: T.Dict[str, T.Set[str]] = field(default_factory=dict)
+    level: int = logbook.NOTSET
+
+    @classmethod
+    def from_dict(cls, rule: T.Dict) -> "Route":
+        match = {}
+        for key, values in rule.get("match", {}).items():
+            values = values if isinstance(values, list) else [values]
+            match[key] = {str(v).lower() for v in values}
+
+        level = rule.get("level", logbook.NOTSET)
+        return cls(
+            destination=rule["destination"],
+            match=match,
+            level=logbook.lookup_level(level.upper()) if isinstance(level, str) else level,
+        )
+
+    def matches(self, msg: Message) -> bool:
+        if msg.level < self.level:
+            return False
+
+        return all(values & _get_values(msg.context, key) for key, values in self.match.items())
+
+
+class RouteIndex:
+    """Routes compiled into per-key hash indexes.
+
+    Every route is a bit in an integer mask. For each context key the index maps a
+    value to the mask of routes requiring it, plus a wildcard mask of routes that do
+    not constrain the key. A message is matched with one dict lookup per key and a
+    handful of integer AND/OR operations, regardless of the number of routes.
+    """
+
+    def __init__(self, routes: T.List[Route]):
+        self.routes = routes
+        self.all = (1 << len(routes)) - 1
+        self.keys = sorted({key for route in routes for key in route.match})
+        self.index: T.Dict[str, T.Dict[str, int]] = {key: {} for key in self.keys}
+        self.wildcard: T.Dict[str, int] = {key: 0 for key in self.keys}
+
+        for bit, route in enumerate(routes):
+            for key in self.keys:
+                if key not in route.match:
+                    self.wildcard[key] |= 1 << bit
+                    continue
+
+                for value in route.match[key]:
+                    self.index[key][value] = self.index[key].get(value, 0) | (1 << bit)
+
+        # masks of routes allowed at or above each distinct minimum level
+        self.levels = sorted({route.level for route in routes})
+        self.level_masks = [
+            sum(1 << bit for bit, route in enumerate(routes) if route.level <= level)
+            for level in self.levels
+        ]
+
+    def _level_mask(self, level: int) -> int:
+        idx = bisect.bisect_right(self.levels, level) - 1
+        return self.level_masks[idx] if idx >= 0 else 0
+
+    def match(self, msg: Message) -> T.List[Route]:
+        mask = self._level_mask(msg.level) if self.routes else 0
+        for key in self.keys:
+            if not mask:
+                break
+
+            candidates = self.wildcard[key]
+            lookup = self.index[key]
+            for value in _get_values(msg.context, key):
+                candidates |= lookup.get(value, 0)
+            mask &= candidates
+
+        routes = []
+        while mask:
+            low = mask & -mask
+            routes.append(self.routes[low.bit_length() - 1])
+            mask ^= low
+
+        return routes
+
+
+class RoutingAlert(BaseAlert):
+    """Dispatches each message to the destinations of every matching route.
+
+    Routes are only read after they are compiled, so concurrent alerting workers can share them.
+    """
+
+    def __init__(self, destinations: T.Dict[str, BaseAlert], routes: T.List[Route], default: T.Optional[str] = None):
+        super(RoutingAlert, self).__init__()
+        self.destinations = destinations
+        self.default = default
+        self.index = RouteIndex(routes)
+
+    def route(self, msg: Message) -> T.List[str]:
+        destinations = []
+        for route in self.index.match(msg):
+            if route.destination not in destinations:
+                destinations.append(route.destination)
+
+        if not destinations and self.default:
+            destinations.append(self.default)
+
+        return destinations
+
+    def alert(self, msg: Message):
+        return [self.destinations[name].alert(msg) for name in self.route(msg)]
+
+    def pending(self) -> int:
+        return sum(destination.pending() for destination in self.destinations.values())
+
+    def flush(self):
+        for destination in self.destinations.values():
+            destination.flush()
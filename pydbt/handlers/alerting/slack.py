@@ -3,7 +3,7 @@ import typing as T
 from .base import BaseAlert
 from ... import dbt_version
 from ...types import Message, Freshness
-from ...utils.http import make_external_call
+from ...utils.http import BackgroundCalls
 from dbt.contracts.results import TimingInfo
 from ...logger import logbook_status_to_color
 from ...config import SUCCESS_ALERTS, ENV, NAME
@@ -15,6 +15,7 @@ class SlackAlert(BaseAlert):
         super(SlackAlert, self).__init__()
         self.url = url
         self.success_alerts = SUCCESS_ALERTS
+        self.calls = BackgroundCalls('slack')
 
     @staticmethod
     def _get_issue_priority(level: int) -> str:
@@ -107,11 +108,17 @@ class SlackAlert(BaseAlert):
         if (msg.level < logbook.NOTICE) and not self.success_alerts:
             return
 
-        return make_external_call(
+        # sent in the background, flush waits for outstanding calls
+        return self.calls.submit(
             'POST',
             self.url,
             json=payload,
             timeout=30,
             service_name=NAME,
-            raise_exception=True
         )
+
+    def pending(self) -> int:
+        return self.calls.pending
+
+    def flush(self):
+        self.calls.join()
@@ -0,0 +1,21 @@
+from ..logger import GLOBAL_LOGGER as log
+from .exporters.base import BaseExporter
+from .exporters.dummy import DummyExporter
+from ..config import EXPORT_PATH, EXPORT_COMPRESSION
+
+# Exporter factory
+
+
+def init(**kwargs) -> BaseExporter:
+    if not EXPORT_PATH:
+        return DummyExporter()
+
+    # pyarrow is slow to import, only load it when exports are enabled
+    try:
+        from .exporters.parquet import ParquetExporter
+    except ImportError:
+        log.warning('Exporting results requires pyarrow, install pydbt[export].')
+        return DummyExporter()
+
+    log.info('Exporting results to parquet.')
+    return ParquetExporter(EXPORT_PATH, compression=EXPORT_COMPRESSION, **kwargs)
@@ -0,0 +1,11 @@
+from ...types import Message
+from abc import ABC, abstractmethod
+
+
+class BaseExporter(ABC):
+    @abstractmethod
+    def export(self, msg: Message):
+        raise NotImplementedError()
+
+    def flush(self):
+        pass
@@ -0,0 +1,7 @@
+from .base import BaseExporter
+from ...types import Message
+
+
+class DummyExporter(BaseExporter):
+    def export(self, msg: Message):
+        pass
@@ -0,0 +1,136 @@
+import os
+import uuid
+import tempfile
+import threading
+import logbook
+import typing as T
+from datetime import datetime, date
+
+from .base import BaseExporter
+from ...types import Message
+
+# optional, installed with pydbt[export]
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+CONTEXT_COLUMNS = ("database", "schema", "name", "resource_type", "package_name", "materialized", "tags", "owner")
+TIMING_COLUMNS = ("compile", "execute")
+
+
+def _schema():
+    return pa.schema(
+        [
+            ("run_id", pa.string()),
+            ("run_started_at", pa.timestamp("us")),
+            ("command", pa.string()),
+            *[(column, pa.string()) for column in CONTEXT_COLUMNS],
+            ("level", pa.string()),
+            ("title", pa.string()),
+            ("error", pa.string()),
+            ("execution_time", pa.float64()),
+            *[(f"{phase}_time", pa.float64()) for phase in TIMING_COLUMNS],
+            ("rows", pa.int64()),
+            ("bytes_processed", pa.int64()),
+            ("cached", pa.bool_()),
+        ]
+    )
+
+
+class ParquetExporter(BaseExporter):
+    """Appends the results of every run to a date partitioned parquet dataset.
+
+    Results are accumulated column by column and written as a single compressed file
+    per run to ``<path>/date=YYYY-MM-DD/<run_id>.parquet`` when the exporter is flushed.
+    The file is written under a hidden temporary name and renamed once complete, dataset
+    readers skip hidden files so an interrupted flush never leaves a truncated file behind.
+    """
+
+    def __init__(self, path: str, command: str = None, compression: str = "zstd"):
+        super(ParquetExporter, self).__init__()
+        self.path = path
+        self.command = command
+        self.compression = compression
+        self.run_id = uuid.uuid4().hex
+        self.run_started_at = datetime.utcnow()
+        self.schema = _schema()
+        self.columns: T.Dict[str, T.List] = {name: [] for name in self.schema.names}
+        # exports may be delivered by several sink workers
+        self.lock = threading.Lock()
+
+    def export(self, msg: Message):
+        reporting = msg.reporting
+        timing = {timer.name: timer for timer in (reporting.timing or [])} if reporting else {}
+        row = {
+            "run_id": self.run_id,
+            "run_started_at": self.run_started_at,
+            "command": self.command,
+            **{column: msg.context.get(column) for column in CONTEXT_COLUMNS},
+            "level": logbook.get_level_name(msg.level).lower(),
+            "title": msg.title,
+            "error": msg.error,
+            "execution_time": reporting.execution_time if reporting else None,
+            **{
+                f"{phase}_time": (
+                    (timing[phase].completed_at - timing[phase].started_at).total_seconds()
+                    if phase in timing and timing[phase].completed_at and timing[phase].started_at
+                    else None
+                )
+                for phase in TIMING_COLUMNS
+            },
+            "rows": reporting.rows if reporting else None,
+            "bytes_processed": reporting.adapter.bytes_processed if reporting and reporting.adapter else None,
+            "cached": reporting.cached if reporting else False,
+        }
+
+        with self.lock:
+            for name, values in self.columns.items():
+                values.append(row[name])
+
+    @property
+    def file_path(self) -> str:
+        return os.path.join(self.path, f"date={self.run_started_at.date().isoformat()}", f"{self.run_id}.parquet")
+
+    def flush(self):
+        with self.lock:
+            columns, self.columns = self.columns, {name: [] for name in self.schema.names}
+        if not columns["run_id"]:
+            return
+
+        table = pa.Table.from_pydict(columns, schema=self.schema)
+        directory = os.path.dirname(self.file_path)
+        os.makedirs(directory, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".", suffix=".parquet.tmp")
+        os.close(fd)
+        try:
+            pq.write_table(table, tmp_path, compression=self.compression)
+            os.replace(tmp_path, self.file_path)
+        except Exception:
+            os.remove(tmp_path)
+            raise
+
+
+def read_results(
+    path: str,
+    columns: T.Optional[T.List[str]] = None,
+    start: T.Optional[date] = None,
+    end: T.Optional[date] = None,
+):
+    """Reads exported results as a pyarrow table.
+
+    Only the requested columns are read, and only the date partitions between start
+    and end (inclusive) are scanned.
+    """
+    partitioning = ds.partitioning(pa.schema([("date", pa.string())]), flavor="hive")
+    dataset = ds.dataset(path, format="parquet", partitioning=partitioning)
+
+    # iso dates sort lexicographically
+    expression = None
+    if start is not None:
+        expression = ds.field("date") >= start.isoformat()
+    if end is not None:
+        condition = ds.field("date") <= end.isoformat()
+        expression = condition if expression is None else expression & condition
+
+    return dataset.to_table(columns=columns, filter=expression)
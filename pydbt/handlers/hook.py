@@ -0,0 +1,70 @@
+import typing as T
+from ..config import (
+    FRESHNESS_CACHE,
+    SKIP_UNCHANGED,
+    PARSE_CACHE_DIR,
+    COLLAPSE_SKIPPED,
+    SENTRY_DSN,
+    SENTRY_TRACES_SAMPLE_RATE,
+)
+from ..logger import GLOBAL_LOGGER as log
+from .hooks.base import BaseHook
+from .hooks.summary import RunSummary
+from .hooks.impact import RootCauses
+from .hooks.tracing import SentryTracing
+from ..cache.parse import ParseCache
+from ..cache.freshness import FreshnessCache
+from ..cache.watermarks import ChangeDetector
+from ..cache.seeds import SeedReloads
+from ..commands.retry import RetryState
+from ..cache.history import RunHistory
+from ..cache.threads import ThreadTuner
+from ..commands.shard import ShardSelector
+
+
+def init_caches(command: T.List[str]) -> T.List[BaseHook]:
+    hooks = []
+    if FRESHNESS_CACHE and FreshnessCache.applies_to(command):
+        log.info("Using source freshness cache.")
+        hooks.append(FreshnessCache())
+
+    if SKIP_UNCHANGED and ChangeDetector.applies_to(command):
+        log.info("Skipping models without upstream source changes.")
+        hooks.append(ChangeDetector())
+
+    return hooks
+
+
+# Hook factory
+def init(command: T.List[str], shard: T.Optional[T.Tuple[int, int]] = None) -> T.List[BaseHook]:
+    hooks = []
+    if SENTRY_DSN and SENTRY_TRACES_SAMPLE_RATE and SentryTracing.applies_to(command):
+        hooks.append(SentryTracing())
+
+    if PARSE_CACHE_DIR and ParseCache.applies_to(command):
+        log.info(f"Using partial parse cache in {PARSE_CACHE_DIR}.")
+        hooks.append(ParseCache(PARSE_CACHE_DIR))
+
+    if shard:
+        log.info(f"Running shard {shard[1] + 1} of {shard[0]}.")
+        hooks.append(ShardSelector(*shard))
+
+    hooks.extend(init_caches(command))
+
+    # hooks that always run for the commands they apply to
+    for hook in (SeedReloads, RetryState, ThreadTuner):
+        if hook.applies_to(command):
+            hooks.append(hook())
+
+    # shards are stored as a single run by `pydbt merge-results`
+    if not shard and RunHistory.applies_to(command):
+        hooks.append(RunHistory())
+
+    if COLLAPSE_SKIPPED and RootCauses.applies_to(command):
+        log.info("Collapsing skipped nodes into their root cause.")
+        hooks.append(RootCauses())
+
+    if RunSummary.applies_to(command):
+        hooks.append(RunSummary(command))
+
+    return hooks
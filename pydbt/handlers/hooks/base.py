@@ -0,0 +1,34 @@
+import typing as T
+from abc import ABC
+from dbt.contracts.results import NodeResult
+
+from ...types import Message
+
+
+class BaseHook(ABC):
+    """Stateful extension of a single pydbt run.
+
+    Hooks can rewrite the dbt command before it runs, observe every result
+    as it is reported, hold back its message and return additional messages
+    once dbt is done. `close` is called at the end of every run, also when
+    dbt or reporting raised before `finalize`.
+    """
+
+    @staticmethod
+    def applies_to(command: T.List[str]) -> bool:
+        return True
+
+    def prepare(self, command: T.List[str]) -> T.List[str]:
+        return command
+
+    def record(self, result: NodeResult, msg: Message):
+        pass
+
+    def suppresses(self, result: NodeResult) -> bool:
+        return False
+
+    def finalize(self, success: bool) -> T.List[Message]:
+        return []
+
+    def close(self):
+        pass
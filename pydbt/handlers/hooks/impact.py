@@ -0,0 +1,88 @@
+import logbook
+import typing as T
+from dbt.contracts.results import NodeResult, NodeStatus
+
+from .base import BaseHook
+from ...types import Message, Reporting
+from ...config import MESSAGE_LIST_LIMIT
+from ...parsers.templates import format_list
+from ...utils.tools import get_full_db_id
+
+FAILED_STATUSES = (NodeStatus.Error, NodeStatus.Fail, NodeStatus.RuntimeErr)
+IMPACT_COMMANDS = ("run", "build", "test", "seed", "snapshot")
+
+
+class RootCauses(BaseHook):
+    """Collapses the nodes dbt skipped after a failure into one message per failing node.
+
+    dbt reports a node after all of its parents, so the failures a skipped node descends
+    from are known when it is recorded: they are the union of the causes of its parents.
+    Every node is attributed once by looking at its own parents, which keeps attribution
+    linear in the size of the graph without holding on to the results.
+
+    A failing test does not fail its model, but `dbt build` skips the model's children. Their
+    parents are the tested models, so a failing test is also added to the causes of the models
+    it depends on.
+    """
+
+    def __init__(self, limit: int = MESSAGE_LIST_LIMIT):
+        self.limit = limit
+        self.causes: T.Dict[str, T.Tuple[str, ...]] = {}
+        self.failures: T.Dict[str, T.Dict] = {}
+        self.impacted: T.Dict[str, T.List[str]] = {}
+
+    @staticmethod
+    def applies_to(command: T.List[str]) -> bool:
+        return bool(command) and command[0] in IMPACT_COMMANDS
+
+    def record(self, result: NodeResult, msg: Message):
+        unique_id = result.node.unique_id
+        if result.status in FAILED_STATUSES:
+            self.causes[unique_id] = (unique_id,)
+            self.failures[unique_id] = msg.context
+            self.impacted[unique_id] = []
+            if result.node.resource_type == "test":
+                for parent in result.node.depends_on.nodes:
+                    self.causes[parent] = self.causes.get(parent, ()) + (unique_id,)
+            return
+
+        if result.status != NodeStatus.Skipped:
+            return
+
+        causes = set()
+        for parent in result.node.depends_on.nodes:
+            causes.update(self.causes.get(parent, ()))
+
+        if causes:
+            self.causes[unique_id] = tuple(causes)
+            for cause in causes:
+                self.impacted[cause].append(result.node.name)
+
+    def suppresses(self, result: NodeResult) -> bool:
+        return result.status == NodeStatus.Skipped and result.node.unique_id in self.causes
+
+    def format(self, context: T.Dict, impacted: T.List[str]) -> Message:
+        target = get_full_db_id(context["database"], context["schema"], context["name"])
+
+        return Message(
+            title=f"Failure of {context['name']} skipped {len(impacted)} downstream node(s).",
+            message=f"*[IMPACT]* `{target}` failed and skipped {format_list(sorted(impacted), self.limit)}",
+            error=None,
+            reporting=Reporting(
+                rows=None,
+                execution_time=0.0,
+                timing=[],
+                freshness=None,
+                impact=len(impacted),
+            ),
+            # the failure was already reported for the node itself, keep it apart in alerting
+            context={**context, "resource_type": "impact", "impacted": len(impacted)},
+            level=logbook.WARNING,
+        )
+
+    def finalize(self, success: bool) -> T.List[Message]:
+        return [
+            self.format(self.failures[unique_id], impacted)
+            for unique_id, impacted in self.impacted.items()
+            if impacted
+        ]
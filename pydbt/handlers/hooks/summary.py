@@ -0,0 +1,137 @@
+import logbook
+import typing as T
+from array import array
+from collections import Counter
+from dbt.contracts.results import NodeResult
+
+from .base import BaseHook
+from ...types import Message, Reporting, RunStats
+from ...config import SUMMARY_SLOWEST
+
+PERCENTILES = (50, 90, 99)
+SUMMARY_COMMANDS = ("run", "build", "test", "seed", "snapshot", "source")
+
+
+def percentile(ordered: T.Sequence[float], pct: float) -> float:
+    """Nearest rank percentile of an already sorted sequence."""
+    rank = max(0, -(-pct * len(ordered) // 100) - 1)
+    return ordered[int(rank)]
+
+
+class RunSummary(BaseHook):
+    """Collects every result of a run into flat arrays and reports a single summary message.
+
+    Recording only appends to typed arrays, the statistics are computed in one pass over
+    them when the run is finalized.
+    """
+
+    def __init__(self, command: T.List[str], slowest: int = SUMMARY_SLOWEST):
+        self.command = " ".join(command[:1])
+        self.slowest = slowest
+        self.names: T.List[str] = []
+        self.resource_types: T.List[str] = []
+        self.packages: T.List[str] = []
+        self.statuses: T.List[str] = []
+        self.levels = array("b")
+        self.execution_times = array("d")
+        self.rows = array("q")
+
+    @staticmethod
+    def applies_to(command: T.List[str]) -> bool:
+        return bool(command) and command[0] in SUMMARY_COMMANDS
+
+    def add(
+        self,
+        unique_id: str,
+        resource_type: str,
+        package: str,
+        status: str,
+        level: int,
+        execution_time: float,
+        rows: int,
+    ):
+        self.names.append(unique_id)
+        self.resource_types.append(resource_type)
+        self.packages.append(package)
+        self.statuses.append(status)
+        self.levels.append(level)
+        self.execution_times.append(execution_time)
+        self.rows.append(rows)
+
+    def record(self, result: NodeResult, msg: Message):
+        self.add(
+            result.node.unique_id,
+            str(result.node.resource_type),
+            result.node.package_name,
+            str(result.status),
+            msg.level,
+            result.execution_time or 0.0,
+            (msg.reporting.rows or 0) if msg.reporting else 0,
+        )
+
+    def compute(self) -> RunStats:
+        times = self.execution_times
+        order = sorted(range(len(times)), key=times.__getitem__)
+        ordered = [times[idx] for idx in order]
+        total = sum(times)
+
+        nodes: T.Dict[str, T.Dict[str, int]] = {}
+        for (resource_type, status), count in Counter(zip(self.resource_types, self.statuses)).items():
+            nodes.setdefault(resource_type, {})[status] = count
+
+        rows: T.Dict[str, int] = {}
+        for package, moved in zip(self.packages, self.rows):
+            if moved:
+                rows[package] = rows.get(package, 0) + moved
+
+        execution_time = {"total": total, "mean": total / len(times) if times else 0.0}
+        if ordered:
+            execution_time.update({f"p{pct}": percentile(ordered, pct) for pct in PERCENTILES})
+            execution_time["max"] = ordered[-1]
+
+        return RunStats(
+            nodes=nodes,
+            execution_time=execution_time,
+            slowest=[(self.names[idx], times[idx]) for idx in reversed(order[max(0, len(order) - self.slowest):])],
+            rows=rows,
+        )
+
+    def format(self, stats: RunStats) -> Message:
+        counts = Counter()
+        for statuses in stats.nodes.values():
+            counts.update(statuses)
+
+        level = max(self.levels) if self.levels else logbook.INFO
+        status = ", ".join(f"{count} {status}" for status, count in sorted(counts.items()))
+        timing = stats.execution_time
+        lines = [f"*[SUMMARY]* {len(self.names)} node(s): {status}"]
+        if "max" in timing:
+            lines.append(
+                f"Execution time {timing['total']:.1f}s total, {timing['mean']:.1f}s mean, "
+                + ", ".join(f"p{pct} {timing[f'p{pct}']:.1f}s" for pct in PERCENTILES)
+            )
+        if stats.slowest:
+            lines.append("Slowest: " + ", ".join(f"`{name}` {seconds:.1f}s" for name, seconds in stats.slowest))
+        if stats.rows:
+            moved = sorted(stats.rows.items())
+            lines.append("Rows moved: " + ", ".join(f"{package} {rows}" for package, rows in moved))
+
+        return Message(
+            title=f"dbt {self.command} finished: {status or 'nothing to do'}.",
+            message="\n".join(lines),
+            error=None,
+            reporting=Reporting(
+                rows=None,
+                execution_time=0.0,
+                timing=[],
+                freshness=None,
+                summary=stats,
+            ),
+            context={"resource_type": "run", "name": self.command},
+            level=max(level, logbook.INFO),
+        )
+
+    def finalize(self, success: bool) -> T.List[Message]:
+        if not self.names:
+            return []
+        return [self.format(self.compute())]
@@ -0,0 +1,79 @@
+import typing as T
+import sentry_sdk
+from sentry_sdk.tracing import Transaction
+from dbt.contracts.results import NodeResult, TimingInfo
+
+from .base import BaseHook
+from ...types import Message
+
+TRACING_COMMANDS = ("run", "build", "test", "seed", "snapshot", "source")
+# Sentry span statuses of failed nodes, every other node is ok
+SPAN_STATUSES = {
+    "error": "internal_error",
+    "runtime error": "internal_error",
+    "fail": "failed_precondition",
+}
+
+
+class SentryTracing(BaseHook):
+    """Reports a dbt command as a Sentry transaction with a span per node and per node phase.
+
+    The sampling decision is taken once, when the transaction starts. Sampled runs only keep
+    the timing dbt already measured while the nodes ran, the spans are built from it in bulk
+    when dbt is done, so tracing adds no work to the run itself. A run that raised before
+    `finalize` still sends its transaction, with the nodes recorded so far, when it is closed.
+    """
+
+    def __init__(self, hub: T.Optional[sentry_sdk.Hub] = None):
+        self.hub = hub or sentry_sdk.Hub.current
+        self.transaction: T.Optional[Transaction] = None
+        self.nodes: T.List[T.Tuple[str, str, str, T.List[TimingInfo]]] = []
+
+    @staticmethod
+    def applies_to(command: T.List[str]) -> bool:
+        return bool(command) and command[0] in TRACING_COMMANDS
+
+    def prepare(self, command: T.List[str]) -> T.List[str]:
+        self.transaction = self.hub.start_transaction(op="dbt.command", name=f"dbt {command[0]}")
+        self.transaction.set_tag("selection", " ".join(command))
+        return command
+
+    def record(self, result: NodeResult, msg: Message):
+        if not self.transaction.sampled:
+            return
+
+        timing = [timer for timer in result.timing if timer.started_at and timer.completed_at]
+        if timing:
+            self.nodes.append((result.node.unique_id, result.node.resource_type, str(result.status), timing))
+
+    def add_span(self, unique_id: str, resource_type: str, status: str, timing: T.List[TimingInfo]):
+        span = self.transaction.start_child(op=f"dbt.{resource_type}", description=unique_id)
+        span.set_tag("dbt.status", status)
+        span.set_status(SPAN_STATUSES.get(status, "ok"))
+        span.start_timestamp = timing[0].started_at
+        span.timestamp = timing[-1].completed_at
+
+        for timer in timing:
+            phase = span.start_child(op=f"dbt.{timer.name}", description=unique_id)
+            phase.start_timestamp = timer.started_at
+            phase.timestamp = timer.completed_at
+
+    def finalize(self, success: bool) -> T.List[Message]:
+        if not self.transaction.sampled:
+            return []
+
+        # Sentry drops the spans past its limit, starting with the slowest nodes keeps what matters
+        nodes, self.nodes = sorted(self.nodes, key=lambda node: node[3][0].started_at - node[3][-1].completed_at), []
+        for node in nodes:
+            self.add_span(*node)
+
+        self.transaction.set_status("ok" if success else "internal_error")
+        self.transaction.finish(hub=self.hub)
+        return []
+
+    def close(self):
+        # finish() sets the timestamp, a transaction without one was never finalized
+        if self.transaction is None or self.transaction.timestamp is not None:
+            return
+
+        self.finalize(False)
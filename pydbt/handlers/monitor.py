@@ -2,12 +2,19 @@ from ..logger import GLOBAL_LOGGER as log
 from .monitors.ddatadog import DatadogMonitor
 from .monitors.prometheus import PrometheusMonitor
 from .monitors.dummy import DummyMonitor
-from ..config import DATADOG_HOST, DATADOG_PORT, PUSHGATEWAY_HOST, PUSHGATEWAY_PORT
+from ..config import (
+    DATADOG_HOST,
+    DATADOG_PORT,
+    PUSHGATEWAY_HOST,
+    PUSHGATEWAY_PORT,
+    PROMETHEUS_TEXTFILE_DIR,
+    PROMETHEUS_JOB,
+)
 
 # Monitor factory
 
 
-def init(**kwargs):
+def init(command=None, **kwargs):
     if DATADOG_HOST and DATADOG_PORT:
         log.info('Using datadog monitor.')
         monitor = DatadogMonitor(
@@ -17,11 +24,23 @@ def init(**kwargs):
         )
         monitor.initialize()
         return monitor
+    elif PROMETHEUS_TEXTFILE_DIR:
+        log.info('Using prometheus textfile monitor.')
+        monitor = PrometheusMonitor(
+            textfile_dir=PROMETHEUS_TEXTFILE_DIR,
+            job=PROMETHEUS_JOB,
+            command=command,
+            **kwargs
+        )
+        monitor.initialize()
+        return monitor
     elif PUSHGATEWAY_PORT and PUSHGATEWAY_HOST:
         log.info('Using prometheus monitor.')
         monitor = PrometheusMonitor(
             host=PUSHGATEWAY_HOST,
             port=PUSHGATEWAY_PORT,
+            job=PROMETHEUS_JOB,
+            command=command,
             **kwargs
         )
         monitor.initialize()
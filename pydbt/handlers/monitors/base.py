@@ -1,5 +1,5 @@
 import typing as T
-from ...types import Message
+from ...types import Message, ParseStats, ProgressStats, RunStats, ThreadStats
 from abc import ABC, abstractmethod
 from dbt.contracts.results import TimingInfo
 
@@ -25,6 +25,9 @@ class BaseMonitor(ABC):
     def timing(self, name: str, value: float, tags: Tags = None, sample_rate: float = 1):
         pass
 
+    def gauge(self, name: str, value: float, tags: Tags = None, sample_rate: float = 1):
+        pass
+
     def _format_tags(self, tags: Tags):
         # For safety
         if isinstance(tags, dict):
@@ -78,5 +81,146 @@ class BaseMonitor(ABC):
         metric_name = 'dbt.rows.moved'
         return self.increment(metric_name, rows, tags=self._merge_tags(tags))
 
+    def report_freshness_cached(self, tags: Tags = None):
+        return self.increment('dbt.freshness.cached', tags=self._merge_tags(tags))
+
+    def report_unchanged(self, saved_time: T.Optional[float], tags: Tags = None):
+        self.increment('dbt.unchanged.skipped', tags=self._merge_tags(tags))
+        if saved_time:
+            self.timing('dbt.unchanged.time_saved', saved_time, tags=self._merge_tags(tags))
+
+    def report_seed_file_size(self, size: int, tags: Tags = None):
+        return self.gauge('dbt.seed.file_size', size, tags=self._merge_tags(tags))
+
+    def report_seed_reload(self, reload_time: float, tags: Tags = None):
+        self.increment('dbt.seed.unchanged_reload', tags=self._merge_tags(tags))
+        self.timing('dbt.seed.reload_time', reload_time, tags=self._merge_tags(tags))
+
+    def report_summary(self, summary: RunStats, tags: Tags = None):
+        for resource_type, statuses in summary.nodes.items():
+            for status, count in statuses.items():
+                self.gauge('dbt.summary.nodes', count, tags=self._merge_tags(
+                    {**(tags or {}), 'resource_type': resource_type, 'status': status}))
+
+        for stat, seconds in summary.execution_time.items():
+            self.gauge(f'dbt.summary.execution_time.{stat}', seconds, tags=self._merge_tags(tags))
+
+        for package, rows in summary.rows.items():
+            self.gauge('dbt.summary.rows', rows, tags=self._merge_tags({**(tags or {}), 'package_name': package}))
+
+    def report_impact(self, impacted: int, tags: Tags = None):
+        return self.gauge('dbt.impact.skipped', impacted, tags=self._merge_tags(tags))
+
+    def report_parse(self, parse: ParseStats, tags: Tags = None):
+        self.increment(f'pydbt.parse_cache.{"hit" if parse.hit else "miss"}', tags=self._merge_tags(tags))
+        self.timing('dbt.parse.time', parse.parse_time, tags=self._merge_tags(tags))
+        if parse.saved_time:
+            self.timing('pydbt.parse_cache.time_saved', parse.saved_time, tags=self._merge_tags(tags))
+
+    def report_threads(self, threads: ThreadStats, tags: Tags = None):
+        self.gauge('pydbt.threads.current', threads.threads, tags=self._merge_tags(tags))
+        self.gauge('pydbt.threads.recommended', threads.recommended, tags=self._merge_tags(tags))
+        self.gauge('pydbt.threads.queue_time', threads.queue_time, tags=self._merge_tags(tags))
+        self.gauge('pydbt.threads.waiting', threads.waiting, tags=self._merge_tags(tags))
+        self.gauge('pydbt.threads.concurrency', threads.concurrency, tags=self._merge_tags(tags))
+        if threads.inflation is not None:
+            self.gauge('pydbt.threads.inflation', threads.inflation, tags=self._merge_tags(tags))
+
+    def report_progress(self, progress: ProgressStats, tags: Tags = None):
+        self.gauge('pydbt.progress.completed', progress.completed, tags=self._merge_tags(tags))
+        self.gauge('pydbt.progress.running', progress.running, tags=self._merge_tags(tags))
+        self.gauge('pydbt.progress.remaining', progress.remaining, tags=self._merge_tags(tags))
+        if progress.eta is not None:
+            self.gauge('pydbt.progress.eta', progress.eta, tags=self._merge_tags(tags))
+
+    def report_sinks(self, sinks: T.Dict, tags: Tags = None):
+        for name, stats in sinks.items():
+            sink_tags = self._merge_tags({**(tags or {}), 'sink': name})
+            self.gauge('pydbt.sink.queue_depth', stats.max_depth, tags=sink_tags)
+            self.timing('pydbt.sink.latency', stats.mean_latency, tags=sink_tags)
+            self.timing('pydbt.sink.busy', stats.busy, tags=sink_tags)
+
+    def report_command_time(self, seconds: float, tags: Tags = None):
+        return self.timing('dbt.command.time', seconds, tags=self._merge_tags(tags))
+
+    def report_phases(self, phases: T.Dict[str, float], tags: Tags = None):
+        for name, seconds in phases.items():
+            self.timing(f'pydbt.{name}.time', seconds, tags=self._merge_tags(tags))
+
+    def report_nodes(self, totals: T.Dict[T.Tuple[str, str], int], tags: Tags = None):
+        for (resource_type, level), count in totals.items():
+            self.increment('dbt.nodes', count, tags=self._merge_tags(
+                {**(tags or {}), 'resource_type': resource_type, 'level': level}))
+
+    def report_dropped_rows(self, rows: T.Dict[str, int], tags: Tags = None):
+        """Reports the rows of sampled out nodes per resource type, so `dbt.rows.moved` adds up to the exact total."""
+        for resource_type, count in rows.items():
+            self.report_rows_moved(count, tags={**(tags or {}), 'resource_type': resource_type})
+
+    def report_bytes_processed(self, value: int, tags: Tags = None):
+        return self.increment('dbt.bytes.processed', value, tags=self._merge_tags(tags))
+
+    def report_bytes_billed(self, value: int, tags: Tags = None):
+        return self.increment('dbt.bytes.billed', value, tags=self._merge_tags(tags))
+
+    def report_slot_ms(self, value: int, tags: Tags = None):
+        return self.increment('dbt.slot.ms', value, tags=self._merge_tags(tags))
+
+    def report_throughput(self, unit: str, per_second: float, tags: Tags = None):
+        return self.gauge(f'dbt.{unit}.per_second', per_second, tags=self._merge_tags(tags))
+
+    @staticmethod
+    def _unsampled(msg: Message, value: int) -> int:
+        # scale sampled warehouse counters back up to an estimate of the full run
+        return int(round(value / msg.reporting.sample_rate))
+
+    def report_warehouse(self, msg: Message):
+        """Reports warehouse usage and throughput derived from the adapter response."""
+        reporting, adapter = msg.reporting, msg.reporting.adapter
+        execution_time = reporting.execution_time
+
+        if reporting.rows and execution_time:
+            self.report_throughput('rows', reporting.rows / execution_time, tags=msg.context)
+
+        if adapter.bytes_processed:
+            self.report_bytes_processed(self._unsampled(msg, adapter.bytes_processed), tags=msg.context)
+            if execution_time:
+                self.report_throughput('bytes', adapter.bytes_processed / execution_time, tags=msg.context)
+
+        if adapter.bytes_billed:
+            self.report_bytes_billed(self._unsampled(msg, adapter.bytes_billed), tags=msg.context)
+
+        if adapter.slot_ms:
+            self.report_slot_ms(self._unsampled(msg, adapter.slot_ms), tags=msg.context)
+
+    def report_details(self, msg: Message):
+        """Reports warehouse usage, seed loads, run summaries, parse caching, failure impact, threads and progress."""
+        if msg.reporting.adapter:
+            self.report_warehouse(msg)
+
+        if msg.reporting.file_size is not None:
+            self.report_seed_file_size(msg.reporting.file_size, tags=msg.context)
+
+        if msg.reporting.reload_time:
+            self.report_seed_reload(msg.reporting.reload_time, tags=msg.context)
+
+        if msg.reporting.summary:
+            self.report_summary(msg.reporting.summary)
+
+        if msg.reporting.parse:
+            self.report_parse(msg.reporting.parse)
+
+        if msg.reporting.impact:
+            self.report_impact(msg.reporting.impact, tags=msg.context)
+
+        if msg.reporting.threads:
+            self.report_threads(msg.reporting.threads, tags={"selection": msg.context.get("selection")})
+
+        if msg.reporting.progress:
+            self.report_progress(msg.reporting.progress)
+
     def report(self, msg: Message):
         raise NotImplementedError()
+
+    def flush(self):
+        pass
@@ -31,6 +31,9 @@ class DatadogMonitor(BaseMonitor):
     def timing(self, name: str, value: int, tags: Tags = None, sample_rate: float = 1):
         return statsd.timing(name, value, tags=self._merge_tags(tags), sample_rate=sample_rate)
 
+    def gauge(self, name: str, value: float, tags: Tags = None, sample_rate: float = 1):
+        return statsd.gauge(name, value, tags=self._merge_tags(tags), sample_rate=sample_rate)
+
     def report(self, msg: Message):
         if msg.reporting and msg.reporting.timing:
             self.report_detailed_timing(msg.reporting.timing, tags=msg.context)
@@ -41,7 +44,16 @@ class DatadogMonitor(BaseMonitor):
         if msg.reporting and msg.reporting.freshness:
             self.report_freshness_age(msg.reporting.freshness.age, tags=msg.context)
 
+        if msg.reporting and msg.reporting.cached and msg.reporting.freshness:
+            self.report_freshness_cached(tags=msg.context)
+
+        if msg.reporting and msg.reporting.cached and not msg.reporting.freshness:
+            self.report_unchanged(msg.reporting.saved_time, tags=msg.context)
+
         if msg.reporting and msg.reporting.rows:
             self.report_rows_moved(msg.reporting.rows, tags=msg.context)
 
+        if msg.reporting:
+            self.report_details(msg)
+
         return
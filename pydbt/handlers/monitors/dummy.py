@@ -20,6 +20,9 @@ class DummyMonitor(BaseMonitor):
     def initialize(self):
         pass
 
+    def increment(self, name: str, value: int = 1, tags: Tags = None, sample_rate: float = 1):
+        pass
+
     def decrement(self, name: str, value: int = 1, tags: Tags = None, sample_rate: float = 1):
         pass
 
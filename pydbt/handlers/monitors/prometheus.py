@@ -1,3 +1,7 @@
+import os
+import re
+import hashlib
+import typing as T
 from ...config import ENV
 from ...types import Message
 from .base import BaseMonitor, Tags
@@ -5,11 +9,19 @@ from prometheus_client import (
     CollectorRegistry,
     Histogram,
     Counter,
+    Gauge,
     Summary,
     push_to_gateway,
+    write_to_textfile,
 )
 
 
+def get_default_job(command: T.List[str]) -> str:
+    """Names the job after the command and a hash of its arguments, so every selection gets its own."""
+    digest = hashlib.sha1(" ".join(command).encode("utf-8")).hexdigest()[:8]
+    return f"dbt_{command[0]}_{digest}"
+
+
 class PrometheusMonitor(BaseMonitor):
     labels = [
         "database",
@@ -21,10 +33,25 @@ class PrometheusMonitor(BaseMonitor):
         "env",
     ]
 
-    def __init__(self, host: str, port: str, **kwargs):
+    def __init__(
+        self,
+        host: T.Optional[str] = None,
+        port: T.Optional[str] = None,
+        textfile_dir: T.Optional[str] = None,
+        job: T.Optional[str] = None,
+        command: T.Optional[T.List[str]] = None,
+        **kwargs
+    ):
         self.host = host
         self.port = port
+        self.textfile_dir = textfile_dir
         self.common_tags = {**kwargs.get("common_tags", {}), **{"env": ENV}}
+        self.job = job or get_default_job(command or [self.common_tags.get("command", "run")])
+
+    @property
+    def textfile_path(self) -> str:
+        # one file per job, the default job differs per selection so concurrent runs don't overwrite each other
+        return os.path.join(self.textfile_dir, re.sub(r"[^a-zA-Z0-9_]", "_", self.job) + ".prom")
 
     def _merge_tags(self, tags: Tags):
         if tags:
@@ -60,6 +87,144 @@ class PrometheusMonitor(BaseMonitor):
             labelnames=self.labels,
             registry=self.registry,
         )
+        self.freshness_cached = Counter(
+            "dbt_freshness_cached",
+            "Records source freshness checks answered from the local cache",
+            self.labels,
+            registry=self.registry,
+        )
+        self.unchanged = Counter(
+            "dbt_unchanged_skipped",
+            "Records models skipped because their upstream sources have no new data",
+            self.labels,
+            registry=self.registry,
+        )
+        self.time_saved = Counter(
+            "dbt_unchanged_time_saved_seconds",
+            "Records the execution time saved by skipping unchanged models",
+            self.labels,
+            registry=self.registry,
+        )
+        self.bytes_processed = Counter(
+            "dbt_bytes_processed",
+            "Records the number of bytes processed by the warehouse",
+            self.labels,
+            registry=self.registry,
+        )
+        self.bytes_billed = Counter(
+            "dbt_bytes_billed",
+            "Records the number of bytes billed by the warehouse",
+            self.labels,
+            registry=self.registry,
+        )
+        self.slot_ms = Counter(
+            "dbt_slot_ms",
+            "Records the slot milliseconds consumed by the warehouse",
+            self.labels,
+            registry=self.registry,
+        )
+        self.throughput = Gauge(
+            "dbt_throughput_per_second",
+            "Records the rows or bytes a node processed per second",
+            ["unit", *self.labels],
+            registry=self.registry,
+        )
+        self.seed_file_size = Gauge(
+            "dbt_seed_file_size_bytes",
+            "Records the size of the csv file loaded by a seed",
+            self.labels,
+            registry=self.registry,
+        )
+        self.seed_reload = Counter(
+            "dbt_seed_unchanged_reload_seconds",
+            "Records the time spent reloading seeds whose file did not change",
+            self.labels,
+            registry=self.registry,
+        )
+        self.impact = Gauge(
+            "dbt_impact_skipped",
+            "Records the number of downstream nodes skipped because a node failed",
+            self.labels,
+            registry=self.registry,
+        )
+        self.summary_nodes = Gauge(
+            "dbt_summary_nodes",
+            "Records the number of nodes of the last run per resource type and status",
+            ["resource_type", "status", "command", "version", "env"],
+            registry=self.registry,
+        )
+        self.summary_time = Gauge(
+            "dbt_summary_execution_time_seconds",
+            "Records total, mean, percentile and max node execution time of the last run",
+            ["stat", "command", "version", "env"],
+            registry=self.registry,
+        )
+        self.summary_rows = Gauge(
+            "dbt_summary_rows",
+            "Records the rows moved per package in the last run",
+            ["package_name", "command", "version", "env"],
+            registry=self.registry,
+        )
+        self.parse_cache = Counter(
+            "pydbt_parse_cache",
+            "Records whether dbt partially parsed the project from the restored parse cache",
+            ["result", "command", "version", "env"],
+            registry=self.registry,
+        )
+        self.parse_time = Gauge(
+            "dbt_parse_time_seconds",
+            "Records the time dbt spent parsing the project",
+            ["command", "version", "env"],
+            registry=self.registry,
+        )
+        self.parse_time_saved = Counter(
+            "pydbt_parse_cache_time_saved_seconds",
+            "Records the parse time saved by restoring the partial parse cache",
+            ["command", "version", "env"],
+            registry=self.registry,
+        )
+        self.sink_depth = Gauge(
+            "pydbt_sink_queue_depth",
+            "Records the deepest queue of messages waiting for a sink",
+            ["sink", "command", "version", "env"],
+            registry=self.registry,
+        )
+        self.sink_latency = Gauge(
+            "pydbt_sink_latency_seconds",
+            "Records the mean time from submitting a message until a sink delivered it",
+            ["sink", "command", "version", "env"],
+            registry=self.registry,
+        )
+        self.sink_busy = Gauge(
+            "pydbt_sink_busy_seconds",
+            "Records the time a sink spent delivering messages, summed over its workers",
+            ["sink", "command", "version", "env"],
+            registry=self.registry,
+        )
+        self.threads = Gauge(
+            "pydbt_threads",
+            "Records the threads of the last run, the recommended threads and the evidence for them",
+            ["stat", "selection", "command", "version", "env"],
+            registry=self.registry,
+        )
+        self.progress = Gauge(
+            "pydbt_progress",
+            "Records the completed, running and remaining nodes of the running command and its ETA in seconds",
+            ["stat", "command", "version", "env"],
+            registry=self.registry,
+        )
+        self.phases = Summary(
+            "pydbt_phase_seconds",
+            "Records the time pydbt spends in each phase of a run",
+            ["phase", "command", "version", "env"],
+            registry=self.registry,
+        )
+        self.nodes = Counter(
+            "dbt_nodes",
+            "Records the number of nodes reported per resource type and level",
+            ["resource_type", "level", "command", "version", "env"],
+            registry=self.registry,
+        )
 
     def _get_labels(self, tags: Tags):
         result = []
@@ -87,6 +252,120 @@ class PrometheusMonitor(BaseMonitor):
         labels = self._get_labels(tags)
         return self.row_counter.labels(*labels).inc(rows)
 
+    def report_bytes_processed(self, value: int, tags: Tags):
+        labels = self._get_labels(tags)
+        return self.bytes_processed.labels(*labels).inc(value)
+
+    def report_bytes_billed(self, value: int, tags: Tags):
+        labels = self._get_labels(tags)
+        return self.bytes_billed.labels(*labels).inc(value)
+
+    def report_slot_ms(self, value: int, tags: Tags):
+        labels = self._get_labels(tags)
+        return self.slot_ms.labels(*labels).inc(value)
+
+    def report_throughput(self, unit: str, per_second: float, tags: Tags):
+        labels = self._get_labels(tags)
+        return self.throughput.labels(unit, *labels).set(per_second)
+
+    def report_seed_file_size(self, size: int, tags: Tags):
+        labels = self._get_labels(tags)
+        return self.seed_file_size.labels(*labels).set(size)
+
+    def report_seed_reload(self, reload_time: float, tags: Tags):
+        labels = self._get_labels(tags)
+        return self.seed_reload.labels(*labels).inc(reload_time)
+
+    def report_impact(self, impacted: int, tags: Tags):
+        labels = self._get_labels(tags)
+        return self.impact.labels(*labels).set(impacted)
+
+    def report_freshness_cached(self, tags: Tags):
+        labels = self._get_labels(tags)
+        return self.freshness_cached.labels(*labels).inc()
+
+    def report_unchanged(self, saved_time: float, tags: Tags):
+        labels = self._get_labels(tags)
+        self.unchanged.labels(*labels).inc()
+        if saved_time:
+            self.time_saved.labels(*labels).inc(saved_time)
+
+    def report_summary(self, summary, tags: Tags = None):
+        tags = self._merge_tags(tags)
+        common = [tags.get("command", "unknown"), tags.get("version", "unknown"), tags["env"]]
+        for resource_type, statuses in summary.nodes.items():
+            for status, count in statuses.items():
+                self.summary_nodes.labels(resource_type, status, *common).set(count)
+
+        for stat, seconds in summary.execution_time.items():
+            self.summary_time.labels(stat, *common).set(seconds)
+
+        for package, rows in summary.rows.items():
+            self.summary_rows.labels(package, *common).set(rows)
+
+    def report_parse(self, parse, tags: Tags = None):
+        tags = self._merge_tags(tags)
+        common = [tags.get("command", "unknown"), tags.get("version", "unknown"), tags["env"]]
+        self.parse_cache.labels("hit" if parse.hit else "miss", *common).inc()
+        self.parse_time.labels(*common).set(parse.parse_time)
+        if parse.saved_time:
+            self.parse_time_saved.labels(*common).inc(parse.saved_time)
+
+    def report_threads(self, threads, tags: Tags = None):
+        tags = self._merge_tags(tags)
+        common = [tags.get("command", "unknown"), tags.get("version", "unknown"), tags["env"]]
+        selection = tags.get("selection") or "unknown"
+        stats = {
+            "current": threads.threads,
+            "recommended": threads.recommended,
+            "queue_time_seconds": threads.queue_time,
+            "waiting": threads.waiting,
+            "concurrency": threads.concurrency,
+            "inflation": threads.inflation,
+        }
+        for stat, value in stats.items():
+            if value is not None:
+                self.threads.labels(stat, selection, *common).set(value)
+
+    def report_progress(self, progress, tags: Tags = None):
+        tags = self._merge_tags(tags)
+        common = [tags.get("command", "unknown"), tags.get("version", "unknown"), tags["env"]]
+        stats = {
+            "completed": progress.completed,
+            "running": progress.running,
+            "remaining": progress.remaining,
+            "eta_seconds": progress.eta,
+        }
+        for stat, value in stats.items():
+            if value is not None:
+                self.progress.labels(stat, *common).set(value)
+
+    def report_sinks(self, sinks, tags: Tags = None):
+        tags = self._merge_tags(tags)
+        common = [tags.get("command", "unknown"), tags.get("version", "unknown"), tags["env"]]
+        for name, stats in sinks.items():
+            self.sink_depth.labels(name, *common).set(stats.max_depth)
+            self.sink_latency.labels(name, *common).set(stats.mean_latency)
+            self.sink_busy.labels(name, *common).set(stats.busy)
+
+    def report_command_time(self, seconds: float, tags: Tags = None):
+        labels = self._get_labels(tags or {})
+        return self.run_time.labels(*labels).observe(seconds)
+
+    def report_phases(self, phases, tags: Tags = None):
+        tags = self._merge_tags(tags)
+        for name, seconds in phases.items():
+            self.phases.labels(
+                name, tags.get("command", "unknown"), tags.get("version", "unknown"), tags["env"]
+            ).observe(seconds)
+
+    def report_nodes(self, totals, tags: Tags = None):
+        tags = self._merge_tags(tags)
+        for (resource_type, level), count in totals.items():
+            self.nodes.labels(
+                resource_type, level, tags.get("command", "unknown"), tags.get("version", "unknown"), tags["env"]
+            ).inc(count)
+
     def report(self, msg: Message):
         if msg.reporting and msg.reporting.timing:
             self.report_detailed_timing(msg.reporting.timing, tags=msg.context)
@@ -97,7 +376,24 @@ class PrometheusMonitor(BaseMonitor):
         if msg.reporting and msg.reporting.freshness:
             self.report_freshness_age(msg.reporting.freshness.age, tags=msg.context)
 
+        if msg.reporting and msg.reporting.cached and msg.reporting.freshness:
+            self.report_freshness_cached(tags=msg.context)
+
+        if msg.reporting and msg.reporting.cached and not msg.reporting.freshness:
+            self.report_unchanged(msg.reporting.saved_time, tags=msg.context)
+
         if msg.reporting and msg.reporting.rows:
             self.report_rows_moved(msg.reporting.rows, tags=msg.context)
 
-        return push_to_gateway(f"{self.host}:{self.port}", "dbt", self.registry)
+        if msg.reporting:
+            self.report_details(msg)
+
+        return
+
+    def flush(self):
+        if self.textfile_dir:
+            # written to a temporary file and renamed, node_exporter never reads a partial file
+            return write_to_textfile(self.textfile_path, self.registry)
+
+        # the pushgateway replaces the whole group on every push, pushing once at the end is enough
+        return push_to_gateway(f"{self.host}:{self.port}", self.job, self.registry)
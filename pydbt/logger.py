@@ -1,14 +1,21 @@
+import io
+import os
 import re
 import sys
+import json
+import queue
+import atexit
 import logbook
+import threading
 import sentry_sdk
 import typing as T
+from itertools import islice
+from functools import lru_cache
 from sentry_sdk.hub import Hub
 from sentry_sdk.integrations.logging import ignore_logger
 from logbook import NullHandler
 from sentry_sdk.utils import (
     to_string,
-    get_lines_from_file,
     event_from_exception,
     current_stacktrace,
     capture_internal_exceptions,
@@ -16,10 +23,38 @@ from sentry_sdk.utils import (
 from dbt.contracts.results import NodeStatus
 
 from .constants import StatusColor
-from .config import NAME, ENV, SENTRY_DSN, APP_VERSION
+from .config import (
+    NAME,
+    ENV,
+    SENTRY_DSN,
+    SENTRY_TRACES_SAMPLE_RATE,
+    APP_VERSION,
+    LOG_LEVEL,
+    JSON_LOG_FILE,
+    JSON_LOG_BUFFER_SIZE,
+    JSON_LOG_BACKGROUND,
+)
+
+try:
+    import orjson
+
+    def json_dumps(obj: T.Any) -> bytes:
+        return orjson.dumps(obj, default=str)
+
+except ImportError:
+    _encoder = json.JSONEncoder(separators=(",", ":"), default=str)
+
+    def json_dumps(obj: T.Any) -> bytes:
+        return _encoder.encode(obj).encode("utf-8")
 
 logger = logbook.Logger("pydbt")
 
+# Source context attached to sentry events, see `get_file_context`
+FILE_CONTEXT_LINES = 7
+FILE_CONTEXT_MAX_LINE_LENGTH = 512
+FILE_CONTEXT_MAX_FILE_SIZE = 10 * 1024 * 1024
+FILE_CONTEXT_CACHE_SIZE = 256
+
 ignore_logger('configured_file')
 ignore_logger('configured_std_out')
 
@@ -27,6 +62,8 @@ sentry_sdk.init(
     dsn=SENTRY_DSN,
     environment=ENV,
     release=f"{NAME}@{APP_VERSION}",
+    # tracing stays disabled unless a sample rate is set
+    traces_sample_rate=SENTRY_TRACES_SAMPLE_RATE or None,
 )
 
 
@@ -35,6 +72,29 @@ def set_sentry_tags(tags: T.Dict):
         sentry_sdk.set_tag(key, str(val))
 
 
+@lru_cache(maxsize=FILE_CONTEXT_CACHE_SIZE)
+def get_file_context(path: T.Optional[str]) -> T.Tuple[T.Tuple[str, ...], T.Tuple[str, ...]]:
+    """Returns the pre and post context around the first line of a file.
+
+    Equivalent to `sentry_sdk.utils.get_lines_from_file(path, 1)` without reading
+    (and caching in `linecache`) entire compiled files. Only the first lines are
+    read, long lines are truncated and very large files are skipped.
+    """
+    try:
+        if not path or os.path.getsize(path) > FILE_CONTEXT_MAX_FILE_SIZE:
+            return (), ()
+
+        with open(path, "r", errors="replace") as f:
+            lines = [
+                line.rstrip("\r\n")[:FILE_CONTEXT_MAX_LINE_LENGTH]
+                for line in islice(f, FILE_CONTEXT_LINES)
+            ]
+    except (OSError, IOError):
+        return (), ()
+
+    return tuple(lines[:1]), tuple(lines[2:])
+
+
 def dbt_to_log_status(status: NodeStatus, resource_type: T.Optional[str] = None):
     status_mapper = {
         NodeStatus.Success: logbook.INFO,
@@ -75,7 +135,7 @@ class SentryHandler(logbook.Handler):
             return
 
         client_options = hub.client.options
-        trace = record.kwargs.pop("trace", None)
+        trace = record.kwargs.get("trace", None)
 
         # exc_info might be None or (None, None, None)
         if record.exc_info is not None and record.exc_info[0] is not None:
@@ -104,10 +164,8 @@ class SentryHandler(logbook.Handler):
             hint = {}
 
         if trace:
-            context = record.kwargs.pop("context", {})
-            pre_context, context_line, post_context = get_lines_from_file(
-                context.get("abs_path", None), 1
-            )
+            context = record.kwargs.get("context", {})
+            pre_context, post_context = get_file_context(context.get("abs_path", None))
             event["exception"] = {
                 "type": to_string(record.msg),
                 "value": trace,
@@ -116,9 +174,9 @@ class SentryHandler(logbook.Handler):
                         {
                             "function": "run",
                             "module": "dbt",
-                            "pre_context": pre_context,
+                            "pre_context": list(pre_context),
                             "context_line": to_string(trace),
-                            "post_context": post_context,
+                            "post_context": list(post_context),
                             "abs_path": context.get("abs_path", None),
                             "filename": context.get("filename", None),
                             "lineno": 1,
@@ -130,6 +188,11 @@ class SentryHandler(logbook.Handler):
 
         hint["log_record"] = record
 
+        # tags are scoped to this event instead of mutating the global scope
+        tags = record.extra["tags"]
+        if tags:
+            event["tags"] = {key: str(val) for key, val in tags.items()}
+
         event["level"] = logbook.get_level_name(record.level).lower()
         event["type"] = logbook.get_level_name(record.level).lower()
         event["logger"] = record.channel
@@ -145,6 +208,102 @@ class SentryHandler(logbook.Handler):
         hub.capture_event(event, hint=hint)
 
 
+class JsonHandler(logbook.Handler):
+    """Writes records as JSON lines through a large buffered stream.
+
+    The buffer is flushed for records at or above `flush_level` and on close, which
+    is registered to run at exit. With `background` set, serialized lines are handed
+    to a writer thread so logging never blocks on the stream.
+
+    Without a path, records go through ``sys.stdout`` itself. dbt prints to the same
+    stream, so its pending output is flushed first and every record is flushed after,
+    which keeps JSON lines in order with dbt's own lines.
+    """
+
+    _stop = object()
+
+    def __init__(
+        self,
+        path: T.Optional[str] = None,
+        level: int = logbook.NOTSET,
+        buffer_size: int = JSON_LOG_BUFFER_SIZE,
+        flush_level: int = logbook.WARNING,
+        background: bool = False,
+        stream: T.Optional[T.BinaryIO] = None,
+        **kwargs,
+    ):
+        super().__init__(level=level, **kwargs)
+        self.flush_level = flush_level
+        self.closed = False
+        self._owns_stream = stream is None and bool(path)
+        self._stdout = sys.stdout if stream is None and not path else None
+        if stream is not None:
+            self.stream = stream
+        elif path:
+            self.stream = io.open(path, "ab", buffering=buffer_size)
+        else:
+            self.stream = sys.stdout.buffer
+
+        self._queue = None
+        self._thread = None
+        if background:
+            self._queue = queue.Queue()
+            self._thread = threading.Thread(target=self._writer, name="pydbt-json-log", daemon=True)
+            self._thread.start()
+
+        atexit.register(self.close)
+
+    @staticmethod
+    def serialize(record: logbook.LogRecord) -> bytes:
+        data = {
+            "time": record.time.isoformat(),
+            "level": record.level_name.lower(),
+            "logger": record.channel,
+            "message": to_string(record.msg),
+            **record.kwargs,
+            "tags": record.extra["tags"] or {},
+        }
+        if record.exc_info:
+            data["exception"] = record.formatted_exception
+
+        return json_dumps(data) + b"\n"
+
+    def _write(self, line: bytes, flush: bool):
+        if self._stdout is not None:
+            self._stdout.flush()
+        self.stream.write(line)
+        if flush or self._stdout is not None:
+            self.stream.flush()
+
+    def _writer(self):
+        while True:
+            item = self._queue.get()
+            if item is self._stop:
+                break
+            self._write(*item)
+
+    def emit(self, record):
+        line = self.serialize(record)
+        flush = record.level >= self.flush_level
+        if self._queue is not None:
+            self._queue.put((line, flush))
+        else:
+            self._write(line, flush)
+
+    def close(self):
+        if self.closed:
+            return
+
+        self.closed = True
+        if self._thread is not None:
+            self._queue.put(self._stop)
+            self._thread.join()
+
+        self.stream.flush()
+        if self._owns_stream:
+            self.stream.close()
+
+
 class FormatMessage(logbook.Processor):
     def process(self, record):
         ansi_escape = re.compile(
@@ -184,19 +343,24 @@ class LogManager(logbook.NestedSetup):
         )
 
     def format_json(self):
-        for handler in self.objects:
-            if hasattr(handler, "format_json"):
-                handler.format_json()
+        """Writes structured JSON lines for every record, must be called before binding."""
+        self._json_handler = JsonHandler(
+            path=JSON_LOG_FILE,
+            level=logbook.lookup_level(LOG_LEVEL.upper()),
+            background=JSON_LOG_BACKGROUND,
+            bubble=True,
+        )
+        self.objects.insert(1, self._json_handler)
 
 
 class AppendTags(logbook.Processor):
     def __init__(self, tags: T.Dict):
         self.tags = tags
-        set_sentry_tags(tags)
         super().__init__()
 
     def process(self, record):
-        record.extra["tags"] = self.tags
+        # processors run innermost first, keep the most specific tags
+        record.extra["tags"] = {**self.tags, **(record.extra["tags"] or {})}
 
 
 class CleanMessage(logbook.Processor):
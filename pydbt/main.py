@@ -1,17 +1,35 @@
+import os
 import sys
 import time
+import functools
+import contextlib
 import http
 import dbt.main
 import sentry_sdk
 import typing as T
-from . import dbt_version
+from . import dbt_version, IMPORT_STARTED
 from .types import Message
-from .handlers import alert, monitor
+from .config import LOG_FORMAT, ASYNC_SINKS, SINK_CONCURRENCY, PROGRESS_INTERVAL
+from .handlers import alert, monitor, hook, export
+from .cache.history import execution_times
+from .commands.retry import RetryState, RETRY_COMMAND
+from .commands.diff import DIFF_COMMAND, load_nodes, diff_nodes, format_table, format_diff
+from .commands.shard import SHARD_COMMAND, MERGE_COMMAND, parse_shard_args, shard_paths, merge_results, clear_shards
 from multiprocessing import cpu_count
-from .parsers.formatter import Formatter
+from .parsers.stream import iter_results, iter_messages
+from .parsers.sampler import Sampler
+from .utils.profiler import Profiler
+from .utils.progress import ProgressReporter
+from .utils.selection import clear_selection_filters
+from .utils.shutdown import Shutdown
+from .utils.sinks import Sinks, AsyncSinks
+from .utils.tools import parse_mapping
 from dbt.contracts.results import RunExecutionResult
 from .logger import GLOBAL_LOGGER as log, LogManager, AppendTags
 
+PROFILE_FLAG = "--profile"
+DEFAULT_PROFILE_PATH = "pydbt.prof"
+
 
 # Hack to silence TCPServer logs
 class QuietHandler(http.server.SimpleHTTPRequestHandler):
@@ -23,30 +41,104 @@ dbt.main.dbt.task.serve.SimpleHTTPRequestHandler = QuietHandler
 # end hack to silence TCPServer logs
 
 
-def run(command: T.List, tags: T.Dict):
-    start = time.time()
+def log_message(msg: Message, tags: T.Dict):
+    with AppendTags({**msg.context, **tags}):
+        log.log(
+            msg.level,
+            msg.message,
+            trace=msg.error,
+            context=msg.context,
+        )
+
+
+def init_sinks(alerting, stats, exporter, profiler: Profiler, tags: T.Dict) -> Sinks:
+    sinks = AsyncSinks(profiler) if ASYNC_SINKS else Sinks(profiler)
+    concurrency = parse_mapping(SINK_CONCURRENCY, int)
+
+    sinks.add("alerting", alerting.alert, concurrency.get("alerting", 1))
+    sinks.add("export", exporter.export, concurrency.get("export", 1))
+    sinks.add("monitor", stats.report, concurrency.get("monitor", 1))
+    # a single log worker keeps records in order
+    sinks.add("log", functools.partial(log_message, tags=tags))
+    return sinks
+
+
+def report_progress(msg: Message, stats, tags: T.Dict):
+    # progress is reported while dbt runs, before any result reaches the sinks
+    stats.report(msg)
+    stats.flush()
+    log_message(msg, tags)
+
+
+def init_progress(command: T.List[str], stats, tags: T.Dict) -> T.ContextManager:
+    if not PROGRESS_INTERVAL or not ProgressReporter.applies_to(command):
+        return contextlib.nullcontext()
+    return ProgressReporter(command, functools.partial(report_progress, stats=stats, tags=tags), execution_times())
+
+
+def report(msg: Message, sinks: Sinks, sampler: Sampler, profiler: Profiler):
+    # alerting and exports see every message, sampling only applies to logs and metrics
+    sinks.submit("alerting", msg)
+    sinks.submit("export", msg)
+
+    with profiler.phase("sample"):
+        msg = sampler.sample(msg)
+    if msg is None:
+        return
+
+    sinks.submit("monitor", msg)
+    sinks.submit("log", msg)
+
+
+def cleanup(name: str, step: T.Callable[[], T.Any]):
+    """Runs a step of the end of a run, a failing step is logged so it never replaces the exit of the run."""
+    try:
+        step()
+    except Exception as err:
+        log.error(f"Failed to {name}: {err}")
+
+
+def run(command: T.List, tags: T.Dict, profiler: Profiler, shard: T.Optional[T.Tuple[int, int]] = None):
+    stats, sinks, hooks = None, None, []
+    shutdown = Shutdown()
+    shutdown.register("sentry", sentry_sdk.flush)
     try:
         # Initialize stats and alerting
-        alerting = alert.init()
-        stats = monitor.init(common_tags=tags)
+        with profiler.phase("setup"):
+            alerting = alert.init()
+            shutdown.register("alerting", alerting.flush, alerting.pending)
+            stats = monitor.init(command=command, common_tags=tags)
+            shutdown.register("monitor", stats.flush)
+            exporter = export.init(command=tags["command"])
+            shutdown.register("export", exporter.flush)
+            sampler = Sampler()
+            sinks = init_sinks(alerting, stats, exporter, profiler, tags)
+
+            hooks = hook.init(command, shard)
+            for run_hook in hooks:
+                command = run_hook.prepare(command)
 
-        @stats.timed("dbt.command.time", sample_rate=0.5)
-        def run_command(cmd: T.List):
-            return dbt.main.handle_and_check(cmd)
+            progress = init_progress(command, stats, tags)
 
         res: RunExecutionResult
-        res, success = run_command(command)
-        for idx, result in enumerate(res.results):
-            msg: Message = Formatter.format(result)
-            stats.report(msg)
-            alerting.alert(msg)
-            with AppendTags({**msg.context, **tags}):
-                log.log(
-                    msg.level,
-                    msg.message,
-                    trace=msg.error,
-                    context=msg.context,
-                )
+        with profiler.phase("dbt"), progress:
+            res, success = dbt.main.handle_and_check(command)
+
+        profiler.start_profile()
+        messages = profiler.timed_iter("format", iter_messages(iter_results(res), hooks))
+        for msg in messages:
+            report(msg, sinks, sampler, profiler)
+
+        for run_hook in hooks:
+            with profiler.phase("finalize"):
+                finalized = run_hook.finalize(success)
+            for msg in finalized:
+                report(msg, sinks, sampler, profiler)
+
+        if sampler.enabled:
+            log.info(f"Sampled out {sampler.dropped} success message(s).")
+            stats.report_nodes(sampler.totals)
+            stats.report_dropped_rows(sampler.dropped_rows)
 
         return sys.exit(0 if success else 1)
 
@@ -55,22 +147,119 @@ def run(command: T.List, tags: T.Dict):
         sentry_sdk.capture_exception(err)
         return sys.exit(1)
     finally:
-        stats.timing("dbt.command.time", time.time() - start)
+        for run_hook in hooks:
+            cleanup(f"close {type(run_hook).__name__}", run_hook.close)
+        # dbt's node selection is patched process wide while hooks filter it
+        cleanup("restore dbt's node selection", clear_selection_filters)
+        cleanup("write the profile", profiler.stop_profile)
+        if sinks is not None:
+            cleanup("drain the sinks", functools.partial(shutdown.drain, sinks.close))
+            cleanup("report sink stats", functools.partial(stats.report_sinks, sinks.stats))
+
+        if stats is not None and "dbt" in profiler.phases:
+            # also reported when dbt raised
+            cleanup("report the command time", functools.partial(stats.report_command_time, profiler.phases["dbt"]))
+
+        if stats is not None:
+            cleanup("report phase timing", functools.partial(profiler.report, stats))
+
+        # flushes every sink within the deadline, the exit code is already decided
+        shutdown.run()
+
+
+def report_local(command: T.Callable[[], T.Tuple[T.List[Message], bool]], tags: T.Dict):
+    """Reports the messages of a pydbt command that does not run dbt."""
+    shutdown = Shutdown()
+    try:
+        messages, success = command()
+
+        alerting = alert.init()
+        shutdown.register("alerting", alerting.flush, alerting.pending)
+        stats = monitor.init(common_tags=tags)
+        shutdown.register("monitor", stats.flush)
+        for msg in messages:
+            alerting.alert(msg)
+            stats.report(msg)
+            log_message(msg, tags)
+
+        return sys.exit(0 if success else 1)
+
+    except Exception as err:
+        log.error(err)
+        return sys.exit(1)
+    finally:
+        shutdown.run()
+
+
+def diff(args: T.List[str]) -> T.Tuple[T.List[Message], bool]:
+    before, after = (args + ["previous", "last"][len(args):])[:2]
+    result = diff_nodes(load_nodes(before), load_nodes(after))
+    sys.stdout.write(format_table(result))
+    return [format_diff(result, before, after)], True
+
+
+def merge(args: T.List[str]) -> T.Tuple[T.List[Message], bool]:
+    paths = args or shard_paths()
+    if not paths:
+        raise ValueError("No shard results found to merge.")
+
+    log.info(f"Merging the results of {len(paths)} shard(s).")
+    messages, success = merge_results(paths)
+    # merged shards are stored as a run, stale shard files would be merged into the next run
+    stored = {os.path.abspath(path) for path in shard_paths()}
+    clear_shards([path for path in paths if os.path.abspath(path) in stored])
+    return messages, success
+
+
+def parse_profile_flag(args: T.List[str]) -> T.Tuple[T.Optional[str], T.List[str]]:
+    """Splits a leading `--profile[=path]` off the command, dbt uses `--profile` after the subcommand."""
+    if args and args[0].split("=", 1)[0] == PROFILE_FLAG:
+        _, _, path = args[0].partition("=")
+        return path or DEFAULT_PROFILE_PATH, args[1:]
+    return None, args
 
 
 def main(args: T.List):
-    command = args[1:]
+    imports = time.perf_counter() - IMPORT_STARTED
+    profile_path, command = parse_profile_flag(args[1:])
+
+    profiler = Profiler(profile_path)
+    profiler.add("imports", imports)
+    retrying = bool(command) and command[0] == RETRY_COMMAND
+    if retrying:
+        command = RetryState.load().build_command(command[1:])
+
+    shard = None
+    if command and command[0] == SHARD_COMMAND:
+        try:
+            total, index, command = parse_shard_args(command[1:])
+        except ValueError as err:
+            sys.stderr.write(f"{err}\n")
+            return sys.exit(2)
+        shard = (total, index)
+
     tags = {
         "app": "dbt",
-        "command": command[0],
+        "command": command[0] if command else RETRY_COMMAND,
         "version": dbt_version,
         "number_of_cores": cpu_count(),
     }
 
     log_manager = LogManager(tags=tags)
-    log_manager.format_json()
+    if LOG_FORMAT == "json":
+        log_manager.format_json()
 
     with log_manager.applicationbound():
+        if retrying and not command:
+            log.info("Nothing to retry, no recorded run left failed, errored or skipped nodes.")
+            return sys.exit(0)
+
+        if command and command[0] == DIFF_COMMAND:
+            return report_local(functools.partial(diff, command[1:]), tags)
+
+        if command and command[0] == MERGE_COMMAND:
+            return report_local(functools.partial(merge, command[1:]), tags)
+
         log.info("Starting dbt run")
         with AppendTags(tags).applicationbound():
-            return run(command, tags)
+            return run(command, tags, profiler, shard)
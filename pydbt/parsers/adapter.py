@@ -0,0 +1,63 @@
+import typing as T
+
+from ..types import AdapterStats
+
+
+def _to_int(value) -> T.Optional[int]:
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_default(response: T.Dict) -> AdapterStats:
+    # postgres, redshift and most sql adapters only report a status code
+    return AdapterStats(adapter="sql", code=response.get("code"))
+
+
+def _parse_bigquery(response: T.Dict) -> AdapterStats:
+    return AdapterStats(
+        adapter="bigquery",
+        code=response.get("code"),
+        query_id=response.get("job_id"),
+        bytes_processed=_to_int(response.get("bytes_processed")),
+        bytes_billed=_to_int(response.get("bytes_billed")),
+        slot_ms=_to_int(response.get("slot_ms")),
+    )
+
+
+def _parse_snowflake(response: T.Dict) -> AdapterStats:
+    return AdapterStats(
+        adapter="snowflake",
+        code=response.get("code"),
+        query_id=response.get("query_id"),
+    )
+
+
+# adapters are recognised by the keys only their response contains
+SIGNATURES: T.Tuple[T.Tuple[str, T.Tuple[str, ...]], ...] = (
+    ("bigquery", ("bytes_processed", "job_id")),
+    ("snowflake", ("query_id",)),
+)
+
+EXTRACTORS: T.Dict[str, T.Callable[[T.Dict], AdapterStats]] = {
+    "bigquery": _parse_bigquery,
+    "snowflake": _parse_snowflake,
+    "sql": _parse_default,
+}
+
+
+def detect_adapter(response: T.Dict) -> str:
+    for adapter, keys in SIGNATURES:
+        if any(key in response for key in keys):
+            return adapter
+    return "sql"
+
+
+def parse_adapter_response(response: T.Optional[T.Dict]) -> T.Tuple[T.Optional[int], T.Optional[AdapterStats]]:
+    """Normalizes an adapter response into the rows affected and adapter specific stats."""
+    if not response:
+        return None, None
+
+    extractor = EXTRACTORS[detect_adapter(response)]
+    return _to_int(response.get("rows_affected")), extractor(response)
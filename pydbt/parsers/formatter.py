@@ -1,3 +1,5 @@
+import logbook
+import typing as T
 from dataclasses import asdict
 from dbt.node_types import NodeType
 from dbt.contracts.results import (
@@ -7,10 +9,12 @@ from dbt.contracts.results import (
     NodeResult,
 )
 
-from .node import parse_node
+from .node import parse_node, get_seed_path
+from .adapter import parse_adapter_response
+from .templates import TEMPLATES, Fields
 from ..logger import dbt_to_log_status
 from ..types import Freshness, Message, Reporting
-from ..utils.tools import freshness_age_to_unit, get_full_db_id
+from ..utils.tools import freshness_age_to_unit, get_full_db_id, get_file_size
 
 
 class Formatter:
@@ -30,41 +34,33 @@ class Formatter:
 
     @classmethod
     def _get_reporting(cls, result: NodeResult) -> Reporting:
-        rows, freshness = None, None
+        rows, adapter, freshness = None, None, None
         if isinstance(result, SourceFreshnessResult):
             freshness = cls._get_freshness(result)
 
         if isinstance(result, RunResult):
-            rows = result.adapter_response.get("rows_affected", None)
+            rows, adapter = parse_adapter_response(result.adapter_response)
 
         return Reporting(
             rows=rows,
             freshness=freshness,
             timing=result.timing,
             execution_time=result.execution_time,
+            adapter=adapter,
         )
 
     @classmethod
     def _get_source_components(cls, result: SourceFreshnessResult) -> Message:
         reporting = cls._get_reporting(result)
+        fields = Fields(result, reporting)
         freshness = reporting.freshness
 
         is_error = result.status in (NodeStatus.Error or NodeStatus.RuntimeErr)
         is_warning = result.status == NodeStatus.Warn
 
-        db_id = get_full_db_id(
-            result.node.database, result.node.schema, result.node.name
-        )
-
-        title_id = "out of date" if (is_error or is_warning) else "up to date"
-        title = f"Source freshness {title_id}."
-
         error = None
-        message = f"Source `{db_id}` is up to date"
         if is_error or is_warning:
             modifier = "failure" if is_error else "warning"
-            message = f"Source `{db_id}` is out of date, {modifier} threshold exceeded"
-
             error = (
                 f"Freshness of {freshness.age} {freshness.unit}(s) exceeded the"
                 + f" {modifier} threshold of {freshness.threshold} {freshness.unit}(s)"
@@ -73,8 +69,8 @@ class Formatter:
         error = result.message if result.message else error
 
         return Message(
-            title=title,
-            message=message,
+            title=TEMPLATES.render("title", NodeType.Source, fields),
+            message=TEMPLATES.render("message", NodeType.Source, fields),
             error=error,
             reporting=reporting,
             context={**parse_node(result), **asdict(freshness)},
@@ -84,17 +80,11 @@ class Formatter:
     @classmethod
     def _get_model_components(cls, result: RunResult) -> Message:
         reporting = cls._get_reporting(result)
-
-        depends_on = ", ".join(set(result.node.depends_on.nodes)).upper()
-        title = f"{result.node.config.materialized.capitalize()} model {result.status}."
-        target = get_full_db_id(
-            result.node.database, result.node.schema, result.node.name
-        )
-        message = f"*[{result.status.upper()}]* model `{target}` that depends on `{depends_on}`"
+        fields = Fields(result, reporting)
 
         return Message(
-            title=title,
-            message=message,
+            title=TEMPLATES.render("title", NodeType.Model, fields),
+            message=TEMPLATES.render("message", NodeType.Model, fields),
             error=result.message,
             reporting=reporting,
             context=parse_node(result),
@@ -104,21 +94,15 @@ class Formatter:
     @classmethod
     def _get_test_components(cls, result: RunResult) -> Message:
         reporting = cls._get_reporting(result)
+        fields = Fields(result, reporting)
 
         error = None
-        test_name = result.node.name
-        test_database = result.node.database
-        title = f"[{result.status.upper()}] Test {test_name}"
-        message = (
-            f"*[{result.status.upper()}]* Test {test_name} in `{test_database.upper()}`"
-        )
-
         if result.status in (NodeStatus.Warn, NodeStatus.Fail, NodeStatus.Error):
             error = f"Got {result.message} results, expected 0"
 
         return Message(
-            title=title,
-            message=message,
+            title=TEMPLATES.render("title", NodeType.Test, fields),
+            message=TEMPLATES.render("message", NodeType.Test, fields),
             error=error,
             reporting=reporting,
             context=parse_node(result),
@@ -128,24 +112,74 @@ class Formatter:
     @classmethod
     def _get_snapshot_components(cls, result: RunResult) -> Message:
         reporting = cls._get_reporting(result)
-        target = get_full_db_id(
-            result.node.database, result.node.schema, result.node.name
+        fields = Fields(result, reporting)
+
+        return Message(
+            title=TEMPLATES.render("title", NodeType.Snapshot, fields),
+            message=TEMPLATES.render("message", NodeType.Snapshot, fields),
+            error=result.message,
+            reporting=reporting,
+            context=parse_node(result),
+            level=dbt_to_log_status(result.status),
         )
 
-        is_error = result.status in (NodeStatus.Error, NodeStatus.Skipped)
+    @classmethod
+    def _get_seed_components(cls, result: RunResult) -> Message:
+        reporting = cls._get_reporting(result)
+        reporting.file_size = get_file_size(get_seed_path(result.node))
+        fields = Fields(result, reporting)
 
-        title = f'Snapshot {"failed" if is_error else "completed"}'
-        message = f"*[{result.status.upper()}]* snapshot with target `{target}`"
+        is_error = result.status in (NodeStatus.Error, NodeStatus.Skipped)
 
         return Message(
-            title=title,
-            message=message,
-            error=result.message,
+            title=TEMPLATES.render("title", NodeType.Seed, fields),
+            message=TEMPLATES.render("message", NodeType.Seed, fields),
+            error=result.message if is_error else None,
             reporting=reporting,
             context=parse_node(result),
             level=dbt_to_log_status(result.status),
         )
 
+    @classmethod
+    def format_seed_reload(cls, context: T.Dict, reload_time: float) -> Message:
+        target = get_full_db_id(context["database"], context["schema"], context["name"])
+        message = f"*[UNCHANGED]* seed `{target}` was fully reloaded in {reload_time:.1f}s, its file did not change"
+
+        return Message(
+            title="Seed reloaded unchanged.",
+            message=message,
+            error=None,
+            reporting=Reporting(
+                rows=None,
+                execution_time=0.0,
+                timing=[],
+                freshness=None,
+                reload_time=reload_time,
+            ),
+            context=context,
+            level=logbook.INFO,
+        )
+
+    @classmethod
+    def format_unchanged(cls, context: T.Dict, saved_time: T.Optional[float] = None) -> Message:
+        target = get_full_db_id(context["database"], context["schema"], context["name"])
+
+        return Message(
+            title=f"{context['materialized'].capitalize()} model unchanged.",
+            message=f"*[UNCHANGED]* model `{target}` skipped, upstream sources have no new data",
+            error=None,
+            reporting=Reporting(
+                rows=None,
+                execution_time=0.0,
+                timing=[],
+                freshness=None,
+                cached=True,
+                saved_time=saved_time,
+            ),
+            context=context,
+            level=logbook.INFO,
+        )
+
     @classmethod
     def format(cls, result: NodeResult) -> Message:
         resource_type = result.node.resource_type
@@ -154,5 +188,6 @@ class Formatter:
             NodeType.Model: cls._get_model_components,
             NodeType.Test: cls._get_test_components,
             NodeType.Snapshot: cls._get_snapshot_components,
+            NodeType.Seed: cls._get_seed_components,
         }
         return switcher.get(resource_type, cls._get_model_components)(result)
@@ -1,9 +1,11 @@
+import os
 import typing as T
 
 from dbt.contracts.results import NodeResult
 from dbt.contracts.graph.parsed import (
     ParsedNode,
     ParsedSourceDefinition,
+    ParsedSeedNode,
     SeedConfig,
     TestConfig,
     NodeConfig,
@@ -32,6 +34,11 @@ def _parse_node(node: ParsedNode) -> T.Dict:
     if node.tags:
         parsed["tags"] = ", ".join(node.tags).lower()
 
+    # used to route alerts to the owning team
+    owner = node.meta.get("owner") if node.meta else None
+    if owner:
+        parsed["owner"] = str(owner).lower()
+
     return parsed
 
 
@@ -49,9 +56,10 @@ def _parse_parsed_source_node(node: ParsedSourceDefinition) -> T.Dict:
     return parsed
 
 
-# TO DO, not important
 def _parse_seed_node_config(config: SeedConfig) -> T.Dict:
-    return {}
+    return dict(
+        materialized=config.materialized.lower(),
+    )
 
 
 def _parse_test_node_config(config: TestConfig) -> T.Dict:
@@ -79,8 +87,18 @@ def _parse_node_config(config: NodeConfig) -> T.Dict:
     )
 
 
-def parse_node(result: NodeResult) -> T.Dict:
-    node = result.node
+def get_node_selector(node: ParsedNode) -> str:
+    # dbt 1.0 has no unique_id selection method, the fqn is the closest equivalent
+    if isinstance(node, ParsedSourceDefinition):
+        return f"source:{node.package_name}.{node.source_name}.{node.name}"
+    return "fqn:" + ".".join(node.fqn)
+
+
+def get_seed_path(node: ParsedSeedNode) -> str:
+    return os.path.join(node.root_path, node.original_file_path)
+
+
+def parse_graph_node(node: ParsedNode) -> T.Dict:
     config = {}
 
     log.info(type(node))
@@ -93,7 +111,8 @@ def parse_node(result: NodeResult) -> T.Dict:
         return parsed_node
 
     parsed_node = _parse_parsed_node(node)
-    if isinstance(node, CompiledSeedNode):
+    # dbt does not compile seeds, results hold the parsed node
+    if isinstance(node, (ParsedSeedNode, CompiledSeedNode)):
         log.debug("parsing seed node config")
         config = _parse_seed_node_config(node.config)
     elif isinstance(node, CompiledGenericTestNode):
@@ -107,3 +126,7 @@ def parse_node(result: NodeResult) -> T.Dict:
         config = _parse_node_config(node.config)
 
     return {**parsed_node, **config}
+
+
+def parse_node(result: NodeResult) -> T.Dict:
+    return parse_graph_node(result.node)
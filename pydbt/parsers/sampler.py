@@ -0,0 +1,88 @@
+import zlib
+import logbook
+import typing as T
+from collections import Counter
+from dataclasses import replace
+
+from ..types import Message
+from ..utils.tools import parse_mapping
+from ..config import SAMPLE_RATE, SAMPLE_RATES, SAMPLE_SLOW_THRESHOLD
+
+
+def parse_rates(rates: T.Optional[str]) -> T.Dict[str, float]:
+    """Parses per resource type rates formatted as `model=0.1,test=0.01`."""
+    return parse_mapping(rates, float)
+
+
+class Sampler:
+    """Samples success level messages before they are logged and reported.
+
+    Warnings, errors, cached results, run and parse summaries, thread recommendations,
+    unchanged seed reloads and nodes slower than the slow threshold are always
+    kept. Other messages are kept at the rate of their resource type, decided by a hash of
+    the node so the same nodes are sampled on every run. Kept messages carry their sample
+    rate so monitors can scale counters, and every message is counted so exact totals can
+    be reported at the end of the run.
+
+    The sampled nodes are a fixed subset, so scaling their rows up would carry the bias of
+    that subset into every run. The rows of dropped messages are summed instead and
+    reported exactly at the end of the run.
+    """
+
+    def __init__(
+        self,
+        rate: float = SAMPLE_RATE,
+        rates: T.Optional[T.Dict[str, float]] = None,
+        slow_threshold: float = SAMPLE_SLOW_THRESHOLD,
+    ):
+        self.rate = rate
+        self.rates = parse_rates(SAMPLE_RATES) if rates is None else rates
+        self.slow_threshold = slow_threshold
+        self.totals: T.Counter[T.Tuple[str, str]] = Counter()
+        self.dropped = 0
+        self.dropped_rows: T.Counter[str] = Counter()
+
+    @property
+    def enabled(self) -> bool:
+        return self.rate < 1 or any(rate < 1 for rate in self.rates.values())
+
+    @staticmethod
+    def _get_key(msg: Message) -> str:
+        ctx = msg.context
+        return ".".join(str(ctx.get(k)) for k in ("resource_type", "package_name", "database", "schema", "name"))
+
+    def get_rate(self, msg: Message) -> float:
+        if msg.level > logbook.INFO:
+            return 1.0
+
+        reporting = msg.reporting
+        # findings reported once per run, dropping them loses the finding instead of a sample
+        if reporting and (
+            reporting.cached or reporting.summary or reporting.parse or reporting.threads or reporting.reload_time
+        ):
+            return 1.0
+
+        if reporting and (reporting.execution_time or 0) >= self.slow_threshold:
+            return 1.0
+
+        return self.rates.get(msg.context.get("resource_type"), self.rate)
+
+    def sample(self, msg: Message) -> T.Optional[Message]:
+        """Returns the message to report, or None when it was sampled out."""
+        self.totals[(msg.context.get("resource_type", "unknown"), logbook.get_level_name(msg.level).lower())] += 1
+
+        rate = self.get_rate(msg)
+        if rate >= 1:
+            return msg
+
+        # crc32 is stable across processes unlike hash()
+        if zlib.crc32(self._get_key(msg).encode("utf-8")) / 2 ** 32 >= rate:
+            self.dropped += 1
+            if msg.reporting and msg.reporting.rows:
+                self.dropped_rows[msg.context.get("resource_type", "unknown")] += msg.reporting.rows
+            return None
+
+        if msg.reporting is None:
+            return msg
+
+        return replace(msg, reporting=replace(msg.reporting, sample_rate=rate))
@@ -0,0 +1,36 @@
+import typing as T
+from dbt.contracts.results import NodeResult, RunExecutionResult
+
+from .formatter import Formatter
+from ..types import Message
+
+
+def iter_results(res: RunExecutionResult) -> T.Iterator[NodeResult]:
+    """Yields the results of a run, releasing each one once it has been consumed.
+
+    Results hold the full node including its raw and compiled SQL. Draining them
+    from the execution result lets every node be garbage collected as soon as it
+    has been reported instead of at the end of the run.
+    """
+    results = list(res.results)
+    res.results = []
+    results.reverse()
+
+    while results:
+        yield results.pop()
+
+
+def iter_messages(results: T.Iterable[NodeResult], hooks: T.Sequence = ()) -> T.Iterator[Message]:
+    """Formats results into messages, giving hooks a look at the result before it is dropped.
+
+    Every hook records the result, a message held back by any hook is not yielded.
+    """
+    for result in results:
+        msg = Formatter.format(result)
+        for hook in hooks:
+            hook.record(result, msg)
+
+        suppressed = any(hook.suppresses(result) for hook in hooks)
+        del result
+        if not suppressed:
+            yield msg
@@ -0,0 +1,198 @@
+import string
+import typing as T
+from dbt.clients.system import load_file_contents
+from dbt.clients.yaml_helper import load_yaml_text
+from dbt.contracts.results import NodeResult, NodeStatus
+
+from ..types import Reporting
+from ..config import MESSAGE_TEMPLATES, MESSAGE_LIST_LIMIT
+from ..utils.tools import get_full_db_id, format_bytes
+
+PARTS = ("title", "message")
+FILTERS: T.Dict[str, T.Callable[[str], str]] = {
+    "upper": str.upper,
+    "lower": str.lower,
+    "capitalize": str.capitalize,
+}
+
+# Templates per resource type, `<resource_type>.<status>` overrides a part for a single status
+DEFAULT_TEMPLATES: T.Dict[str, T.Dict[str, str]] = {
+    "source": {
+        "title": "Source freshness up to date.",
+        "message": "Source `{target}` is up to date",
+    },
+    "source.warn": {
+        "title": "Source freshness out of date.",
+        "message": "Source `{target}` is out of date, warning threshold exceeded",
+    },
+    "source.error": {
+        "title": "Source freshness out of date.",
+        "message": "Source `{target}` is out of date, failure threshold exceeded",
+    },
+    "model": {
+        "title": "{materialized|capitalize} model {status}.",
+        "message": "*[{status|upper}]* model `{target}` that depends on `{depends_on|upper}`",
+    },
+    "test": {
+        "title": "[{status|upper}] Test {name}",
+        "message": "*[{status|upper}]* Test {name} in `{database|upper}`",
+    },
+    "snapshot": {
+        "title": "Snapshot completed",
+        "message": "*[{status|upper}]* snapshot with target `{target}`",
+    },
+    "snapshot.error": {"title": "Snapshot failed"},
+    "snapshot.skipped": {"title": "Snapshot failed"},
+    "seed": {
+        "title": "Seed loaded.",
+        "message": "*[{status|upper}]* seed `{target}`{load_summary}",
+    },
+    "seed.error": {"title": "Seed failed."},
+    "seed.skipped": {"title": "Seed failed."},
+}
+
+
+def _load_summary(result: NodeResult, reporting: Reporting) -> str:
+    if result.status in (NodeStatus.Error, NodeStatus.Skipped) or reporting.rows is None:
+        return ""
+
+    size = f" ({format_bytes(reporting.file_size)})" if reporting.file_size is not None else ""
+    summary = f" loaded {reporting.rows} rows{size} in {reporting.execution_time:.1f}s"
+    if reporting.execution_time:
+        summary += f", {reporting.rows / reporting.execution_time:.0f} rows/s"
+    return summary
+
+
+FIELDS: T.Dict[str, T.Callable[[NodeResult, Reporting], T.Any]] = {
+    "name": lambda result, reporting: result.node.name,
+    "database": lambda result, reporting: result.node.database,
+    "schema": lambda result, reporting: result.node.schema,
+    "status": lambda result, reporting: result.status,
+    "materialized": lambda result, reporting: result.node.config.materialized,
+    "target": lambda result, reporting: get_full_db_id(result.node.database, result.node.schema, result.node.name),
+    "depends_on": lambda result, reporting: sorted(set(result.node.depends_on.nodes)),
+    "execution_time": lambda result, reporting: reporting.execution_time,
+    "rows": lambda result, reporting: reporting.rows,
+    "age": lambda result, reporting: reporting.freshness.age,
+    "unit": lambda result, reporting: reporting.freshness.unit,
+    "threshold": lambda result, reporting: reporting.freshness.threshold,
+    "load_summary": _load_summary,
+}
+
+
+# Fields that only exist on some resource types, sources have no parents or materialization
+# and only sources have freshness
+RESOURCE_FIELDS: T.Dict[str, T.Set[str]] = {
+    "freshness": {"age", "unit", "threshold"},
+    "node": {"depends_on", "materialized"},
+}
+
+
+def get_fields(resource_type: str) -> T.Set[str]:
+    """Returns the fields available to templates of a resource type."""
+    excluded = RESOURCE_FIELDS["node"] if resource_type == "source" else RESOURCE_FIELDS["freshness"]
+    return set(FIELDS) - excluded
+
+
+class Fields:
+    """Values available to templates, each one is only computed when a template renders it."""
+
+    def __init__(self, result: NodeResult, reporting: Reporting):
+        self.result = result
+        self.reporting = reporting
+        self.values: T.Dict[str, T.Any] = {}
+
+    def __getitem__(self, name: str) -> T.Any:
+        if name not in self.values:
+            self.values[name] = FIELDS[name](self.result, self.reporting)
+        return self.values[name]
+
+
+def format_list(items: T.List[str], limit: int, noun: str = "nodes", total: T.Optional[int] = None) -> str:
+    """Joins at most `limit` items, `total` counts items the caller did not materialize."""
+    total = len(items) if total is None else total
+    if total <= limit:
+        return ", ".join(items)
+    return f"{total} {noun}, first {limit}: {', '.join(items[:limit])}"
+
+
+class Template:
+    """A message template compiled into literal text and field lookups.
+
+    Fields use `str.format` syntax with optional filters, e.g. `{status|upper}` or
+    `{execution_time:.1f}`. Lists are rendered up to `list_limit` items.
+    """
+
+    def __init__(self, source: str, list_limit: int = MESSAGE_LIST_LIMIT, fields: T.Optional[T.Set[str]] = None):
+        self.source = source
+        self.list_limit = list_limit
+        self.parts: T.List[T.Tuple[str, T.Optional[str], T.List[T.Callable], str]] = []
+
+        for literal, field, spec, conversion in string.Formatter().parse(source):
+            if field is None:
+                self.parts.append((literal, None, [], ""))
+                continue
+
+            name, *filters = field.split("|")
+            if name not in FIELDS:
+                raise ValueError(f"Unknown field `{name}` in template `{source}`")
+            if fields is not None and name not in fields:
+                raise ValueError(f"Field `{name}` is not available in template `{source}`")
+            if conversion or any(f not in FILTERS for f in filters):
+                raise ValueError(f"Unsupported filter in template `{source}`, use one of {', '.join(FILTERS)}")
+            self.parts.append((literal, name, [FILTERS[f] for f in filters], spec or ""))
+
+    def _render_field(self, value: T.Any, filters: T.List[T.Callable], spec: str) -> str:
+        if isinstance(value, (list, tuple, set)):
+            items = [format(item, spec) for item in value]
+            for apply in filters:
+                items = [apply(item) for item in items]
+            return format_list(items, self.list_limit)
+
+        text = format(value, spec)
+        for apply in filters:
+            text = apply(text)
+        return text
+
+    def render(self, fields: Fields) -> str:
+        rendered = []
+        for literal, name, filters, spec in self.parts:
+            rendered.append(literal)
+            if name is not None:
+                rendered.append(self._render_field(fields[name], filters, spec))
+        return "".join(rendered)
+
+
+class Templates:
+    """Default templates merged with overrides, every template is compiled up front."""
+
+    def __init__(
+        self,
+        overrides: T.Optional[T.Dict[str, T.Dict[str, str]]] = None,
+        list_limit: int = MESSAGE_LIST_LIMIT,
+    ):
+        merged = {key: dict(parts) for key, parts in DEFAULT_TEMPLATES.items()}
+        for key, parts in (overrides or {}).items():
+            merged.setdefault(key, {}).update(parts)
+
+        self.compiled: T.Dict[T.Tuple[str, str], Template] = {}
+        for key, parts in merged.items():
+            fields = get_fields(key.split(".", 1)[0])
+            for part, source in parts.items():
+                if part not in PARTS:
+                    raise ValueError(f"Unknown template part `{part}` for `{key}`, use one of {', '.join(PARTS)}")
+                self.compiled[(key, part)] = Template(source, list_limit, fields)
+
+    def get(self, part: str, resource_type: str, status: str) -> Template:
+        return self.compiled.get((f"{resource_type}.{status}", part)) or self.compiled[(resource_type, part)]
+
+    def render(self, part: str, resource_type: str, fields: Fields) -> str:
+        return self.get(part, resource_type, fields["status"]).render(fields)
+
+
+def load_templates(path: T.Optional[str] = MESSAGE_TEMPLATES) -> Templates:
+    overrides = load_yaml_text(load_file_contents(path)) if path else None
+    return Templates(overrides)
+
+
+TEMPLATES = load_templates()
@@ -13,12 +13,70 @@ class Freshness:
     threshold: float
 
 
+@dataclass
+class AdapterStats:
+    adapter: str
+    code: T.Optional[str] = None
+    query_id: T.Optional[str] = None
+    bytes_processed: T.Optional[int] = None
+    bytes_billed: T.Optional[int] = None
+    slot_ms: T.Optional[int] = None
+
+
+@dataclass
+class RunStats:
+    nodes: T.Dict[str, T.Dict[str, int]]
+    execution_time: T.Dict[str, float]
+    slowest: T.List[T.Tuple[str, float]]
+    rows: T.Dict[str, int]
+
+
+@dataclass
+class ParseStats:
+    hit: bool
+    parse_time: float
+    saved_time: T.Optional[float] = None
+
+
+@dataclass
+class ThreadStats:
+    threads: int
+    recommended: int
+    queue_time: float
+    waited: int
+    waiting: int
+    concurrency: float
+    peak_concurrency: int
+    inflation: T.Optional[float] = None
+
+
+@dataclass
+class ProgressStats:
+    total: int
+    completed: int
+    running: int
+    remaining: int
+    elapsed: float
+    eta: T.Optional[float] = None
+
+
 @dataclass
 class Reporting:
     rows: T.Optional[int]
     execution_time: float
     timing: T.Optional[T.List[TimingInfo]]
     freshness: T.Optional[Freshness]
+    cached: bool = False
+    saved_time: T.Optional[float] = None
+    sample_rate: float = 1.0
+    adapter: T.Optional[AdapterStats] = None
+    file_size: T.Optional[int] = None
+    reload_time: T.Optional[float] = None
+    summary: T.Optional[RunStats] = None
+    parse: T.Optional[ParseStats] = None
+    impact: T.Optional[int] = None
+    threads: T.Optional[ThreadStats] = None
+    progress: T.Optional[ProgressStats] = None
 
 
 @dataclass
@@ -1,5 +1,7 @@
 import time
+import queue
 import requests
+import threading
 import typing as T
 from ..logger import GLOBAL_LOGGER as log
 from .tools import get_elapsed_milliseconds_since
@@ -59,3 +61,39 @@ def make_external_call(
             raise e
         else:
             return None
+
+
+class BackgroundCalls:
+    """Makes external calls from a daemon thread so a slow service never blocks the caller.
+
+    Failed calls are logged and dropped, `join` waits until every submitted call is done.
+    """
+
+    def __init__(self, name: str = 'external service'):
+        self.name = name
+        self.queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        return self.queue.unfinished_tasks
+
+    def submit(self, method: str, url: str, **kwargs):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=f'pydbt-{self.name}', daemon=True)
+                self._thread.start()
+
+        self.queue.put((method, url, kwargs))
+
+    def _run(self):
+        while True:
+            method, url, kwargs = self.queue.get()
+            try:
+                make_external_call(method, url, raise_exception=False, **kwargs)
+            finally:
+                self.queue.task_done()
+
+    def join(self):
+        self.queue.join()
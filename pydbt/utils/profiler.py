@@ -0,0 +1,74 @@
+import time
+import cProfile
+import threading
+import typing as T
+from contextlib import contextmanager
+from collections import OrderedDict
+
+from ..logger import GLOBAL_LOGGER as log
+
+# phases that are spent inside dbt rather than in pydbt itself
+DBT_PHASES = ("dbt",)
+
+
+class Profiler:
+    """Times the phases of a pydbt run to separate dbt's wall time from pydbt's overhead.
+
+    Optionally captures cProfile stats of the reporting pipeline that runs after dbt
+    returns, which is where pydbt's own time is spent.
+    """
+
+    def __init__(self, path: T.Optional[str] = None):
+        self.path = path
+        self.phases: T.Dict[str, float] = OrderedDict()
+        self.lock = threading.Lock()
+        self._profile = cProfile.Profile() if path else None
+
+    def add(self, name: str, seconds: float):
+        with self.lock:
+            self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def timed_iter(self, name: str, iterable: T.Iterable) -> T.Iterator:
+        """Yields from an iterable, attributing the time spent producing each item to a phase."""
+        iterator = iter(iterable)
+        while True:
+            with self.phase(name):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+
+    @property
+    def overhead(self) -> float:
+        with self.lock:
+            return sum(seconds for name, seconds in self.phases.items() if name not in DBT_PHASES)
+
+    def start_profile(self):
+        if self._profile:
+            self._profile.enable()
+
+    def stop_profile(self):
+        if not self._profile:
+            return
+
+        self._profile.disable()
+        self._profile.dump_stats(self.path)
+        log.info(f"Wrote profile of the reporting pipeline to {self.path}")
+
+    def summary(self) -> str:
+        with self.lock:
+            phases = " ".join(f"{name}={seconds:.3f}s" for name, seconds in self.phases.items())
+        return f"pydbt overhead {self.overhead:.3f}s ({phases})"
+
+    def report(self, stats):
+        stats.report_phases(self.phases)
+        log.info(self.summary())
@@ -0,0 +1,231 @@
+import time
+import heapq
+import logbook
+import threading
+import typing as T
+import networkx as nx
+from dbt.task.runnable import GraphRunnableTask
+
+from ..types import Message, Reporting, ProgressStats
+from ..config import PROGRESS_INTERVAL
+from ..logger import GLOBAL_LOGGER as log
+
+PROGRESS_COMMANDS = ("run", "build", "test", "seed", "snapshot")
+
+
+def format_duration(seconds: float) -> str:
+    minutes, seconds = divmod(int(round(seconds)), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}h {minutes}m"
+    return f"{minutes}m {seconds}s" if minutes else f"{seconds}s"
+
+
+class Progress:
+    """Counts the nodes of a running dbt command and estimates the time left.
+
+    Every selected node gets an estimate from its historical execution time and the
+    longest chain of estimates from it to the end of the graph, both computed once when
+    dbt has built its graph queue. Starting and finishing a node only updates counters,
+    a tick pops finished nodes off a heap of chain lengths, so it never walks the graph.
+    """
+
+    def __init__(self, graph: nx.DiGraph, estimates: T.Dict[str, float], threads: int, ignored: T.Set[str]):
+        self.threads = max(1, threads)
+        self.lock = threading.Lock()
+        self.started_at = time.time()
+        self.running: T.Dict[str, float] = {}
+        self.done: T.Set[str] = set()
+        self.ignored = ignored
+
+        known = [seconds for seconds in estimates.values() if seconds > 0]
+        self.default = sum(known) / len(known) if known else None
+        self.estimates = {
+            unique_id: estimates.get(unique_id, self.default or 0.0)
+            for unique_id in graph.nodes if unique_id not in ignored
+        }
+        self.total = len(self.estimates)
+        self.work = sum(self.estimates.values())
+        self.observed = 0.0
+
+        # longest chain of estimates from a node to the end of the graph
+        chains: T.Dict[str, float] = {}
+        for unique_id in reversed(list(nx.topological_sort(graph))):
+            successors = (chains[successor] for successor in graph.successors(unique_id))
+            chains[unique_id] = self.estimates.get(unique_id, 0.0) + max(successors, default=0.0)
+        self.chains = chains
+        self.waiting = [(-chains[unique_id], unique_id) for unique_id in self.estimates]
+        heapq.heapify(self.waiting)
+
+    def start(self, unique_id: str):
+        if unique_id in self.estimates:
+            with self.lock:
+                self.running[unique_id] = time.time()
+
+    def finish(self, unique_id: str):
+        if unique_id not in self.estimates:
+            return
+        with self.lock:
+            started_at = self.running.pop(unique_id, None)
+            if unique_id in self.done:
+                return
+            self.done.add(unique_id)
+            self.work -= self.estimates[unique_id]
+            if started_at is not None:
+                self.observed += time.time() - started_at
+
+    def get_eta(self, now: float) -> T.Optional[float]:
+        if self.default is None:
+            # without history, nodes are assumed to take as long as the ones done so far
+            if not self.done:
+                return None
+            remaining = self.total - len(self.done)
+            return remaining * self.observed / len(self.done) / self.threads
+
+        while self.waiting and (self.waiting[0][1] in self.done or self.waiting[0][1] in self.running):
+            heapq.heappop(self.waiting)
+
+        chain = -self.waiting[0][0] if self.waiting else 0.0
+        for unique_id, started_at in self.running.items():
+            chain = max(chain, self.chains[unique_id] - (now - started_at))
+
+        elapsed = sum(
+            min(now - started_at, self.estimates[unique_id]) for unique_id, started_at in self.running.items()
+        )
+        return max(chain, (self.work - elapsed) / self.threads, 0.0)
+
+    def snapshot(self) -> ProgressStats:
+        now = time.time()
+        with self.lock:
+            return ProgressStats(
+                total=self.total,
+                completed=len(self.done),
+                running=len(self.running),
+                remaining=self.total - len(self.done) - len(self.running),
+                elapsed=now - self.started_at,
+                eta=self.get_eta(now),
+            )
+
+    def final(self) -> ProgressStats:
+        """Returns the progress once dbt is done, nothing is running or left to wait for."""
+        with self.lock:
+            return ProgressStats(
+                total=self.total,
+                completed=len(self.done),
+                running=0,
+                remaining=self.total - len(self.done),
+                elapsed=time.time() - self.started_at,
+                eta=0.0,
+            )
+
+
+class ProgressReporter:
+    """Reports the progress of the dbt command every `interval` seconds from a background thread.
+
+    dbt's graph task is patched for the duration of the command to see the graph queue and
+    every node starting and finishing. Use it as a context manager around the dbt command,
+    the thread and the patches are gone when it exits. A last report on exit replaces the
+    running and ETA values of the last tick, so they are not flushed as if dbt still ran.
+    """
+
+    def __init__(
+        self,
+        command: T.List[str],
+        report: T.Callable[[Message], None],
+        estimates: T.Dict[str, float],
+        interval: float = PROGRESS_INTERVAL,
+    ):
+        self.command = " ".join(command[:1])
+        self.report = report
+        self.estimates = estimates
+        self.interval = interval
+        self.progress: T.Optional[Progress] = None
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.tick, name="pydbt-progress", daemon=True)
+        self.patched: T.Dict[str, T.Callable] = {}
+
+    @staticmethod
+    def applies_to(command: T.List[str]) -> bool:
+        return bool(command) and command[0] in PROGRESS_COMMANDS
+
+    def begin(self, task: GraphRunnableTask):
+        queue = task.job_queue
+        ephemeral = {node.unique_id for node in task._flattened_nodes if node.is_ephemeral_model}
+        self.progress = Progress(queue.graph, self.estimates, task.config.threads, ephemeral)
+        self.thread.start()
+
+    def patch(self):
+        progress = self
+        runtime_initialize = GraphRunnableTask._runtime_initialize
+        call_runner = GraphRunnableTask.call_runner
+        handle_result = GraphRunnableTask._handle_result
+
+        # Hack to follow dbt's graph queue while it runs
+        def _runtime_initialize(task):
+            runtime_initialize(task)
+            if progress.progress is None:
+                progress.begin(task)
+
+        def _call_runner(task, runner):
+            progress.progress.start(runner.node.unique_id)
+            return call_runner(task, runner)
+
+        def _handle_result(task, result):
+            handle_result(task, result)
+            progress.progress.finish(result.node.unique_id)
+
+        self.patched = {
+            "_runtime_initialize": runtime_initialize,
+            "call_runner": call_runner,
+            "_handle_result": handle_result,
+        }
+        GraphRunnableTask._runtime_initialize = _runtime_initialize
+        GraphRunnableTask.call_runner = _call_runner
+        GraphRunnableTask._handle_result = _handle_result
+
+    def unpatch(self):
+        for name, method in self.patched.items():
+            setattr(GraphRunnableTask, name, method)
+        self.patched = {}
+
+    def format(self, stats: ProgressStats) -> Message:
+        eta = format_duration(stats.eta) if stats.eta is not None else "unknown"
+        return Message(
+            title=f"dbt {self.command} progress.",
+            message=(
+                f"*[PROGRESS]* {stats.completed}/{stats.total} node(s) done, {stats.running} running, "
+                f"{stats.remaining} remaining after {format_duration(stats.elapsed)}, ETA {eta}"
+            ),
+            error=None,
+            reporting=Reporting(
+                rows=None,
+                execution_time=0.0,
+                timing=[],
+                freshness=None,
+                progress=stats,
+            ),
+            context={"resource_type": "run", "name": self.command},
+            level=logbook.INFO,
+        )
+
+    def send(self, stats: ProgressStats):
+        try:
+            self.report(self.format(stats))
+        except Exception as err:
+            log.error(f"Failed to report progress: {err}")
+
+    def tick(self):
+        while not self.stopped.wait(self.interval):
+            self.send(self.progress.snapshot())
+
+    def __enter__(self) -> "ProgressReporter":
+        self.patch()
+        return self
+
+    def __exit__(self, *exc):
+        self.stopped.set()
+        self.unpatch()
+        if self.thread.is_alive():
+            self.thread.join(self.interval)
+        if self.progress is not None:
+            self.send(self.progress.final())
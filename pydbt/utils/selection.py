@@ -0,0 +1,44 @@
+import typing as T
+from dbt.graph.selector import NodeSelector
+
+SelectionFilter = T.Callable[[NodeSelector, T.Set[str]], T.Set[str]]
+
+_filters: T.List[SelectionFilter] = []
+_get_selected = None
+
+
+def _get_selected_filtered(selector: NodeSelector, spec) -> T.Set[str]:
+    selected = _get_selected(selector, spec)
+    for selection_filter in list(_filters):
+        selected = selection_filter(selector, selected)
+    return selected
+
+
+def add_selection_filter(selection_filter: SelectionFilter):
+    """Narrows down dbt's node selection for the duration of the run.
+
+    Filters are applied in the order they were added. dbt's own selection is patched once
+    for all filters, so hooks can add and remove filters in any order.
+    """
+    global _get_selected
+    if not _filters:
+        # Hack to filter dbt's node selection
+        _get_selected = NodeSelector.get_selected
+        NodeSelector.get_selected = _get_selected_filtered
+    _filters.append(selection_filter)
+
+
+def remove_selection_filter(selection_filter: SelectionFilter):
+    global _get_selected
+    if selection_filter in _filters:
+        _filters.remove(selection_filter)
+
+    if not _filters and _get_selected is not None:
+        NodeSelector.get_selected = _get_selected
+        _get_selected = None
+
+
+def clear_selection_filters():
+    """Restores dbt's own node selection, also when a run failed before its hooks removed their filters."""
+    for selection_filter in list(_filters):
+        remove_selection_filter(selection_filter)
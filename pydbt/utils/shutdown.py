@@ -0,0 +1,70 @@
+import time
+import threading
+import typing as T
+
+from ..config import SHUTDOWN_DEADLINE
+from ..logger import GLOBAL_LOGGER as log
+
+
+class Sink(T.NamedTuple):
+    name: str
+    flush: T.Callable[[], T.Any]
+    pending: T.Optional[T.Callable[[], int]] = None
+
+
+class Shutdown:
+    """Flushes every registered sink concurrently under a single exit deadline.
+
+    Each flush runs in a daemon thread, a sink that is still flushing when the deadline
+    passes is abandoned and reported as dropped instead of holding up the process exit.
+    Errors raised by a flush are logged and never change the exit code of the run.
+    """
+
+    def __init__(self, deadline: float = SHUTDOWN_DEADLINE):
+        self.deadline = deadline
+        self.sinks: T.List[Sink] = []
+        self.started: T.Optional[float] = None
+
+    def register(self, name: str, flush: T.Callable[[], T.Any], pending: T.Optional[T.Callable[[], int]] = None):
+        self.sinks.append(Sink(name, flush, pending))
+
+    def remaining(self) -> float:
+        if self.started is None:
+            return self.deadline
+        return max(0.0, self.deadline - (time.monotonic() - self.started))
+
+    def drain(self, close: T.Callable[[float], T.Any]):
+        """Waits for queued deliveries before flushing, sharing the same deadline."""
+        self.started = self.started or time.monotonic()
+        return close(self.remaining())
+
+    @staticmethod
+    def _flush(sink: Sink):
+        try:
+            sink.flush()
+        except Exception as err:
+            log.error(f"Failed to flush {sink.name}: {err}")
+
+    def run(self) -> T.List[str]:
+        """Flushes all sinks and returns the names of the sinks that missed the deadline."""
+        self.started = self.started or time.monotonic()
+        threads = []
+        for sink in self.sinks:
+            thread = threading.Thread(target=self._flush, args=(sink,), name=f"pydbt-flush-{sink.name}", daemon=True)
+            thread.start()
+            threads.append((sink, thread))
+
+        dropped = []
+        for sink, thread in threads:
+            thread.join(self.remaining())
+            if thread.is_alive():
+                pending = f" ({sink.pending()} pending)" if sink.pending else ""
+                dropped.append(f"{sink.name}{pending}")
+
+        if dropped:
+            log.warning(f"Shutdown deadline of {self.deadline}s exceeded, dropped: {', '.join(dropped)}")
+        else:
+            log.info(f"Flushed {len(threads)} sink(s) in {time.monotonic() - self.started:.3f}s")
+
+        self.sinks, self.started = [], None
+        return dropped
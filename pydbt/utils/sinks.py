@@ -0,0 +1,179 @@
+import time
+import queue
+import asyncio
+import threading
+import typing as T
+from concurrent.futures import Executor, Future, TimeoutError
+
+from ..types import Message
+from ..logger import GLOBAL_LOGGER as log
+from ..config import SINK_QUEUE_SIZE
+from .profiler import Profiler
+
+
+class SinkStats:
+    __slots__ = ("submitted", "delivered", "failed", "latency", "busy", "max_depth", "lock")
+
+    def __init__(self):
+        # updated by the producer and by every worker of the sink
+        self.lock = threading.Lock()
+        self.submitted = 0
+        self.delivered = 0
+        self.failed = 0
+        self.latency = 0.0
+        # time spent delivering, summed over the workers of the sink
+        self.busy = 0.0
+        self.max_depth = 0
+
+    @property
+    def pending(self) -> int:
+        return self.submitted - self.delivered - self.failed
+
+    @property
+    def mean_latency(self) -> float:
+        return self.latency / self.delivered if self.delivered else 0.0
+
+
+class Sinks:
+    """Delivers messages to each sink in turn, in the calling thread."""
+
+    def __init__(self, profiler: T.Optional[Profiler] = None):
+        self.profiler = profiler or Profiler()
+        self.sinks: T.Dict[str, T.Callable[[Message], T.Any]] = {}
+        self.stats: T.Dict[str, SinkStats] = {}
+
+    def add(self, name: str, deliver: T.Callable[[Message], T.Any], concurrency: int = 1):
+        self.sinks[name] = deliver
+        self.stats[name] = SinkStats()
+
+    def _call(self, name: str, msg: Message):
+        # delivering in the calling thread is part of pydbt's own time
+        with self.profiler.phase(name):
+            self.sinks[name](msg)
+
+    def _deliver(self, name: str, msg: Message, submitted: float):
+        self._call(name, msg)
+
+        stats = self.stats[name]
+        with stats.lock:
+            stats.delivered += 1
+            stats.latency += time.perf_counter() - submitted
+
+    def submit(self, name: str, msg: Message):
+        with self.stats[name].lock:
+            self.stats[name].submitted += 1
+        self._deliver(name, msg, time.perf_counter())
+
+    def close(self, timeout: T.Optional[float] = None) -> T.List[str]:
+        return []
+
+
+class DaemonExecutor(Executor):
+    """Runs calls on daemon threads so a hung sink never blocks the interpreter from exiting."""
+
+    def __init__(self, workers: int, name: str):
+        self._queue = queue.SimpleQueue()
+        for idx in range(workers):
+            threading.Thread(target=self._work, name=f"pydbt-{name}-{idx}", daemon=True).start()
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        future = Future()
+        self._queue.put((future, fn, args, kwargs))
+        return future
+
+    def _work(self):
+        while True:
+            future, fn, args, kwargs = self._queue.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as err:
+                future.set_exception(err)
+
+
+class AsyncSinks(Sinks):
+    """Delivers messages to every sink concurrently from an asyncio event loop.
+
+    Each sink consumes its own queue with a fixed number of workers, so network waits of
+    different sinks overlap. Submitting blocks while a sink's queue is full, a slow sink
+    slows down the producer instead of buffering without bound while the other sinks
+    keep draining their queues. Errors are logged and the message is dropped.
+
+    A sink with more than one worker is called from several threads at once, the alerting,
+    export and monitoring sinks guard their own state for it. Delivery time is kept per
+    sink in its stats instead of the run's phases.
+    """
+
+    def __init__(self, profiler: T.Optional[Profiler] = None, queue_size: int = SINK_QUEUE_SIZE):
+        super(AsyncSinks, self).__init__(profiler)
+        self.queue_size = queue_size
+        self.queues: T.Dict[str, asyncio.Queue] = {}
+        self.slots: T.Dict[str, threading.Semaphore] = {}
+        self.executors: T.Dict[str, DaemonExecutor] = {}
+        self.workers: T.List[asyncio.Task] = []
+
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, name="pydbt-sinks", daemon=True)
+        self._thread.start()
+
+    def add(self, name: str, deliver: T.Callable[[Message], T.Any], concurrency: int = 1):
+        super(AsyncSinks, self).add(name, deliver, concurrency)
+        self.slots[name] = threading.Semaphore(self.queue_size)
+        self.executors[name] = DaemonExecutor(concurrency, name)
+        asyncio.run_coroutine_threadsafe(self._start(name, concurrency), self.loop).result()
+
+    async def _start(self, name: str, concurrency: int):
+        # queues bind to the running loop, create them on the loop thread
+        self.queues[name] = asyncio.Queue()
+        for _ in range(concurrency):
+            self.workers.append(self.loop.create_task(self._work(name, self.queues[name])))
+
+    async def _work(self, name: str, sink_queue: asyncio.Queue):
+        stats = self.stats[name]
+        while True:
+            msg, submitted = await sink_queue.get()
+            stats.max_depth = max(stats.max_depth, sink_queue.qsize() + 1)
+            self.slots[name].release()
+            try:
+                await self.loop.run_in_executor(self.executors[name], self._deliver, name, msg, submitted)
+            except Exception as err:
+                with stats.lock:
+                    stats.failed += 1
+                log.error(f"Failed to deliver to {name}: {err}")
+            finally:
+                sink_queue.task_done()
+
+    def submit(self, name: str, msg: Message):
+        # blocks while the queue of the sink is full
+        self.slots[name].acquire()
+        with self.stats[name].lock:
+            self.stats[name].submitted += 1
+        self.loop.call_soon_threadsafe(self.queues[name].put_nowait, (msg, time.perf_counter()))
+
+    def _call(self, name: str, msg: Message):
+        # workers overlap with each other and with the run, their time is not pydbt's overhead
+        started = time.perf_counter()
+        try:
+            self.sinks[name](msg)
+        finally:
+            stats = self.stats[name]
+            with stats.lock:
+                stats.busy += time.perf_counter() - started
+
+    async def _drain(self):
+        await asyncio.gather(*(sink_queue.join() for sink_queue in self.queues.values()))
+
+    def close(self, timeout: T.Optional[float] = None) -> T.List[str]:
+        """Waits for every queued message to be delivered, returns the sinks that did not finish in time."""
+        dropped = []
+        try:
+            asyncio.run_coroutine_threadsafe(self._drain(), self.loop).result(timeout)
+        except TimeoutError:
+            dropped = [f"{name} ({stats.pending} pending)" for name, stats in self.stats.items() if stats.pending]
+            log.warning(f"Sinks did not drain within {timeout}s, dropped: {', '.join(dropped)}")
+
+        for worker in self.workers:
+            self.loop.call_soon_threadsafe(worker.cancel)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        return dropped
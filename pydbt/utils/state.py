@@ -0,0 +1,34 @@
+import os
+import json
+import typing as T
+import tempfile
+from .. import config
+
+
+def get_state_path(name: str) -> str:
+    return os.path.join(config.STATE_DIR, f"{name}.json")
+
+
+def load_state(name: str, default: T.Any = None) -> T.Any:
+    try:
+        with open(get_state_path(name), "r") as f:
+            return json.load(f)
+    except (IOError, ValueError):
+        return default
+
+
+def save_state(name: str, data: T.Any) -> str:
+    """Atomically persist state so concurrent readers never see a partial file."""
+    path = get_state_path(name)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, separators=(",", ":"), default=str)
+        os.replace(tmp_path, path)
+    except Exception:
+        os.remove(tmp_path)
+        raise
+
+    return path
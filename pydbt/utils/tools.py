@@ -1,3 +1,4 @@
+import os
 import time
 import typing as T
 from numbers import Real
@@ -47,5 +48,75 @@ def get_full_db_id(db: str, schema: str, table: str, capitalize: bool = True) ->
     return db_id
 
 
+def get_file_size(path: str) -> T.Optional[int]:
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return None
+
+
+def format_bytes(size: float) -> str:
+    for unit in ('B', 'KiB', 'MiB', 'GiB'):
+        if size < 1024 or unit == 'GiB':
+            break
+        size /= 1024
+    return f'{size:.1f} {unit}' if unit != 'B' else f'{int(size)} B'
+
+
+def parse_mapping(value: T.Optional[str], cast: T.Callable = str) -> T.Dict[str, T.Any]:
+    """Parses settings formatted as `key=value,other=value`."""
+    parsed = {}
+    for item in (value or '').split(','):
+        if '=' in item:
+            key, val = item.split('=', 1)
+            parsed[key.strip().lower()] = cast(val.strip())
+    return parsed
+
+
 def get_elapsed_milliseconds_since(time_started: float) -> float:
     return (time.time() - time_started) * 1000
+
+
+def omit_cli_options(command: T.List[str], flags: T.Sequence[str]) -> T.List[str]:
+    """Removes cli options and their values from a command."""
+    cmd, skipping = [], False
+    for arg in command:
+        if arg in flags or arg.split("=", 1)[0] in flags:
+            skipping = "=" not in arg
+            continue
+        if skipping and not arg.startswith("-"):
+            continue
+        skipping = False
+        cmd.append(arg)
+
+    return cmd
+
+
+def get_cli_option(command: T.List[str], flags: T.Sequence[str], default: T.Optional[str] = None) -> T.Optional[str]:
+    """Returns the value of a single value cli option."""
+    for idx, arg in enumerate(command):
+        name, sep, value = arg.partition("=")
+        if name not in flags:
+            continue
+        if sep:
+            return value
+        if idx + 1 < len(command):
+            return command[idx + 1]
+
+    return default
+
+
+def extend_cli_option(command: T.List[str], flags: T.Sequence[str], values: T.Sequence[str]) -> T.List[str]:
+    """Appends values to a multi-value cli option, adding the option when it is missing."""
+    cmd = list(command)
+    if not values:
+        return cmd
+
+    for idx, arg in enumerate(cmd):
+        if arg in flags:
+            end = idx + 1
+            while end < len(cmd) and not cmd[end].startswith("-"):
+                end += 1
+            return cmd[:end] + list(values) + cmd[end:]
+
+    return cmd + [flags[0], *values]
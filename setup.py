@@ -46,7 +46,7 @@ setup(
     platforms='any',
     install_requires=INSTALL_REQUIRES,
     test_requires=TEST_REQUIRES,
-    extras_require={'dev': TEST_REQUIRES},
+    extras_require={'dev': TEST_REQUIRES, 'json': ['orjson'], 'export': ['pyarrow']},
     scripts=[
         'scripts/pydbt',
     ],
@@ -0,0 +1,91 @@
+import pytest
+
+from tests.fixture_loader import ResultMock
+
+from pydbt import config
+from pydbt.cache.freshness import FreshnessCache
+from pydbt.parsers.formatter import Formatter
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "STATE_DIR", str(tmp_path))
+    return FreshnessCache(ttl=3600)
+
+
+def _update(cache, result):
+    cache.record(result, Formatter.format(result))
+
+
+@pytest.mark.parametrize(
+    "input,expected",
+    [
+        (["source", "freshness"], True),
+        (["source", "snapshot-freshness", "-s", "source:core"], True),
+        (["run", "-m", "model"], False),
+        (["source"], False),
+    ],
+)
+def test_applies_to(input, expected):
+    assert FreshnessCache.applies_to(input) == expected
+
+
+def test_cached_within_threshold(cache):
+    result = ResultMock.load_freshness_fixture
+    _update(cache, result)
+
+    # warn_after is 4 hours and the source was last loaded ~26 minutes before the check
+    now = result.snapshotted_at.timestamp() + 600
+    selected = {result.node.unique_id}
+    assert list(cache.cached(selected, now=now)) == [result.node.unique_id]
+
+    # a source that could have crossed its warn threshold must be queried again
+    assert cache.cached(selected, now=result.max_loaded_at.timestamp() + 4 * 3600) == {}
+
+
+def test_cached_respects_ttl(cache):
+    result = ResultMock.load_freshness_fixture
+    _update(cache, result)
+
+    cache.ttl = 60
+    assert cache.cached({result.node.unique_id}, now=result.snapshotted_at.timestamp() + 600) == {}
+
+
+def test_failed_sources_are_not_cached(cache):
+    _update(cache, ResultMock.load_freshness_fixture_warn)
+    _update(cache, ResultMock.load_freshness_fixture_fail)
+    assert cache.entries == {}
+
+
+def test_save_and_reload(cache):
+    _update(cache, ResultMock.load_freshness_fixture)
+    cache.finalize(success=True)
+
+    assert FreshnessCache().entries == cache.entries
+
+
+def test_only_selected_sources_are_skipped(cache, monkeypatch):
+    result = ResultMock.load_freshness_fixture
+    _update(cache, result)
+    monkeypatch.setattr(cache, "ttl", float("inf"))
+    monkeypatch.setattr("time.time", lambda: result.snapshotted_at.timestamp())
+
+    command = ["source", "freshness", "-s", "source:other"]
+    assert cache.prepare(command) == command
+    assert cache._filter(None, {"source.other.table"}) == {"source.other.table"}
+    assert cache.finalize(success=True) == []
+
+    cache.prepare(command)
+    assert cache._filter(None, {result.node.unique_id, "source.other.table"}) == {"source.other.table"}
+    assert len(cache.finalize(success=True)) == 1
+
+
+def test_format(cache):
+    result = ResultMock.load_freshness_fixture
+    _update(cache, result)
+    entries = list(cache.cached({result.node.unique_id}, now=result.snapshotted_at.timestamp()).values())
+
+    msg = FreshnessCache.format(entries[0], now=result.max_loaded_at.timestamp() + 7200)
+    assert msg.reporting.cached
+    assert msg.reporting.freshness.age == 2.0
+    assert msg.message == "Source `DATA_LAKE_DEV.CORE.PACKAGE_SEGMENT` is up to date, cached pass"
@@ -0,0 +1,108 @@
+import pytest
+from types import SimpleNamespace
+from dbt.parser.manifest import ManifestLoader
+
+from pydbt.cache.parse import ParseCache
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    (project_dir / "dbt_project.yml").write_text("name: analytics\ntarget-path: build\n")
+    profiles_dir = tmp_path / "profiles"
+    profiles_dir.mkdir()
+    (profiles_dir / "profiles.yml").write_text("analytics:\n  target: dev\n")
+    monkeypatch.setenv("DBT_PROFILES_DIR", str(profiles_dir))
+    return project_dir
+
+
+def _parse(loader, hit, elapsed):
+    loader.saved_manifest = object() if hit else None
+    loader._perf_info = SimpleNamespace(load_all_elapsed=elapsed)
+    ManifestLoader.track_project_load(loader)
+
+
+def _run(cache_dir, project, hit=False, elapsed=90.0, success=True):
+    """Simulates a single pydbt run in a fresh container."""
+    command = ["run", "--project-dir", str(project)]
+    cache = ParseCache(str(cache_dir))
+    cache.prepare(command)
+
+    # dbt writes the artifact while parsing
+    (project / "build").mkdir(exist_ok=True)
+    (project / "build" / "partial_parse.msgpack").write_bytes(b"manifest")
+    _parse(SimpleNamespace(), hit, elapsed)
+    return cache, cache.finalize(success)
+
+
+@pytest.fixture(autouse=True)
+def no_tracking(monkeypatch):
+    monkeypatch.setattr(ManifestLoader, "track_project_load", lambda loader: None)
+
+
+def test_artifact_is_restored_in_a_fresh_container(tmp_path, project):
+    cache_dir = tmp_path / "cache"
+    cache, messages = _run(cache_dir, project)
+    assert not cache.restored
+    assert messages[0].reporting.parse.hit is False
+    assert messages[0].reporting.parse.parse_time == 90.0
+
+    (project / "build" / "partial_parse.msgpack").unlink()
+    cache, messages = _run(cache_dir, project, hit=True, elapsed=4.0)
+    assert cache.restored
+    assert messages[0].reporting.parse.hit is True
+    assert messages[0].reporting.parse.saved_time == 86.0
+    assert messages[0].context["cache"] == "hit"
+
+
+def test_key_depends_on_profile_and_project_files(project):
+    command = ["run", "--project-dir", str(project)]
+    key = ParseCache.get_key(command, str(project))
+    assert ParseCache.get_key(command + ["--target", "prod"], str(project)) != key
+
+    (project / "packages.yml").write_text("packages: []\n")
+    assert ParseCache.get_key(command, str(project)) != key
+
+
+def test_failed_runs_are_not_saved(tmp_path, project):
+    cache_dir = tmp_path / "cache"
+    cache, _ = _run(cache_dir, project, success=False)
+    assert not cache_dir.exists()
+
+
+def test_patch_is_removed_and_old_artifacts_pruned(tmp_path, project):
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    for idx in range(3):
+        (cache_dir / f"stale{idx}.msgpack").write_bytes(b"old")
+        (cache_dir / f"stale{idx}.json").write_text("{}")
+
+    track_project_load = ManifestLoader.track_project_load
+    cache = ParseCache(str(cache_dir), size=2)
+    cache.prepare(["run", "--project-dir", str(project)])
+    (project / "build").mkdir()
+    (project / "build" / "partial_parse.msgpack").write_bytes(b"manifest")
+    cache.finalize(True)
+
+    assert ManifestLoader.track_project_load is track_project_load
+    assert len(list(cache_dir.glob("*.msgpack"))) == 2
+    assert (cache_dir / f"{cache.key}.msgpack").read_bytes() == b"manifest"
+
+
+def test_patch_is_removed_when_the_run_raised(project):
+    track_project_load = ManifestLoader.track_project_load
+    cache = ParseCache(str(project / "cache"))
+    cache.prepare(["run", "--project-dir", str(project)])
+    assert ManifestLoader.track_project_load is not track_project_load
+
+    # finalize is skipped when dbt raises, the run still closes its hooks
+    cache.close()
+    assert ManifestLoader.track_project_load is track_project_load
+
+
+def test_applies_to_parsing_commands():
+    assert ParseCache.applies_to(["run"])
+    assert ParseCache.applies_to(["source", "freshness"])
+    assert not ParseCache.applies_to(["deps"])
+    assert not ParseCache.applies_to(["run", "--no-partial-parse"])
@@ -0,0 +1,55 @@
+import pytest
+from copy import deepcopy
+
+from tests.fixture_loader import ResultMock
+
+from pydbt import config
+from pydbt.cache.seeds import SeedReloads
+from pydbt.parsers.formatter import Formatter
+
+
+@pytest.fixture(autouse=True)
+def state_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "STATE_DIR", str(tmp_path))
+
+
+def _run(result, threshold=10):
+    """Simulates a single `pydbt seed` run."""
+    hook = SeedReloads(threshold=threshold)
+    hook.record(result, Formatter.format(result))
+    return hook.finalize(True)
+
+
+def test_unchanged_seed_reload_is_flagged():
+    seed = ResultMock.load_seed_fixture
+
+    assert _run(seed) == []
+    reloaded = _run(seed)
+
+    assert len(reloaded) == 1
+    assert reloaded[0].reporting.reload_time == 12.5
+    assert reloaded[0].title == "Seed reloaded unchanged."
+
+
+def test_changed_or_fast_seeds_are_not_flagged():
+    seed = ResultMock.load_seed_fixture
+    _run(seed)
+
+    changed = deepcopy(seed)
+    changed.node.checksum.checksum = "0" * 64
+    assert _run(changed) == []
+
+    # below the threshold a reload is not worth flagging
+    assert _run(changed, threshold=60) == []
+
+
+def test_large_seeds_use_file_stat(tmp_path):
+    seed = deepcopy(ResultMock.load_seed_fixture)
+    seed.node.checksum.name = "path"
+    seed.node.root_path = str(tmp_path)
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "country_codes.csv").write_text("code,name\n")
+
+    assert SeedReloads.get_signature(seed.node) is not None
+    _run(seed)
+    assert len(_run(seed)) == 1
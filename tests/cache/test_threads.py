@@ -0,0 +1,98 @@
+import pytest
+from copy import deepcopy
+from datetime import datetime, timedelta
+from dbt.contracts.results import TimingInfo
+
+from tests.fixture_loader import ResultMock
+
+from pydbt import config
+from pydbt.cache.threads import ThreadTuner, get_job_key, load_recommendation, peak_overlap, recommend
+from pydbt.parsers.formatter import Formatter
+from pydbt.utils.state import save_state
+
+STARTED_AT = datetime(2021, 4, 7, 18, 0, 0)
+
+
+@pytest.fixture(autouse=True)
+def state_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "STATE_DIR", str(tmp_path))
+
+
+def _node(name, start, seconds, parents=(), thread="Thread-1"):
+    result = deepcopy(ResultMock.load_model_fixture)
+    result.node.name = name
+    result.node.unique_id = f"model.analytics.{name}"
+    result.node.depends_on.nodes = [f"model.analytics.{parent}" for parent in parents]
+    result.thread_id = thread
+    started_at = STARTED_AT + timedelta(seconds=start)
+    result.timing = [
+        TimingInfo(name="compile", started_at=started_at, completed_at=started_at),
+        TimingInfo(name="execute", started_at=started_at, completed_at=started_at + timedelta(seconds=seconds)),
+    ]
+    return result
+
+
+def _run(command, results, auto=False):
+    hook = ThreadTuner(auto=auto)
+    command = hook.prepare(command)
+    for result in results:
+        hook.record(result, Formatter.format(result))
+    return command, hook.finalize(True)
+
+
+def test_nodes_waiting_for_a_thread_raise_the_recommendation():
+    # two threads, the last two roots wait 10s for a free thread
+    results = [
+        _node("a", 0, 10, thread="Thread-1"),
+        _node("b", 0, 10, thread="Thread-2"),
+        _node("c", 10, 10, thread="Thread-1"),
+        _node("d", 10, 10, thread="Thread-2"),
+        _node("e", 20, 5, parents=["c"], thread="Thread-1"),
+    ]
+    _, messages = _run(["run", "-s", "tag:daily"], results)
+
+    stats = messages[0].reporting.threads
+    assert stats.threads == 2
+    assert stats.waited == 2
+    assert stats.waiting == 2
+    assert stats.queue_time == pytest.approx(4.0)
+    assert stats.peak_concurrency == 2
+    assert stats.inflation is None
+    assert stats.recommended == 4
+    assert messages[0].context["selection"] == "run -s tag:daily"
+    assert load_recommendation("run -s tag:daily") == 4
+
+
+def test_inflated_execute_times_lower_the_recommendation():
+    save_state("threads/baselines", {f"model.analytics.{name}": 5.0 for name in "abcd"})
+    results = [_node(name, 0, 10, thread=f"Thread-{idx}") for idx, name in enumerate("abcd")]
+    _, messages = _run(["run", "--threads", "4"], results)
+
+    stats = messages[0].reporting.threads
+    assert stats.threads == 4
+    assert stats.waited == 0
+    assert stats.inflation == pytest.approx(2.0)
+    assert stats.recommended == 2
+    assert load_recommendation(get_job_key(["run", "--threads", "8"])) == 2
+
+
+def test_recommendation_is_applied_when_enabled():
+    save_state("threads/jobs", {"build -s tag:daily": {"recommended": 6}})
+
+    command, _ = _run(["build", "-s", "tag:daily"], [])
+    assert command == ["build", "-s", "tag:daily"]
+
+    command, _ = _run(["build", "-s", "tag:daily"], [], auto=True)
+    assert command == ["build", "-s", "tag:daily", "--threads", "6"]
+
+    # an explicit thread count always wins
+    command, _ = _run(["build", "-s", "tag:daily", "--threads", "2"], [], auto=True)
+    assert command == ["build", "-s", "tag:daily", "--threads", "2"]
+
+
+def test_recommend():
+    assert peak_overlap([(0, 10), (5, 15), (10, 20), (30, 40)]) == 2
+    assert recommend(4, waiting=0, inflation=1.1) == 4
+    assert recommend(4, waiting=10, inflation=None) == 8
+    assert recommend(4, waiting=10, inflation=None, maximum=6) == 6
+    assert recommend(1, waiting=0, inflation=3.0) == 1
@@ -0,0 +1,116 @@
+import time
+import pytest
+from copy import deepcopy
+from types import SimpleNamespace
+from dbt.graph.selector import NodeSelector
+
+from tests.fixture_loader import ResultMock
+
+from pydbt import config
+from pydbt.cache.watermarks import ChangeDetector
+from pydbt.parsers.formatter import Formatter
+
+SOURCE_ID = "source.transformations.booking.dbx_booking"
+MODEL_ID = "model.transformations.dbx_booking"
+
+
+@pytest.fixture(autouse=True)
+def state_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "STATE_DIR", str(tmp_path))
+
+
+@pytest.fixture
+def manifest():
+    node = ResultMock.load_model_fixture.node
+    return SimpleNamespace(nodes={MODEL_ID: node})
+
+
+def _build(max_loaded_at=100.0):
+    detector = ChangeDetector()
+    detector.sources[SOURCE_ID] = {"max_loaded_at": max_loaded_at, "checked_at": 0.0}
+    result = ResultMock.load_model_fixture
+    detector.record(result, Formatter.format(result))
+    detector.finalize(success=True)
+    return detector.models[MODEL_ID]["built_at"]
+
+
+def _observe(max_loaded_at, checked_at):
+    detector = ChangeDetector()
+    detector.sources[SOURCE_ID] = {"max_loaded_at": max_loaded_at, "checked_at": checked_at}
+    return detector
+
+
+def test_unchanged_when_sources_have_no_new_data(manifest):
+    built_at = _build()
+    detector = _observe(100.0, built_at + 60)
+    assert detector.unchanged(manifest, {MODEL_ID}) == {MODEL_ID}
+
+
+def test_changed_when_source_received_data(manifest):
+    built_at = _build()
+    detector = _observe(200.0, built_at + 60)
+    assert detector.unchanged(manifest, {MODEL_ID}) == set()
+
+
+def test_changed_without_observation_after_build(manifest):
+    built_at = _build()
+    detector = _observe(100.0, built_at - 60)
+    assert detector.unchanged(manifest, {MODEL_ID}) == set()
+
+
+def test_failed_build_is_forgotten(manifest):
+    _build()
+    detector = ChangeDetector()
+    result = ResultMock.load_model_fixture_fail
+    detector.record(result, Formatter.format(result))
+    assert MODEL_ID not in detector.models
+
+
+def test_selection_is_filtered_and_reported(manifest, monkeypatch):
+    monkeypatch.setattr(NodeSelector, "get_selected", lambda selector, spec: {MODEL_ID, "test.other"})
+    built_at = _build()
+    detector = _observe(100.0, built_at + 60)
+    detector.prepare(["run"])
+
+    selected = NodeSelector.get_selected(SimpleNamespace(manifest=manifest), None)
+    assert selected == {"test.other"}
+
+    messages = detector.finalize(success=True)
+    assert len(messages) == 1
+    assert messages[0].reporting.cached
+    assert messages[0].reporting.saved_time == pytest.approx(7.394317150115967)
+    assert messages[0].message == (
+        "*[UNCHANGED]* model `WAREHOUSE_LOCAL.HBL_BOOKING_ODS.DBX_BOOKING` skipped, upstream sources have no new data"
+    )
+    assert NodeSelector.get_selected(SimpleNamespace(manifest=manifest), None) == {MODEL_ID, "test.other"}
+
+
+def test_full_refresh_builds_everything():
+    detector = ChangeDetector()
+    detector.prepare(["run", "--full-refresh"])
+    assert detector._filter is None
+
+
+
+def test_changed_when_parent_model_was_rebuilt():
+    parent = deepcopy(ResultMock.load_model_fixture)
+    parent.node.unique_id = "model.transformations.parent"
+    child = deepcopy(ResultMock.load_model_fixture)
+    child.node.depends_on.nodes.append(parent.node.unique_id)
+    manifest = SimpleNamespace(nodes={MODEL_ID: child.node, parent.node.unique_id: parent.node})
+
+    def build(*results):
+        detector = ChangeDetector()
+        detector.sources[SOURCE_ID] = {"max_loaded_at": 100.0, "checked_at": 0.0}
+        for result in results:
+            detector.record(result, Formatter.format(result))
+        detector.finalize(success=True)
+
+    build(parent, child)
+    detector = _observe(100.0, time.time() + 60)
+    assert detector.unchanged(manifest, {MODEL_ID}) == {MODEL_ID}
+
+    # a run that only selected the parent rebuilt it with new data for the child
+    build(parent)
+    detector = _observe(100.0, time.time() + 60)
+    assert detector.unchanged(manifest, {MODEL_ID}) == set()
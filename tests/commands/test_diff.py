@@ -0,0 +1,106 @@
+import json
+import logbook
+import pytest
+from copy import deepcopy
+from dbt.contracts.results import NodeStatus
+
+from tests.fixture_loader import ResultMock
+
+from pydbt import config
+from pydbt.cache.history import RunHistory, list_runs
+from pydbt.commands.diff import load_nodes, diff_nodes, format_table, format_diff
+from pydbt.parsers.formatter import Formatter
+
+
+@pytest.fixture(autouse=True)
+def state_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "STATE_DIR", str(tmp_path))
+
+
+def _run(results, size=10, command=("run",)):
+    history = RunHistory(list(command), size=size)
+    for result in results:
+        history.record(result, Formatter.format(result))
+    history.finalize(True)
+    return history.run_id
+
+
+def test_diff_ranks_status_changes_first():
+    before = {
+        "model.a": ["success", 10.0, 100],
+        "model.b": ["success", 2.0, 100],
+        "model.c": ["success", 5.0, 100],
+        "model.d": ["error", 1.0, None],
+        "model.removed": ["success", 1.0, None],
+    }
+    after = {
+        "model.a": ["success", 40.0, 100],
+        "model.b": ["error", 1.0, None],
+        "model.c": ["success", 5.5, 1000],
+        "model.d": ["success", 1.0, 10],
+        "model.added": ["success", 1.0, None],
+    }
+    diff = diff_nodes(before, after)
+
+    assert [(change.kind, change.unique_id) for change in diff.changes] == [
+        ("broke", "model.b"),
+        ("fixed", "model.d"),
+        ("slower", "model.a"),
+        ("rows", "model.c"),
+    ]
+    assert (diff.added, diff.removed) == (1, 1)
+    assert format_table(diff).splitlines()[2] == "SLOWER  model.a 10.0s -> 40.0s (+30.0s, 4.0x)"
+
+    msg = format_diff(diff, "previous", "last", limit=2)
+    assert msg.level == logbook.WARNING
+    assert msg.message == (
+        "*[DIFF]* `previous` -> `last`: 4 changes, first 2: broke model.b success -> error, fixed model.d error -> success"
+    )
+
+
+def test_stored_runs_are_diffed_and_pruned():
+    fixed = deepcopy(ResultMock.load_model_fixture_fail)
+    fixed.status = NodeStatus.Success
+
+    first = _run([ResultMock.load_model_fixture_fail], size=2)
+    _run([fixed], size=2)
+    _run([fixed, ResultMock.load_test_fixture], size=2)
+
+    assert first not in list_runs()
+    assert len(list_runs()) == 2
+    with pytest.raises(ValueError):
+        load_nodes(first)
+
+    diff = diff_nodes(load_nodes("previous"), load_nodes("last"))
+    assert diff.changes == []
+    assert diff.added == 1
+
+
+def test_previous_is_the_same_job():
+    fixed = deepcopy(ResultMock.load_model_fixture_fail)
+    fixed.status = NodeStatus.Success
+
+    _run([ResultMock.load_model_fixture_fail], command=["run", "-s", "tag:daily"])
+    _run([ResultMock.load_test_fixture], command=["test", "-s", "tag:hourly"])
+    _run([fixed], command=["run", "-s", "tag:daily", "--threads", "8"])
+
+    diff = diff_nodes(load_nodes("previous"), load_nodes("last"))
+    assert [change.kind for change in diff.changes] == ["fixed"]
+    assert (diff.added, diff.removed) == (0, 0)
+
+
+def test_previous_without_an_earlier_run_of_the_job():
+    _run([ResultMock.load_model_fixture], command=["run"])
+    _run([ResultMock.load_test_fixture], command=["test"])
+
+    with pytest.raises(ValueError):
+        load_nodes("previous")
+
+
+def test_run_results_files(tmp_path):
+    path = tmp_path / "run_results.json"
+    path.write_text(json.dumps({"results": [
+        {"unique_id": "model.a", "status": "success", "execution_time": 1.5, "adapter_response": {"rows_affected": 3}},
+    ]}))
+
+    assert load_nodes(str(path)) == {"model.a": ["success", 1.5, 3]}
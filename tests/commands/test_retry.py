@@ -0,0 +1,95 @@
+import pytest
+
+from tests.fixture_loader import ResultMock
+
+from pydbt import config
+from pydbt.commands.retry import RetryState
+from pydbt.parsers.formatter import Formatter
+
+
+@pytest.fixture(autouse=True)
+def state_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "STATE_DIR", str(tmp_path))
+
+
+def _record(state, result):
+    state.record(result, Formatter.format(result))
+
+
+def test_records_only_incomplete_nodes():
+    state = RetryState()
+    state.prepare(["run", "-m", "tag:daily", "--target", "prod"])
+    _record(state, ResultMock.load_model_fixture)
+    _record(state, ResultMock.load_test_fixture_fail)
+    _record(state, ResultMock.load_test_fixture_warn)
+
+    assert state.nodes == {
+        "test.transformations.not_null_package_package_id": "fqn:transformations.schema_test.not_null_package_package_id",
+    }
+
+
+def test_build_command():
+    state = RetryState()
+    state.prepare(["run", "-m", "tag:daily", "tag:hourly", "--exclude", "model_a", "--target", "prod"])
+    _record(state, ResultMock.load_model_fixture_fail)
+    state.finalize(success=False)
+
+    command = RetryState.load().build_command(["--full-refresh"])
+    assert command == [
+        "run", "--target", "prod", "--select", "fqn:transformations.booking.dbx_booking", "--full-refresh"
+    ]
+
+
+def test_nothing_to_retry():
+    state = RetryState()
+    state.prepare(["run"])
+    _record(state, ResultMock.load_model_fixture)
+    state.finalize(success=True)
+
+    assert RetryState.load().build_command() == []
+
+
+def test_other_jobs_keep_their_nodes():
+    failed = RetryState()
+    failed.prepare(["run", "-m", "tag:daily"])
+    _record(failed, ResultMock.load_model_fixture_fail)
+    failed.finalize(success=False)
+
+    other = RetryState()
+    other.prepare(["test", "-m", "tag:hourly"])
+    _record(other, ResultMock.load_test_fixture)
+    other.finalize(success=True)
+
+    # dbt raised before reporting any node
+    crashed = RetryState()
+    crashed.prepare(["run", "-m", "tag:daily"])
+    crashed.finalize(success=False)
+
+    assert RetryState.load().build_command() == ["run", "--select", "fqn:transformations.booking.dbx_booking"]
+
+
+def test_retry_updates_the_retried_job():
+    failed = RetryState()
+    failed.prepare(["run", "-m", "tag:daily"])
+    _record(failed, ResultMock.load_model_fixture_fail)
+    failed.finalize(success=False)
+
+    retry = RetryState()
+    retry.prepare(RetryState.load().build_command(["--full-refresh"]))
+    _record(retry, ResultMock.load_model_fixture)
+    retry.finalize(success=True)
+
+    assert RetryState.load_jobs() == {}
+
+
+@pytest.mark.parametrize(
+    "input,expected",
+    [
+        (["run"], True),
+        (["source", "freshness"], True),
+        (["docs", "generate"], False),
+        ([], False),
+    ],
+)
+def test_applies_to(input, expected):
+    assert RetryState.applies_to(input) == expected
@@ -0,0 +1,155 @@
+import os
+import pytest
+import networkx as nx
+from types import SimpleNamespace
+from dbt.graph.graph import Graph
+from dbt.graph.selector import NodeSelector
+
+from tests.fixture_loader import ResultMock
+
+from pydbt import config
+from pydbt.cache.history import list_runs
+from pydbt.commands.shard import (
+    ShardSelector, parse_shard_args, components, partition, shard_paths, merge_results, get_fingerprint
+)
+from pydbt.main import merge
+from pydbt.parsers.formatter import Formatter
+
+GRAPH = {
+    "model.a.orders": [],
+    "model.a.order_items": ["model.a.orders", "source.a.raw.items"],
+    "test.a.not_null_orders": ["model.a.orders"],
+    "model.a.customers": ["source.a.raw.customers"],
+    "model.a.events": [],
+    "model.a.sessions": ["model.a.events"],
+}
+
+
+@pytest.fixture(autouse=True)
+def state_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "STATE_DIR", str(tmp_path))
+
+
+@pytest.fixture
+def graph():
+    graph = nx.DiGraph()
+    for unique_id, parents in GRAPH.items():
+        graph.add_node(unique_id)
+        graph.add_edges_from((parent, unique_id) for parent in parents)
+    return Graph(graph)
+
+
+def _selected(graph, selected):
+    return graph.get_subset_graph(selected).graph
+
+
+def test_parse_shard_args():
+    assert parse_shard_args(["--total", "4", "--index=1", "build", "-s", "tag:daily"]) == (
+        4, 1, ["build", "-s", "tag:daily"]
+    )
+    with pytest.raises(ValueError, match="out of range"):
+        parse_shard_args(["--total", "2", "--index", "2", "build"])
+    with pytest.raises(ValueError, match="Usage"):
+        parse_shard_args(["build"])
+
+
+def test_components_follow_selected_dependencies(graph):
+    groups = components(_selected(graph, set(GRAPH) - {"model.a.orders"}))
+
+    assert groups == [
+        ["model.a.customers"],
+        ["model.a.events", "model.a.sessions"],
+        ["model.a.order_items"],
+        ["test.a.not_null_orders"],
+    ]
+    assert len(components(_selected(graph, set(GRAPH)))) == 3
+
+
+def test_components_keep_transitive_dependencies(graph):
+    # sessions depends on events through an unselected model
+    graph.graph.add_edges_from([("model.a.events", "model.a.pageviews"), ("model.a.pageviews", "model.a.sessions")])
+    graph.graph.remove_edge("model.a.events", "model.a.sessions")
+
+    groups = components(_selected(graph, {"model.a.events", "model.a.sessions"}))
+    assert groups == [["model.a.events", "model.a.sessions"]]
+
+
+def test_partition_balances_by_execution_time(graph):
+    groups = components(_selected(graph, set(GRAPH)))
+    weights = {"model.a.orders": 60.0, "model.a.order_items": 30.0, "model.a.events": 50.0, "model.a.sessions": 40.0}
+    shards = partition(groups, weights, 2)
+
+    assert shards[0] == {"model.a.orders", "model.a.order_items", "test.a.not_null_orders"}
+    assert shards[1] == {"model.a.events", "model.a.sessions", "model.a.customers"}
+    assert partition(groups, weights, 2) == shards
+    assert set().union(*partition(groups, {}, 4)) == set(GRAPH)
+
+
+def test_shard_selects_and_merges(graph, monkeypatch):
+    monkeypatch.setattr(NodeSelector, "get_selected", lambda selector, spec: set(GRAPH))
+    selected = []
+    for index in range(2):
+        shard = ShardSelector(total=2, index=index)
+        shard.prepare(["run", "-s", "tag:daily"])
+        selected.append(NodeSelector.get_selected(SimpleNamespace(full_graph=graph), None))
+        for result in (ResultMock.load_test_fixture, ResultMock.load_model_fixture_fail)[index:index + 1]:
+            shard.record(result, Formatter.format(result))
+        shard.finalize(success=index == 0)
+
+    assert selected[0] | selected[1] == set(GRAPH)
+    assert not selected[0] & selected[1]
+    assert NodeSelector.get_selected(None, None) == set(GRAPH)
+
+    messages, success = merge_results(shard_paths())
+    assert not success
+    assert messages[0].title == "dbt run finished: 1 error, 1 pass."
+    assert len(list_runs()) == 1
+
+
+def _store_shard(index, total, command=("run",), fingerprint=None, nodes=()):
+    shard = ShardSelector(total=total, index=index)
+    shard.command = list(command)
+    shard.fingerprint = fingerprint
+    shard.nodes = {unique_id: ["success", 1.0, None] for unique_id in nodes}
+    shard.finalize(success=True)
+
+
+def test_merge_rejects_incomplete_or_mixed_shards():
+    _store_shard(0, 2)
+    with pytest.raises(ValueError, match=r"missing \[1\]"):
+        merge_results(shard_paths())
+
+    _store_shard(1, 2)
+    _store_shard(2, 3)
+    with pytest.raises(ValueError, match="different runs"):
+        merge_results(shard_paths())
+
+    _store_shard(1, 2, command=("test",))
+    os.remove(shard_paths()[-1])
+    with pytest.raises(ValueError, match="different runs"):
+        merge_results(shard_paths())
+
+
+def test_merge_clears_stored_shards():
+    for index in range(2):
+        _store_shard(index, 2)
+    merge([])
+    assert shard_paths() == []
+
+
+def test_merge_rejects_differently_partitioned_shards():
+    _store_shard(0, 2, fingerprint="a", nodes=["model.a.orders"])
+    _store_shard(1, 2, fingerprint="b", nodes=["model.a.events"])
+    with pytest.raises(ValueError, match="partitioned from different"):
+        merge_results(shard_paths())
+
+    _store_shard(1, 2, fingerprint="a", nodes=["model.a.events", "model.a.orders"])
+    with pytest.raises(ValueError, match=r"Shard 1 ran nodes of another shard: model\.a\.orders"):
+        merge_results(shard_paths())
+
+
+def test_fingerprint_depends_on_selection_and_weights():
+    fingerprint = get_fingerprint(set(GRAPH), {"model.a.orders": 2.0})
+    assert get_fingerprint(set(GRAPH), {"model.a.orders": 2.0, "model.other": 1.0}) == fingerprint
+    assert get_fingerprint(set(GRAPH), {"model.a.orders": 3.0}) != fingerprint
+    assert get_fingerprint(set(GRAPH) - {"model.a.events"}, {"model.a.orders": 2.0}) != fingerprint
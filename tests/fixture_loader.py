@@ -30,6 +30,7 @@ class ResultMock(MagicMock):
     load_freshness_fixture = _load_freshness_file('freshness_result.json')
     load_freshness_fixture_warn = _load_freshness_file('freshness_result_warn.json')
     load_freshness_fixture_fail = _load_freshness_file('freshness_result_fail.json')
+    load_seed_fixture = _load_run_file('seed_result.json')
     load_model_fixture = _load_run_file('model_result.json')
     load_model_fixture_fail = _load_run_file('model_result_fail.json')
     load_test_fixture = _load_test_file('test_result.json')
@@ -0,0 +1,109 @@
+import pytest
+import logbook
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+
+from tests.fixture_loader import ResultMock
+
+from pydbt import config
+from pydbt.handlers.alerting.base import BaseAlert
+from pydbt.handlers.alerting.dedup import DedupAlert
+from pydbt.parsers.formatter import Formatter
+
+
+class RecordingAlert(BaseAlert):
+    def __init__(self):
+        self.sent = []
+
+    def alert(self, msg):
+        self.sent.append(msg)
+
+
+@pytest.fixture(autouse=True)
+def state_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "STATE_DIR", str(tmp_path))
+
+
+def _run(msg, reminder_interval=3600):
+    """Simulates a single pydbt run alerting one message."""
+    inner = RecordingAlert()
+    alerting = DedupAlert(inner, reminder_interval=reminder_interval)
+    alerting.alert(msg)
+    alerting.flush()
+    return inner.sent
+
+
+def test_repeated_failures_are_suppressed():
+    failure = Formatter.format(ResultMock.load_test_fixture_fail)
+
+    assert _run(failure) == [failure]
+    assert _run(failure) == []
+    # result counts are not part of the signature
+    assert _run(replace(failure, error="Got 7 results, expected 0")) == []
+
+
+def test_new_failure_signature_alerts():
+    failure = Formatter.format(ResultMock.load_test_fixture_fail)
+    _run(failure)
+
+    warning = Formatter.format(ResultMock.load_test_fixture_warn)
+    assert _run(warning) == [warning]
+
+
+def test_reminders():
+    failure = Formatter.format(ResultMock.load_test_fixture_fail)
+    _run(failure, reminder_interval=0)
+
+    sent = _run(failure, reminder_interval=0)
+    assert len(sent) == 1
+    assert sent[0].title == "Still failing (2 runs): [FAIL] Test not_null_package_package_id"
+
+
+def test_recovery_alerts_once():
+    failure = Formatter.format(ResultMock.load_test_fixture_fail)
+    _run(failure)
+    _run(failure)
+
+    success = replace(failure, level=logbook.INFO, error=None)
+    sent = _run(success)
+    assert len(sent) == 1
+    assert sent[0].level == logbook.NOTICE
+    assert sent[0].title == "Recovered: [FAIL] Test not_null_package_package_id"
+    assert sent[0].message.endswith("recovered after failing 2 run(s)")
+
+    assert _run(success) == [success]
+
+
+def test_expired_entries_alert_again():
+    failure = Formatter.format(ResultMock.load_test_fixture_fail)
+    _run(failure)
+
+    inner = RecordingAlert()
+    DedupAlert(inner, ttl=-1).alert(failure)
+    assert inner.sent == [failure]
+
+
+def test_run_level_messages_are_not_deduplicated():
+    summary = replace(
+        Formatter.format(ResultMock.load_test_fixture_fail),
+        title="dbt run finished with 1 failure(s).",
+        context={"resource_type": "run", "name": "run"},
+    )
+
+    assert _run(summary) == [summary]
+    assert _run(summary) == [summary]
+    # a successful run is not a recovery of the failed one
+    success = replace(summary, level=logbook.INFO, error=None)
+    assert _run(success) == [success]
+
+
+def test_concurrent_failures_alert_once():
+    failure = Formatter.format(ResultMock.load_test_fixture_fail)
+    inner = RecordingAlert()
+    alerting = DedupAlert(inner)
+
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(alerting.alert, [failure] * 200))
+
+    assert inner.sent == [failure]
+    assert alerting.entries[DedupAlert._get_key(failure)][3] == 200
@@ -0,0 +1,75 @@
+import os
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, date
+
+from tests.fixture_loader import ResultMock
+
+from pydbt.parsers.formatter import Formatter
+
+pytest.importorskip("pyarrow")
+from pydbt.handlers.exporters import parquet  # noqa: E402
+
+
+def _export(path, started_at, fixtures):
+    exporter = parquet.ParquetExporter(str(path), command="run")
+    exporter.run_started_at = started_at
+    for fixture in fixtures:
+        exporter.export(Formatter.format(fixture))
+    exporter.flush()
+    return exporter
+
+
+def test_export_writes_one_file_per_run(tmp_path):
+    exporter = _export(
+        tmp_path,
+        datetime(2021, 4, 7, 18),
+        [ResultMock.load_model_fixture, ResultMock.load_model_fixture_fail, ResultMock.load_test_fixture_fail],
+    )
+
+    assert os.listdir(tmp_path) == ["date=2021-04-07"]
+    assert os.listdir(tmp_path / "date=2021-04-07") == [f"{exporter.run_id}.parquet"]
+
+    table = parquet.read_results(str(tmp_path))
+    assert table.num_rows == 3
+
+    model = table.slice(0, 1).to_pylist()[0]
+    assert model["name"] == "dbx_booking"
+    assert model["level"] == "info"
+    assert model["rows"] == 5
+    assert model["execute_time"] == pytest.approx(6.054006)
+
+
+def test_read_results_prunes_columns_and_partitions(tmp_path):
+    _export(tmp_path, datetime(2021, 4, 6), [ResultMock.load_model_fixture])
+    _export(tmp_path, datetime(2021, 4, 7), [ResultMock.load_model_fixture, ResultMock.load_test_fixture])
+
+    table = parquet.read_results(str(tmp_path), columns=["name", "execution_time"], start=date(2021, 4, 7))
+    assert table.column_names == ["name", "execution_time"]
+    assert table.num_rows == 2
+
+    table = parquet.read_results(str(tmp_path), columns=["run_id"], end=date(2021, 4, 6))
+    assert table.num_rows == 1
+
+
+def test_empty_run_writes_nothing(tmp_path):
+    _export(tmp_path, datetime(2021, 4, 7), [])
+    assert os.listdir(tmp_path) == []
+
+
+def test_interrupted_flush_leaves_dataset_readable(tmp_path):
+    _export(tmp_path, datetime(2021, 4, 7), [ResultMock.load_model_fixture])
+    # what a flush abandoned mid write leaves behind
+    (tmp_path / "date=2021-04-07" / ".abandoned.parquet.tmp").write_bytes(b"PAR1")
+
+    assert parquet.read_results(str(tmp_path)).num_rows == 1
+
+
+def test_concurrent_exports_keep_rows_aligned(tmp_path):
+    exporter = parquet.ParquetExporter(str(tmp_path), command="run")
+    msg = Formatter.format(ResultMock.load_model_fixture)
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(lambda _: exporter.export(msg), range(400)))
+    exporter.flush()
+
+    assert parquet.read_results(str(tmp_path)).num_rows == 400
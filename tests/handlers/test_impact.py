@@ -0,0 +1,99 @@
+import logbook
+from copy import deepcopy
+from dbt.contracts.results import NodeStatus
+
+from tests.fixture_loader import ResultMock
+
+from pydbt.handlers.alerting.dedup import DedupAlert
+from pydbt.handlers.hooks.impact import RootCauses
+from pydbt.parsers.formatter import Formatter
+from pydbt.parsers.stream import iter_messages
+
+
+def _skipped(name, parents):
+    result = deepcopy(ResultMock.load_model_fixture)
+    result.status = NodeStatus.Skipped
+    result.node.name = name
+    result.node.unique_id = f"model.analytics.{name}"
+    result.node.depends_on.nodes = [f"model.analytics.{parent}" for parent in parents]
+    return result
+
+
+def _failed(name):
+    result = deepcopy(ResultMock.load_model_fixture_fail)
+    result.node.name = name
+    result.node.unique_id = f"model.analytics.{name}"
+    return result
+
+
+def _failed_test(name, model):
+    result = deepcopy(ResultMock.load_test_fixture_fail)
+    result.node.name = name
+    result.node.unique_id = f"test.analytics.{name}"
+    result.node.depends_on.nodes = [f"model.analytics.{model}"]
+    return result
+
+
+def _run(results, limit=5):
+    hook = RootCauses(limit=limit)
+    messages = list(iter_messages(results, [hook]))
+    return messages, hook.finalize(False)
+
+
+def test_skipped_descendants_collapse_into_root_cause():
+    results = [
+        _failed("orders"),
+        _failed("customers"),
+        _skipped("order_items", ["orders"]),
+        _skipped("revenue", ["order_items", "customers"]),
+        _skipped("churn", ["customers"]),
+        ResultMock.load_model_fixture,
+    ]
+    messages, collapsed = _run(results)
+
+    assert [msg.reporting.impact for msg in messages] == [None, None, None]
+    assert [msg.context["impacted"] for msg in collapsed] == [2, 2]
+    assert collapsed[0].title == "Failure of orders skipped 2 downstream node(s)."
+    assert collapsed[0].message.endswith("failed and skipped order_items, revenue")
+    assert collapsed[1].message.endswith("failed and skipped churn, revenue")
+    assert all(msg.level == logbook.WARNING for msg in collapsed)
+
+
+def test_build_skips_after_failing_tests_are_attributed():
+    results = [
+        ResultMock.load_model_fixture,
+        _failed_test("not_null_orders_id", "orders"),
+        _skipped("order_items", ["orders"]),
+    ]
+    messages, collapsed = _run(results)
+
+    assert len(messages) == 2
+    assert collapsed[0].title == "Failure of not_null_orders_id skipped 1 downstream node(s)."
+
+
+def test_impact_is_not_deduplicated_with_the_failure():
+    failure = Formatter.format(_failed("orders"))
+    _, collapsed = _run([_failed("orders"), _skipped("order_items", ["orders"])])
+
+    assert collapsed[0].context["resource_type"] == "impact"
+    assert DedupAlert._get_key(collapsed[0]) != DedupAlert._get_key(failure)
+
+
+def test_impacted_list_is_bounded():
+    results = [_failed("orders")] + [_skipped(f"child_{idx:02d}", ["orders"]) for idx in range(40)]
+    _, collapsed = _run(results, limit=2)
+
+    assert collapsed[0].reporting.impact == 40
+    assert collapsed[0].message.endswith("skipped 40 nodes, first 2: child_00, child_01")
+
+
+def test_unattributed_skips_are_kept():
+    messages, collapsed = _run([_skipped("orphan", ["unknown"])])
+
+    assert len(messages) == 1
+    assert collapsed == []
+
+
+def test_formatter_message_is_unchanged():
+    result = _skipped("orders", [])
+    assert _run([result])[0][0] == Formatter.format(result)
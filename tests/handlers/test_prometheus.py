@@ -0,0 +1,70 @@
+import os
+from prometheus_client.parser import text_string_to_metric_families
+
+from tests.fixture_loader import ResultMock
+
+from pydbt.handlers.monitors import prometheus
+from pydbt.handlers.monitors.prometheus import PrometheusMonitor
+from pydbt.parsers.formatter import Formatter
+
+
+def _monitor(tmp_path, **kwargs):
+    monitor = PrometheusMonitor(textfile_dir=str(tmp_path), common_tags={"command": "run"}, **kwargs)
+    monitor.initialize()
+    return monitor
+
+
+def test_textfile_written_on_flush(tmp_path):
+    monitor = _monitor(tmp_path)
+    monitor.report(Formatter.format(ResultMock.load_model_fixture))
+    assert os.listdir(tmp_path) == []
+
+    monitor.flush()
+    assert os.listdir(tmp_path) == [os.path.basename(monitor.textfile_path)]
+
+    with open(monitor.textfile_path) as fh:
+        families = {family.name: family for family in text_string_to_metric_families(fh.read())}
+
+    rows = families["dbt_rows_moved"].samples[0]
+    assert rows.value == 5
+    assert rows.labels["command"] == "run"
+
+
+def test_dropped_rows_add_up_to_the_total(tmp_path):
+    monitor = _monitor(tmp_path)
+    monitor.report(Formatter.format(ResultMock.load_model_fixture))
+    monitor.report_dropped_rows({"model": 20})
+    monitor.flush()
+
+    with open(monitor.textfile_path) as fh:
+        families = {family.name: family for family in text_string_to_metric_families(fh.read())}
+
+    assert sum(sample.value for sample in families["dbt_rows_moved"].samples) == 25
+
+
+def test_textfile_per_job(tmp_path):
+    for job in ("nightly/finance", "hourly"):
+        monitor = _monitor(tmp_path, job=job)
+        monitor.flush()
+
+    assert sorted(os.listdir(tmp_path)) == ["hourly.prom", "nightly_finance.prom"]
+
+
+def test_default_job_per_selection(tmp_path):
+    for command in (["run", "-s", "tag:daily"], ["run", "-s", "tag:hourly"], ["run", "-s", "tag:daily"]):
+        monitor = _monitor(tmp_path, command=command)
+        monitor.flush()
+
+    files = sorted(os.listdir(tmp_path))
+    assert len(files) == 2
+    assert all(name.startswith("dbt_run_") for name in files)
+
+
+def test_pushgateway_uses_the_job(monkeypatch):
+    pushed = []
+    monkeypatch.setattr(prometheus, "push_to_gateway", lambda gateway, job, registry: pushed.append((gateway, job)))
+
+    monitor = PrometheusMonitor(host="localhost", port="9091", job="nightly")
+    monitor.initialize()
+    monitor.flush()
+    assert pushed == [("localhost:9091", "nightly")]
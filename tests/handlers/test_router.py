@@ -0,0 +1,123 @@
+import random
+import pytest
+import logbook
+from dataclasses import replace
+
+from tests.fixture_loader import ResultMock
+
+from pydbt.handlers import alert
+from pydbt.handlers.alerting.base import BaseAlert
+from pydbt.handlers.alerting.router import Route, RouteIndex, RoutingAlert
+from pydbt.parsers.formatter import Formatter
+
+
+class RecordingAlert(BaseAlert):
+    def __init__(self):
+        self.sent = []
+
+    def alert(self, msg):
+        self.sent.append(msg)
+
+
+ROUTES = [
+    Route.from_dict({"match": {"package_name": "finance"}, "destination": "finance"}),
+    Route.from_dict({"match": {"tags": ["pii", "gdpr"]}, "level": "error", "destination": "privacy"}),
+    Route.from_dict({"match": {"resource_type": "test", "tags": "schema"}, "destination": "quality"}),
+]
+
+
+def test_route_matching():
+    router = RoutingAlert({}, ROUTES, default="default")
+
+    model = Formatter.format(ResultMock.load_model_fixture)
+    assert router.route(model) == ["default"]
+
+    # pii tagged model failures go to the privacy channel
+    model_fail = Formatter.format(ResultMock.load_model_fixture_fail)
+    assert router.route(model_fail) == ["privacy"]
+
+    test_fail = Formatter.format(ResultMock.load_test_fixture_fail)
+    assert router.route(test_fail) == ["quality"]
+
+    finance = replace(test_fail, context={**test_fail.context, "package_name": "Finance"})
+    assert router.route(finance) == ["finance", "quality"]
+
+
+def test_alert_dispatch():
+    destinations = {"privacy": RecordingAlert(), "default": RecordingAlert()}
+    router = RoutingAlert(destinations, ROUTES, default="default")
+
+    msg = Formatter.format(ResultMock.load_model_fixture_fail)
+    router.alert(msg)
+    assert destinations["privacy"].sent == [msg]
+    assert destinations["default"].sent == []
+
+
+def test_index_matches_linear_scan():
+    rng = random.Random(7)
+    values = {
+        "package_name": ["a", "b", "c"],
+        "resource_type": ["model", "test", "source"],
+        "tags": ["x", "y", "z", "w"],
+        "owner": ["team_a", "team_b"],
+    }
+    levels = [logbook.NOTSET, logbook.WARNING, logbook.ERROR]
+
+    routes = []
+    for idx in range(200):
+        match = {
+            key: rng.sample(options, rng.randint(1, 2))
+            for key, options in values.items()
+            if rng.random() < 0.4
+        }
+        routes.append(Route.from_dict({"match": match, "level": rng.choice(levels), "destination": str(idx)}))
+    index = RouteIndex(routes)
+
+    msg = Formatter.format(ResultMock.load_model_fixture)
+    for _ in range(500):
+        context = {key: rng.choice(options) for key, options in values.items() if rng.random() < 0.8}
+        if "tags" in context:
+            context["tags"] = ", ".join(rng.sample(values["tags"], rng.randint(1, 3)))
+        sample = replace(msg, context=context, level=rng.choice(levels + [logbook.INFO]))
+
+        assert index.match(sample) == [route for route in routes if route.matches(sample)]
+
+
+def test_init_routing(tmp_path, monkeypatch):
+    rules = tmp_path / "routes.yml"
+    rules.write_text(
+        "destinations:\n"
+        "  finance: {type: slack, url: 'http://localhost'}\n"
+        "  default: {type: dummy}\n"
+        "default: default\n"
+        "routes:\n"
+        "  - match: {package_name: finance}\n"
+        "    level: warning\n"
+        "    destination: finance\n"
+    )
+    monkeypatch.setattr(alert, "ALERT_ROUTES", str(rules))
+
+    router = alert.init()
+    assert isinstance(router, RoutingAlert)
+    assert router.index.routes[0].level == logbook.WARNING
+    assert sorted(router.destinations) == ["default", "finance"]
+
+
+@pytest.mark.parametrize(
+    "rules,error",
+    [
+        ("destinations:\n  finance: {type: slak}\n", "Unknown type `slak`"),
+        ("destinations:\n  finance: {type: dummy}\ndefault: fnance\n", "Unknown alert destination `fnance`"),
+        (
+            "destinations:\n  finance: {type: dummy}\nroutes:\n  - destination: privacy\n",
+            "Unknown alert destination `privacy`",
+        ),
+    ],
+)
+def test_init_routing_rejects_unknown_destinations(tmp_path, monkeypatch, rules, error):
+    path = tmp_path / "routes.yml"
+    path.write_text(rules)
+    monkeypatch.setattr(alert, "ALERT_ROUTES", str(path))
+
+    with pytest.raises(ValueError, match=error):
+        alert.init()
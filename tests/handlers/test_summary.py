@@ -0,0 +1,62 @@
+import logbook
+import pytest
+
+from tests.fixture_loader import ResultMock
+
+from pydbt.handlers.hooks.summary import RunSummary, percentile
+from pydbt.parsers.formatter import Formatter
+
+RESULTS = [
+    ResultMock.load_model_fixture,
+    ResultMock.load_model_fixture_fail,
+    ResultMock.load_test_fixture,
+    ResultMock.load_test_fixture_fail,
+    ResultMock.load_snaphot_fixture,
+]
+
+
+def _summarize(results, slowest=2):
+    summary = RunSummary(["run", "-m", "tag:daily"], slowest=slowest)
+    for result in results:
+        summary.record(result, Formatter.format(result))
+    return summary
+
+
+@pytest.mark.parametrize("pct,expected", [(50, 3), (90, 5), (99, 5), (0, 1)])
+def test_percentile(pct, expected):
+    assert percentile([1, 2, 3, 4, 5], pct) == expected
+
+
+def test_compute():
+    stats = _summarize(RESULTS).compute()
+
+    assert stats.nodes == {
+        "model": {"success": 1, "error": 1},
+        "test": {"pass": 1, "fail": 1},
+        "snapshot": {"success": 1},
+    }
+    times = [result.execution_time for result in RESULTS]
+    assert stats.execution_time["total"] == pytest.approx(sum(times))
+    assert stats.execution_time["max"] == max(times)
+    assert [name for name, _ in stats.slowest] == [
+        "snapshot.transformations.person_company_snapshot",
+        "model.transformations.dbx_booking",
+    ]
+    assert stats.rows == {"transformations": 5}
+
+
+def test_single_summary_message():
+    messages = _summarize(RESULTS).finalize(False)
+
+    assert len(messages) == 1
+    msg = messages[0]
+    assert msg.level == logbook.ERROR
+    assert msg.title == "dbt run finished: 1 error, 1 fail, 1 pass, 2 success."
+    assert msg.reporting.summary.rows == {"transformations": 5}
+
+
+def test_empty_run_has_no_summary():
+    assert _summarize([]).finalize(True) == []
+    assert _summarize([ResultMock.load_model_fixture], slowest=5).compute().slowest == [
+        ("model.transformations.dbx_booking", ResultMock.load_model_fixture.execution_time)
+    ]
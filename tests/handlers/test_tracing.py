@@ -0,0 +1,81 @@
+from sentry_sdk import Client, Hub
+from sentry_sdk.transport import Transport
+
+from tests.fixture_loader import ResultMock
+
+from pydbt.handlers.hooks.tracing import SentryTracing
+from pydbt.parsers.formatter import Formatter
+
+
+class CaptureTransport(Transport):
+    def __init__(self):
+        Transport.__init__(self)
+        self.transactions = []
+
+    def capture_envelope(self, envelope):
+        self.transactions.append(envelope.get_transaction_event())
+
+
+def _run(results, sample_rate=1.0, success=True):
+    transport = CaptureTransport()
+    hook = SentryTracing(Hub(Client(transport=transport, traces_sample_rate=sample_rate)))
+    hook.prepare(["run", "-s", "tag:daily"])
+    for result in results:
+        hook.record(result, Formatter.format(result))
+    hook.finalize(success)
+    return hook, transport.transactions
+
+
+def test_spans_are_built_from_node_timing():
+    model, failed = ResultMock.load_model_fixture, ResultMock.load_test_fixture_fail
+    # errored nodes without timing did not run and get no span
+    _, transactions = _run([model, failed, ResultMock.load_model_fixture_fail], success=False)
+
+    assert len(transactions) == 1
+    transaction = transactions[0]
+    assert transaction["transaction"] == "dbt run"
+    assert transaction["contexts"]["trace"]["status"] == "internal_error"
+    assert transaction["tags"]["selection"] == "run -s tag:daily"
+
+    nodes = [span for span in transaction["spans"] if span["op"] in ("dbt.model", "dbt.test")]
+    phases = [span for span in transaction["spans"] if span["op"] in ("dbt.compile", "dbt.execute")]
+    assert len(nodes) == 2
+    assert len(phases) == 4
+
+    span = next(span for span in nodes if span["description"] == model.node.unique_id)
+    assert span["start_timestamp"] == "2021-04-07T18:18:48.185887Z"
+    assert span["timestamp"] == "2021-04-07T18:18:55.131509Z"
+    assert span["tags"]["dbt.status"] == "success"
+    assert next(span for span in nodes if span["op"] == "dbt.test")["tags"]["status"] == "failed_precondition"
+    assert {phase["parent_span_id"] for phase in phases if phase["description"] == model.node.unique_id} == {
+        span["span_id"]
+    }
+
+
+def test_unsampled_runs_keep_nothing():
+    hook, transactions = _run([ResultMock.load_model_fixture], sample_rate=0.0)
+
+    assert transactions == []
+    assert hook.nodes == []
+
+
+def test_crashed_runs_are_finished_on_close():
+    transport = CaptureTransport()
+    hook = SentryTracing(Hub(Client(transport=transport, traces_sample_rate=1.0)))
+    hook.prepare(["run"])
+    hook.record(ResultMock.load_model_fixture, Formatter.format(ResultMock.load_model_fixture))
+    # dbt raised, finalize was never called
+    hook.close()
+    hook.close()
+
+    assert len(transport.transactions) == 1
+    transaction = transport.transactions[0]
+    assert transaction["contexts"]["trace"]["status"] == "internal_error"
+    assert len([span for span in transaction["spans"] if span["op"] == "dbt.model"]) == 1
+
+
+def test_close_after_finalize_sends_nothing_more():
+    hook, transactions = _run([ResultMock.load_model_fixture])
+    hook.close()
+
+    assert len(transactions) == 1
@@ -0,0 +1,84 @@
+import os
+import json
+import pytest
+from dataclasses import replace
+
+from tests.fixture_loader import ResultMock
+
+from pydbt.handlers.monitors.base import BaseMonitor
+from pydbt.parsers.adapter import detect_adapter, parse_adapter_response
+from pydbt.parsers.formatter import Formatter
+from pydbt.types import AdapterStats
+
+
+def _load_responses():
+    path = os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "fixtures", "adapter_responses.json")
+    with open(path) as fh:
+        return json.load(fh)
+
+
+RESPONSES = _load_responses()
+
+
+class RecordingMonitor(BaseMonitor):
+    def __init__(self):
+        self.metrics = {}
+
+    def initialize(self):
+        pass
+
+    def increment(self, name, value=1, tags=None, sample_rate=1):
+        self.metrics[name] = value
+
+    def gauge(self, name, value, tags=None, sample_rate=1):
+        self.metrics[name] = value
+
+
+@pytest.mark.parametrize(
+    "adapter,rows,expected",
+    [
+        (
+            "bigquery",
+            1200,
+            AdapterStats(
+                adapter="bigquery",
+                code="MERGE",
+                query_id="b6f0c3a2-7f5e-4c1d-9a8e-2d7c1b9e0f31",
+                bytes_processed=3650722201,
+                bytes_billed=3651141632,
+                slot_ms=48211,
+            ),
+        ),
+        (
+            "snowflake",
+            1,
+            AdapterStats(adapter="snowflake", code="SUCCESS", query_id="01a2b3c4-0000-1f2e-0000-00014a3b5c6d"),
+        ),
+        ("postgres", 42, AdapterStats(adapter="sql", code="INSERT")),
+    ],
+)
+def test_parse_adapter_response(adapter, rows, expected):
+    assert parse_adapter_response(RESPONSES[adapter]) == (rows, expected)
+
+
+def test_parse_empty_adapter_response():
+    assert parse_adapter_response({}) == (None, None)
+    assert detect_adapter({"code": "SELECT"}) == "sql"
+
+
+def test_report_warehouse():
+    msg = Formatter.format(ResultMock.load_model_fixture)
+    rows, adapter = parse_adapter_response(RESPONSES["bigquery"])
+    msg = replace(msg, reporting=replace(msg.reporting, rows=rows, adapter=adapter, execution_time=10.0, sample_rate=0.5))
+
+    stats = RecordingMonitor()
+    stats.report_warehouse(msg)
+
+    assert stats.metrics == {
+        "dbt.rows.per_second": 120.0,
+        "dbt.bytes.per_second": 365072220.1,
+        # counters are scaled back up by the sample rate
+        "dbt.bytes.processed": 7301444402,
+        "dbt.bytes.billed": 7302283264,
+        "dbt.slot.ms": 96422,
+    }
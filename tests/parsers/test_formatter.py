@@ -5,7 +5,7 @@ from dateutil.tz import tzutc
 from tests.fixture_loader import ResultMock
 
 from pydbt.parsers.formatter import Formatter
-from pydbt.types import Freshness, Message, Reporting
+from pydbt.types import AdapterStats, Freshness, Message, Reporting
 
 from dbt.contracts.results import TimingInfo
 from dbt.contracts.graph.unparsed import TimePeriod
@@ -77,6 +77,7 @@ def test_get_freshness(input, expected):
                     ),
                 ],
                 freshness=None,
+                adapter=AdapterStats(adapter="sql", code="SUCCESS"),
             ),
         ),
         (
@@ -232,6 +233,7 @@ def test_get_source_components(input, expected):
                         ),
                     ],
                     freshness=None,
+                    adapter=AdapterStats(adapter="sql", code="SUCCESS"),
                 ),
             ),
         ),
@@ -518,6 +520,7 @@ def test_get_snapshot_components(input, expected):
                         ),
                     ],
                     freshness=None,
+                    adapter=AdapterStats(adapter="sql", code="SUCCESS"),
                 ),
             ),
         ),
@@ -670,3 +673,25 @@ def test_get_snapshot_components(input, expected):
 def test_format(input, expected):
     result = Formatter.format(input)
     assert result == expected
+
+
+def test_format_seed(tmp_path):
+    seed = ResultMock.load_seed_fixture
+    result = Formatter.format(seed)
+
+    assert result.title == "Seed loaded."
+    assert result.message == "*[SUCCESS]* seed `WAREHOUSE_LOCAL.REFERENCE.COUNTRY_CODES` loaded 249 rows in 12.5s, 20 rows/s"
+    assert result.context["materialized"] == "seed"
+    assert result.reporting.rows == 249
+    assert result.reporting.file_size is None
+
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "country_codes.csv").write_text("code,name\n" * 200)
+    seed.node.root_path = str(tmp_path)
+    try:
+        result = Formatter.format(seed)
+    finally:
+        seed.node.root_path = "/root/project"
+
+    assert result.reporting.file_size == 2000
+    assert "loaded 249 rows (2.0 KiB) in 12.5s" in result.message
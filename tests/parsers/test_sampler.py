@@ -0,0 +1,69 @@
+import logbook
+from dataclasses import replace
+
+from tests.fixture_loader import ResultMock
+
+from pydbt.parsers.formatter import Formatter
+from pydbt.parsers.sampler import Sampler, parse_rates
+
+
+def _messages(msg, count):
+    return [replace(msg, context={**msg.context, "name": f"model_{idx}"}) for idx in range(count)]
+
+
+def test_parse_rates():
+    assert parse_rates("model=0.1, test = 0.01") == {"model": 0.1, "test": 0.01}
+    assert parse_rates(None) == {}
+
+
+def test_failures_are_always_kept():
+    sampler = Sampler(rate=0.0, rates={})
+    failure = Formatter.format(ResultMock.load_model_fixture_fail)
+
+    assert sampler.sample(failure) is failure
+    assert sampler.dropped == 0
+
+
+def test_successes_are_sampled_deterministically():
+    success = Formatter.format(ResultMock.load_model_fixture)
+    messages = _messages(success, 1000)
+
+    sampler = Sampler(rate=1.0, rates={"model": 0.1}, slow_threshold=3600)
+    kept = [sampled for sampled in map(sampler.sample, messages) if sampled]
+
+    assert 50 < len(kept) < 150
+    assert all(msg.reporting.sample_rate == 0.1 for msg in kept)
+    assert sampler.dropped == 1000 - len(kept)
+    assert sampler.totals[("model", "info")] == 1000
+    # rows of dropped nodes are summed exactly instead of scaling up the kept ones
+    assert sampler.dropped_rows["model"] == sampler.dropped * success.reporting.rows
+
+    # the same nodes are sampled on every run
+    again = Sampler(rate=1.0, rates={"model": 0.1}, slow_threshold=3600)
+    assert [sampled for sampled in map(again.sample, messages) if sampled] == kept
+
+
+def test_slow_nodes_are_always_kept():
+    success = Formatter.format(ResultMock.load_model_fixture)
+    slow = replace(success, reporting=replace(success.reporting, execution_time=120.0))
+
+    sampler = Sampler(rate=0.0, rates={}, slow_threshold=60)
+    assert sampler.sample(slow) is slow
+    assert sampler.sample(success) is None
+
+
+def test_unchanged_seed_reloads_are_always_kept():
+    context = Formatter.format(ResultMock.load_seed_fixture).context
+    reload = Formatter.format_seed_reload(context, 30.0)
+
+    sampler = Sampler(rate=0.0, rates={}, slow_threshold=60)
+    assert sampler.sample(reload) is reload
+
+
+def test_sampling_disabled_by_default():
+    sampler = Sampler(rate=1.0, rates={})
+    success = Formatter.format(ResultMock.load_model_fixture)
+
+    assert not sampler.enabled
+    assert sampler.sample(success) is success
+    assert success.level == logbook.INFO
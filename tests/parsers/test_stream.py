@@ -0,0 +1,53 @@
+import gc
+import weakref
+from dbt.contracts.results import RunExecutionResult
+
+from tests.fixture_loader import _load_run_file, _load_test_file
+
+from pydbt.parsers import stream
+from pydbt.handlers.hooks.base import BaseHook
+
+
+class RecordingHook(BaseHook):
+    def __init__(self):
+        self.recorded = []
+
+    def record(self, result, msg):
+        self.recorded.append((result.node.unique_id, msg.title))
+
+
+def _run():
+    results = [
+        _load_run_file("model_result.json"),
+        _load_test_file("test_result_fail.json"),
+        _load_run_file("snapshot_result.json"),
+    ]
+    return RunExecutionResult(results=results, elapsed_time=1.0)
+
+
+def test_iter_results_preserves_order_and_drains():
+    res = _run()
+    ids = [result.node.unique_id for result in res.results]
+
+    assert [result.node.unique_id for result in stream.iter_results(res)] == ids
+    assert res.results == []
+
+
+def test_results_are_released_once_reported():
+    res = _run()
+    first = weakref.ref(res.results[0])
+
+    messages = stream.iter_messages(stream.iter_results(res))
+    next(messages)
+    next(messages)
+    gc.collect()
+
+    assert first() is None
+
+
+def test_iter_messages_records_hooks():
+    hook = RecordingHook()
+    messages = list(stream.iter_messages(stream.iter_results(_run()), [hook]))
+
+    assert [msg.title for msg in messages] == [title for _, title in hook.recorded]
+    assert hook.recorded[0] == ("model.transformations.dbx_booking", "Incremental model success.")
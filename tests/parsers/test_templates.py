@@ -0,0 +1,55 @@
+import pytest
+from copy import deepcopy
+
+from tests.fixture_loader import ResultMock
+
+from pydbt.parsers.formatter import Formatter
+from pydbt.parsers.templates import Templates, Template, Fields, FIELDS
+
+
+def _fields(result):
+    return Fields(result, Formatter._get_reporting(result))
+
+
+def test_wide_fan_in_is_bounded():
+    result = deepcopy(ResultMock.load_model_fixture)
+    result.node.depends_on.nodes = [f"model.analytics.parent_{idx:02d}" for idx in range(87)]
+
+    message = Templates(list_limit=3).render("message", "model", _fields(result))
+    assert message.endswith(
+        "depends on `87 nodes, first 3: MODEL.ANALYTICS.PARENT_00, MODEL.ANALYTICS.PARENT_01, MODEL.ANALYTICS.PARENT_02`"
+    )
+
+
+def test_overrides_per_status_fall_back_to_resource_type():
+    templates = Templates({"model.error": {"title": "{name} failed after {execution_time:.0f}s"}})
+
+    failed = _fields(ResultMock.load_model_fixture_fail)
+    assert templates.render("title", "model", failed) == "dbx_booking failed after 2s"
+    assert templates.render("message", "model", failed).startswith("*[ERROR]* model")
+    assert templates.render("title", "model", _fields(ResultMock.load_model_fixture)) == "Incremental model success."
+
+
+def test_fields_are_only_computed_when_rendered(monkeypatch):
+    monkeypatch.setitem(FIELDS, "depends_on", lambda result, reporting: pytest.fail("depends_on was rendered"))
+    fields = _fields(ResultMock.load_model_fixture)
+
+    assert Template("{name|upper}").render(fields) == "DBX_BOOKING"
+    assert "depends_on" not in fields.values
+
+
+def test_invalid_templates_fail_at_startup():
+    with pytest.raises(ValueError, match="Unknown field `owner`"):
+        Templates({"model": {"title": "{owner}"}})
+
+    # fields of other resource types would fail while rendering
+    with pytest.raises(ValueError, match="Field `age` is not available"):
+        Templates({"model": {"title": "{name} {age}"}})
+    with pytest.raises(ValueError, match="Field `depends_on` is not available"):
+        Templates({"source.warn": {"message": "{depends_on}"}})
+
+    with pytest.raises(ValueError, match="Unsupported filter"):
+        Template("{name|title}")
+
+    with pytest.raises(ValueError, match="Unknown template part"):
+        Templates({"model": {"footer": "{name}"}})
@@ -1,3 +1,5 @@
+import io
+import json
 import pytest
 import logbook
 
@@ -41,3 +43,112 @@ def test_dbt_to_log_status(input, expected):
 def test_logbook_status_to_color(input, expected):
     result = logger.logbook_status_to_color(input)
     assert result == expected
+
+
+def test_get_file_context(tmp_path):
+    path = tmp_path / "model.sql"
+    path.write_text("\n".join(f"line {idx}" for idx in range(20)) + "x" * 2000)
+
+    pre_context, post_context = logger.get_file_context(str(path))
+    assert pre_context == ("line 0",)
+    assert post_context == ("line 2", "line 3", "line 4", "line 5", "line 6")
+
+    long_line = tmp_path / "compiled.sql"
+    long_line.write_text("y" * 5000)
+    pre_context, post_context = logger.get_file_context(str(long_line))
+    assert len(pre_context[0]) == logger.FILE_CONTEXT_MAX_LINE_LENGTH
+
+    assert logger.get_file_context(str(tmp_path / "missing.sql")) == ((), ())
+    assert logger.get_file_context(None) == ((), ())
+
+
+def test_sentry_handler_scopes_tags(tmp_path):
+    import sentry_sdk
+    from sentry_sdk.hub import Hub
+
+    events = []
+    hub = Hub(sentry_sdk.Client(dsn="https://public@example.com/1", transport=events.append))
+    handler = logger.SentryHandler(level=logbook.WARNING)
+    log = logbook.Logger("test")
+
+    with hub, handler.applicationbound():
+        with logger.AppendTags({"name": "model_a", "app": "dbt"}):
+            log.error("failed", trace="boom", context={"abs_path": str(tmp_path / "a.sql")})
+        with logger.AppendTags({"name": "model_b"}):
+            log.error("failed", trace="boom", context={})
+
+    assert [event["tags"]["name"] for event in events] == ["model_a", "model_b"]
+    assert "app" not in events[1]["tags"]
+    assert events[0]["exception"]["value"] == "boom"
+    assert hub.scope._tags == {}
+
+
+class UnflushedStream(io.BytesIO):
+    def __init__(self):
+        super().__init__()
+        self.flushed = b""
+
+    def flush(self):
+        self.flushed = self.getvalue()
+
+
+@pytest.mark.parametrize("background", [False, True])
+def test_json_handler(background):
+    stream = UnflushedStream()
+    handler = logger.JsonHandler(stream=stream, background=background)
+    log = logbook.Logger("test")
+
+    with handler.applicationbound():
+        with logger.AppendTags({"name": "model_a"}):
+            log.info("model ran", context={"rows": 5})
+            log.warning("model {failed}", trace="boom")
+
+    handler.close()
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [line["message"] for line in lines] == ["model ran", "model {failed}"]
+    assert lines[0]["context"] == {"rows": 5}
+    assert lines[0]["tags"] == {"name": "model_a"}
+    assert lines[1]["level"] == "warning"
+    assert lines[1]["trace"] == "boom"
+    assert stream.flushed == stream.getvalue()
+
+
+def test_json_handler_flushes_on_warning():
+    stream = UnflushedStream()
+    handler = logger.JsonHandler(stream=stream)
+    log = logbook.Logger("test")
+
+    with handler.applicationbound():
+        log.info("buffered")
+        assert stream.flushed == b""
+        log.warning("flushed")
+        assert stream.flushed.count(b"\n") == 2
+
+    handler.close()
+
+
+class TextStream(io.TextIOWrapper):
+    def __init__(self):
+        super().__init__(UnflushedStream(), encoding="utf-8")
+
+
+def test_json_handler_keeps_stdout_in_order(monkeypatch):
+    stdout = TextStream()
+    monkeypatch.setattr(logger.sys, "stdout", stdout)
+    handler = logger.JsonHandler()
+    log = logbook.Logger("test")
+
+    with handler.applicationbound():
+        stdout.write("dbt output\n")
+        log.info("model ran")
+        stdout.write("more dbt output\n")
+        log.info("model ran again")
+        stdout.flush()
+
+    handler.close()
+    lines = stdout.buffer.getvalue().splitlines()
+    assert lines[0] == b"dbt output"
+    assert json.loads(lines[1])["message"] == "model ran"
+    assert lines[2] == b"more dbt output"
+    assert json.loads(lines[3])["message"] == "model ran again"
+    assert not stdout.buffer.closed
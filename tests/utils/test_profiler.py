@@ -0,0 +1,70 @@
+import pstats
+from concurrent.futures import ThreadPoolExecutor
+
+from pydbt.main import parse_profile_flag, DEFAULT_PROFILE_PATH
+from pydbt.handlers.monitors.base import BaseMonitor
+from pydbt.utils.profiler import Profiler
+
+
+class RecordingMonitor(BaseMonitor):
+    def __init__(self):
+        self.timings = {}
+
+    def initialize(self):
+        pass
+
+    def timing(self, name, value, tags=None, sample_rate=1):
+        self.timings[name] = value
+
+
+def test_phases_accumulate():
+    profiler = Profiler()
+    for _ in range(3):
+        with profiler.phase("alert"):
+            pass
+    profiler.add("dbt", 10.0)
+    profiler.add("log", 0.5)
+
+    assert list(profiler.phases) == ["alert", "dbt", "log"]
+    # time spent in dbt is not pydbt's overhead
+    assert 0.5 <= profiler.overhead < 1
+
+
+def test_concurrent_phases_are_not_lost():
+    profiler = Profiler()
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(lambda _: profiler.add("format", 0.001), range(2000)))
+
+    assert round(profiler.phases["format"], 6) == 2.0
+
+
+def test_timed_iter():
+    profiler = Profiler()
+    assert list(profiler.timed_iter("format", range(3))) == [0, 1, 2]
+    assert "format" in profiler.phases
+
+
+def test_report_phases():
+    profiler = Profiler()
+    profiler.add("dbt", 2.0)
+    profiler.add("monitor", 0.25)
+
+    stats = RecordingMonitor()
+    profiler.report(stats)
+    assert stats.timings == {"pydbt.dbt.time": 2.0, "pydbt.monitor.time": 0.25}
+
+
+def test_profile_dump(tmp_path):
+    path = str(tmp_path / "pydbt.prof")
+    profiler = Profiler(path)
+    profiler.start_profile()
+    sorted(range(100))
+    profiler.stop_profile()
+
+    assert pstats.Stats(path).total_calls > 0
+
+
+def test_parse_profile_flag():
+    assert parse_profile_flag(["run", "--profile", "prod"]) == (None, ["run", "--profile", "prod"])
+    assert parse_profile_flag(["--profile", "run"]) == (DEFAULT_PROFILE_PATH, ["run"])
+    assert parse_profile_flag(["--profile=out.prof", "run"]) == ("out.prof", ["run"])
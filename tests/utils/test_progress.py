@@ -0,0 +1,72 @@
+import time
+import networkx as nx
+import pytest
+from types import SimpleNamespace
+from dbt.task.runnable import GraphRunnableTask
+
+from pydbt.utils.progress import Progress, ProgressReporter, format_duration
+
+
+def _graph():
+    # a -> b -> c, d runs on its own and e is ephemeral
+    graph = nx.DiGraph([("a", "b"), ("b", "c"), ("e", "c")])
+    graph.add_node("d")
+    return graph
+
+
+def test_eta_follows_the_longest_remaining_chain():
+    progress = Progress(_graph(), {"a": 10, "b": 20, "c": 5, "d": 10}, threads=2, ignored={"e"})
+    stats = progress.snapshot()
+    assert (stats.total, stats.completed, stats.remaining) == (4, 0, 4)
+    assert stats.eta == pytest.approx(35)
+
+    progress.start("a")
+    progress.finish("a")
+    progress.start("d")
+    stats = progress.snapshot()
+    assert (stats.completed, stats.running, stats.remaining) == (1, 1, 2)
+    assert stats.eta == pytest.approx(25, abs=0.1)
+
+    # a node dbt reports twice is only counted once
+    progress.finish("a")
+    assert progress.snapshot().completed == 1
+
+
+def test_eta_without_history_uses_observed_durations():
+    progress = Progress(_graph(), {}, threads=1, ignored={"e"})
+    assert progress.snapshot().eta is None
+
+    progress.start("d")
+    time.sleep(0.05)
+    progress.finish("d")
+    assert progress.snapshot().eta == pytest.approx(0.15, abs=0.05)
+
+
+def test_reporter_ticks_and_cleans_up():
+    reported = []
+    task = SimpleNamespace(
+        job_queue=SimpleNamespace(graph=_graph()),
+        _flattened_nodes=[],
+        config=SimpleNamespace(threads=4),
+    )
+    original = GraphRunnableTask.call_runner
+
+    with ProgressReporter(["run"], reported.append, {"a": 1.0}, interval=0.01) as reporter:
+        assert GraphRunnableTask.call_runner is not original
+        reporter.begin(task)
+        time.sleep(0.05)
+
+    assert GraphRunnableTask.call_runner is original
+    assert not reporter.thread.is_alive()
+    assert reported[0].reporting.progress.total == 5
+    assert reported[0].message.startswith("*[PROGRESS]* 0/5 node(s) done")
+
+    # the last report leaves nothing running once dbt is done
+    final = reported[-1].reporting.progress
+    assert (final.running, final.remaining, final.eta) == (0, 5, 0.0)
+
+
+def test_format_duration():
+    assert format_duration(42) == "42s"
+    assert format_duration(125) == "2m 5s"
+    assert format_duration(7260) == "2h 1m"
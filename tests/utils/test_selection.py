@@ -0,0 +1,13 @@
+from dbt.graph.selector import NodeSelector
+
+from pydbt.utils.selection import add_selection_filter, clear_selection_filters
+
+
+def test_clear_restores_dbt_selection():
+    original = NodeSelector.get_selected
+    add_selection_filter(lambda selector, selected: selected)
+    add_selection_filter(lambda selector, selected: set())
+    assert NodeSelector.get_selected is not original
+
+    clear_selection_filters()
+    assert NodeSelector.get_selected is original
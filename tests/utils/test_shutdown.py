@@ -0,0 +1,51 @@
+import threading
+
+from pydbt.utils.http import BackgroundCalls
+from pydbt.utils.shutdown import Shutdown
+
+
+def test_sinks_are_flushed_concurrently():
+    # every flush waits for the others to start, so they only complete when run concurrently
+    barrier = threading.Barrier(3, timeout=5)
+    flushed = []
+    shutdown = Shutdown(deadline=10)
+    for name in ("sentry", "alerting", "monitor"):
+        shutdown.register(name, lambda name=name: (barrier.wait(), flushed.append(name)))
+
+    assert shutdown.run() == []
+    assert sorted(flushed) == ["alerting", "monitor", "sentry"]
+
+
+def test_deadline_drops_hung_sinks():
+    hung, flushed = threading.Event(), threading.Event()
+    shutdown = Shutdown(deadline=0.2)
+    shutdown.register("alerting", hung.wait, pending=lambda: 3)
+    shutdown.register("monitor", flushed.set)
+
+    assert shutdown.run() == ["alerting (3 pending)"]
+    # the hung flush was abandoned, the other one completed
+    assert flushed.is_set()
+    assert not hung.is_set()
+    hung.set()
+
+
+def test_flush_errors_are_contained():
+    def fail():
+        raise RuntimeError("connection refused")
+
+    shutdown = Shutdown(deadline=1)
+    shutdown.register("alerting", fail)
+    assert shutdown.run() == []
+
+
+def test_background_calls(monkeypatch):
+    calls = []
+    monkeypatch.setattr("pydbt.utils.http.make_external_call", lambda *args, **kwargs: calls.append(args))
+
+    background = BackgroundCalls("slack")
+    for _ in range(3):
+        background.submit("POST", "http://localhost/hook", json={})
+    background.join()
+
+    assert len(calls) == 3
+    assert background.pending == 0
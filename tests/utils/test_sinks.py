@@ -0,0 +1,97 @@
+import time
+import threading
+
+from pydbt.utils.profiler import Profiler
+from pydbt.utils.sinks import Sinks, AsyncSinks
+
+
+def test_sinks_deliver_in_calling_thread():
+    delivered = []
+    sinks = Sinks()
+    sinks.add("log", delivered.append)
+
+    sinks.submit("log", "message")
+    assert delivered == ["message"]
+    assert sinks.stats["log"].delivered == 1
+    assert sinks.close() == []
+
+
+def test_slow_sink_does_not_stall_others():
+    fast, slow = [], []
+    sinks = AsyncSinks()
+    sinks.add("log", fast.append)
+    sinks.add("alerting", lambda msg: (time.sleep(0.1), slow.append(msg)), concurrency=4)
+
+    start = time.monotonic()
+    for idx in range(8):
+        sinks.submit("log", idx)
+        sinks.submit("alerting", idx)
+    assert time.monotonic() - start < 0.1
+
+    assert sinks.close(timeout=5) == []
+    assert fast == list(range(8))
+    assert sorted(slow) == list(range(8))
+    # 8 messages over 4 workers take two rounds
+    assert time.monotonic() - start < 0.35
+
+
+def test_full_queue_applies_backpressure():
+    release = threading.Event()
+    sinks = AsyncSinks(queue_size=2)
+    sinks.add("monitor", lambda msg: release.wait())
+
+    submitted = threading.Event()
+
+    def produce():
+        for idx in range(4):
+            sinks.submit("monitor", idx)
+        submitted.set()
+
+    threading.Thread(target=produce, daemon=True).start()
+    assert not submitted.wait(0.2)
+
+    release.set()
+    assert submitted.wait(1)
+    assert sinks.close(timeout=1) == []
+    assert sinks.stats["monitor"].max_depth <= 2
+
+
+def test_close_reports_dropped_sinks():
+    hung = threading.Event()
+    sinks = AsyncSinks()
+    sinks.add("log", lambda msg: None)
+    sinks.add("alerting", lambda msg: hung.wait())
+    for idx in range(3):
+        sinks.submit("log", idx)
+        sinks.submit("alerting", idx)
+
+    start = time.monotonic()
+    assert sinks.close(timeout=0.2) == ["alerting (3 pending)"]
+    assert time.monotonic() - start < 1
+    hung.set()
+
+
+def test_delivery_errors_are_counted():
+    def fail(msg):
+        raise RuntimeError("connection refused")
+
+    sinks = AsyncSinks()
+    sinks.add("export", fail)
+    sinks.submit("export", "message")
+
+    assert sinks.close(timeout=1) == []
+    assert sinks.stats["export"].failed == 1
+    assert sinks.stats["export"].pending == 0
+
+
+def test_async_delivery_time_is_kept_per_sink():
+    profiler = Profiler()
+    sinks = AsyncSinks(profiler)
+    sinks.add("alerting", lambda msg: time.sleep(0.01), concurrency=4)
+    for idx in range(8):
+        sinks.submit("alerting", idx)
+
+    assert sinks.close(timeout=5) == []
+    assert sinks.stats["alerting"].busy >= 0.08
+    # workers overlap with the run, their time is not pydbt's overhead
+    assert "alerting" not in profiler.phases
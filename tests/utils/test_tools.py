@@ -65,3 +65,22 @@ def test_get_full_db_id():
 
     res = tools.get_full_db_id("db", "SCHEMA", "table", capitalize=False)
     assert res == "db.SCHEMA.table"
+
+
+def test_extend_cli_option():
+    res = tools.extend_cli_option(["run"], ("--exclude",), ["a", "b"])
+    assert res == ["run", "--exclude", "a", "b"]
+
+    res = tools.extend_cli_option(["run", "--exclude", "a", "--full-refresh"], ("--exclude",), ["b"])
+    assert res == ["run", "--exclude", "a", "b", "--full-refresh"]
+
+    res = tools.extend_cli_option(["run", "-s", "a"], ("-s", "--select"), ["b"])
+    assert res == ["run", "-s", "a", "b"]
+
+    res = tools.extend_cli_option(["run"], ("--exclude",), [])
+    assert res == ["run"]
+
+
+def test_omit_cli_options():
+    res = tools.omit_cli_options(["run", "-s", "a", "b", "--exclude=c", "--target", "prod"], ("-s", "--exclude"))
+    assert res == ["run", "--target", "prod"]